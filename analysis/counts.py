@@ -1,43 +1,72 @@
-from data_processing.data_frames import UniversalDataFrame
-from typing import List
+from typing import TYPE_CHECKING, List, Union
 from src.drugs import Drug
+from data_processing.group_masks import GroupMasks
+from data_processing.summary import CorpusSummary
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def show_nr_of_pathways(pathways_df: UniversalDataFrame):
+
+def show_nr_of_pathways(pathways_df: Union["pd.DataFrame", CorpusSummary]):
     """
     Displays the total number of pathways present in the provided DataFrame.
 
     Args:
-        pathways_df (UniversalDataFrame): A DataFrame containing pathway data.
+        pathways_df (Union[pd.DataFrame, CorpusSummary]): A DataFrame containing
+            pathway data, or a summary with the already counted pathways.
 
     Prints:
         The total number of pathways as a message to the console.
     """
-    count = len(pathways_df)
+    if isinstance(pathways_df, CorpusSummary):
+        count = pathways_df.nr_of_pathways
+    else:
+        count = len(pathways_df)
 
     p_count = f"Całkowita liczba szkalów wynosi {count}."
 
     print(p_count)
 
 
-def show_nr_of_approved_not_withdrawn_drugs(drugs: Drug):
+def show_nr_of_approved_not_withdrawn_drugs(drugs: Union[List[Drug], CorpusSummary]):
     """
     Displays the number of drugs that are approved but not withdrawn.
 
     Args:
-        drugs (List[Drug]): A list of Drug objects.
+        drugs (Union[List[Drug], CorpusSummary]): A list of Drug objects, or a summary
+            with the already counted drugs.
 
     Prints:
         The number of approved and not withdrawn drugs as a message to the console.
     """
-    approved_not_withdrawn_count = 0
-    for drug in drugs:
-        if "approved" in drug.groups:
-            if "withdrawn" not in drug.groups:
-                approved_not_withdrawn_count += 1
+    if isinstance(drugs, CorpusSummary):
+        approved_not_withdrawn_count = drugs.approved_not_withdrawn
+    else:
+        approved_not_withdrawn_count = GroupMasks.from_drugs(drugs).count(
+            all_of=["approved"], none_of=["withdrawn"]
+        )
 
     g_count = (
         f"Zatwierdzonych i nie wycofanych leków jest {approved_not_withdrawn_count}."
     )
 
     print(g_count)
+
+
+def show_summary(summary: CorpusSummary):
+    """
+    Displays the headline counts of a DrugBank file.
+
+    Args:
+        summary (CorpusSummary): Counts collected in one pass over the file.
+
+    Prints:
+        The numbers of drugs, drugs of every type, pathways, products, targets and
+        drug interactions as messages to the console.
+    """
+    print(f"Liczba leków wynosi {summary.nr_of_drugs}.")
+    for drug_type, count in sorted(summary.drugs_per_type.items()):
+        print(f"Leków typu {drug_type} jest {count}.")
+    print(f"Liczba produktów wynosi {summary.nr_of_products}.")
+    print(f"Liczba targetów wynosi {summary.nr_of_targets}.")
+    print(f"Liczba interakcji między lekami wynosi {summary.nr_of_interactions}.")
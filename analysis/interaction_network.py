@@ -0,0 +1,157 @@
+from typing import List
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+from src.interactions import Interaction
+
+
+class InteractionNetwork:
+    """
+    Undirected drug-drug interaction network stored as a sparse adjacency matrix
+    over factorised DrugBank IDs.
+    """
+
+    def __init__(self, drug_ids: np.ndarray, adjacency: sparse.csr_matrix):
+        self.drug_ids = drug_ids
+        self.adjacency = adjacency
+        self.positions = pd.Index(drug_ids)
+
+    @classmethod
+    def from_pairs(cls, sources, targets) -> "InteractionNetwork":
+        """
+        Builds the network from two equally long sequences of interacting DrugBank IDs.
+        Interactions are treated as undirected, duplicates and self-loops are dropped.
+
+        Args:
+            sources: DrugBank IDs of the first drug of each interaction.
+            targets: DrugBank IDs of the second drug of each interaction.
+
+        Returns:
+            InteractionNetwork: The network.
+        """
+        sources = np.asarray(sources, dtype=object)
+        targets = np.asarray(targets, dtype=object)
+        codes, drug_ids = pd.factorize(np.concatenate([sources, targets]))
+        rows, cols = codes[: len(sources)], codes[len(sources) :]
+
+        keep = rows != cols
+        rows, cols = rows[keep], cols[keep]
+        n = len(drug_ids)
+        adjacency = sparse.coo_matrix(
+            (
+                np.ones(2 * len(rows), dtype=np.int32),
+                (np.r_[rows, cols], np.r_[cols, rows]),
+            ),
+            shape=(n, n),
+        ).tocsr()
+        # Summing duplicates can give values above 1, the network is unweighted.
+        adjacency.data[:] = 1
+
+        return cls(np.asarray(drug_ids, dtype=object), adjacency)
+
+    @classmethod
+    def from_interactions(cls, interactions: List[Interaction]) -> "InteractionNetwork":
+        """
+        Builds the network from parsed Interaction objects.
+
+        Args:
+            interactions (List[Interaction]): Interactions from DataLoader.parse_interactions.
+
+        Returns:
+            InteractionNetwork: The network.
+        """
+        return cls.from_pairs(
+            [i.drug_id for i in interactions], [i.partner_id for i in interactions]
+        )
+
+    def degrees(self) -> pd.Series:
+        """Returns the number of interacting drugs of every drug."""
+        return pd.Series(
+            np.diff(self.adjacency.indptr), index=self.positions, name="Degree"
+        )
+
+    def degree_distribution(self) -> pd.DataFrame:
+        """
+        Counts how many drugs have each number of interactions.
+
+        Returns:
+            pd.DataFrame: Degree and the number of drugs with that degree.
+        """
+        counts = np.bincount(np.diff(self.adjacency.indptr))
+        degrees = np.flatnonzero(counts)
+        return pd.DataFrame({"Degree": degrees, "Nr_of_drugs": counts[degrees]})
+
+    def top_interacting(self, k: int = 10) -> pd.DataFrame:
+        """
+        Finds the drugs with the most interactions.
+
+        Args:
+            k (int, optional): Number of drugs to return.
+
+        Returns:
+            pd.DataFrame: DrugBank ID and degree of the k most interacting drugs.
+        """
+        degrees = np.diff(self.adjacency.indptr)
+        k = min(k, len(degrees))
+        if k == 0:
+            return pd.DataFrame({"DrugBank ID": [], "Degree": []})
+        best = np.argpartition(-degrees, k - 1)[:k]
+        best = best[np.argsort(-degrees[best], kind="stable")]
+        return pd.DataFrame(
+            {"DrugBank ID": self.drug_ids[best], "Degree": degrees[best]}
+        )
+
+    def connected_components(self) -> pd.DataFrame:
+        """
+        Labels every drug with its connected component.
+
+        Returns:
+            pd.DataFrame: DrugBank ID, component label and size of that component.
+        """
+        _, labels = connected_components(self.adjacency, directed=False)
+        sizes = np.bincount(labels)
+        return pd.DataFrame(
+            {
+                "DrugBank ID": self.drug_ids,
+                "Component": labels,
+                "Component size": sizes[labels],
+            }
+        )
+
+    def two_hop_neighbourhood(self, drug_ids: List[str]) -> pd.DataFrame:
+        """
+        Finds drugs reachable within two interactions from each of the given drugs.
+
+        Args:
+            drug_ids (List[str]): DrugBank IDs to query.
+
+        Returns:
+            pd.DataFrame: Query DrugBank ID, neighbour DrugBank ID and distance (1 or 2).
+        """
+        columns = self.positions.get_indexer(drug_ids)
+        if (columns < 0).any():
+            missing = [d for d, c in zip(drug_ids, columns) if c < 0]
+            raise ValueError(f"DrugBank IDs {missing} not found in the network.")
+
+        n, k = len(self.drug_ids), len(columns)
+        start = sparse.csr_matrix(
+            (np.ones(k, dtype=np.int32), (np.arange(k), columns)), shape=(k, n)
+        )
+        one_hop = (start @ self.adjacency).tocsr()
+        reach = (one_hop + one_hop @ self.adjacency).tocoo()
+
+        # The queried drug is reachable from itself in two hops, but is not its neighbour.
+        keep = reach.col != columns[reach.row]
+        rows, cols = reach.row[keep], reach.col[keep]
+        distances = np.where(np.asarray(one_hop[rows, cols]).ravel() > 0, 1, 2)
+
+        return pd.DataFrame(
+            {
+                "DrugBank ID": np.asarray(drug_ids, dtype=object)[rows],
+                "Neighbour DrugBank ID": self.drug_ids[cols],
+                "Distance": distances,
+            }
+        ).sort_values(
+            ["DrugBank ID", "Distance", "Neighbour DrugBank ID"], ignore_index=True
+        )
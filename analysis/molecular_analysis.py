@@ -1,62 +1,48 @@
 from src.targets import Target
-from typing import List
+from typing import List, Union
 import pandas as pd
 import numpy as np
-from collections import defaultdict
-from statistics import mean
-from scipy.stats import f_oneway
+from analysis.weight_statistics import WeightStatistics
 
 
-def compute_average_weights(targets: List[Target]) -> pd.DataFrame:
+def compute_average_weights(
+    targets: Union[List[Target], WeightStatistics],
+) -> pd.DataFrame:
     """
     Computes the average molecular weight and standard deviation for each cellular location
     based on the provided list of Target objects.
 
     Args:
-        targets (List[Target]): A list of Target objects that contain Polypeptide objects
-                                 with molecular weight and cellular location data.
+        targets (Union[List[Target], WeightStatistics]): A list of Target objects that contain
+                                 Polypeptide objects with molecular weight and cellular location
+                                 data, or statistics collected while parsing them.
 
     Returns:
         pd.DataFrame: A DataFrame containing the average molecular weight and standard deviation
                       for each cellular location.
     """
-    weight_dict = defaultdict(list)
+    if not isinstance(targets, WeightStatistics):
+        targets = WeightStatistics.from_targets(targets, reservoir_size=0)
 
-    for target in targets:
-        polypeptide = target.polypeptide
-        if polypeptide.cellular_location and polypeptide.molecular_weight:
-            try:
-                weight = float(polypeptide.molecular_weight)
-                weight_dict[polypeptide.cellular_location].append(weight)
-            except ValueError:
-                continue
-
-    avg_weights = {
-        location: {
-            "Average Molecular Weight": mean(weights),
-            "Standard Deviation": np.std(weights),
-        }
-        for location, weights in weight_dict.items()
-    }
-
-    df = pd.DataFrame.from_dict(avg_weights, orient="index").reset_index()
-    df.rename(columns={"index": "Cellular Location"}, inplace=True)
+    return targets.to_frame()
 
-    return df
 
-
-def get_weights(targets: List[Target]) -> pd.DataFrame:
+def get_weights(targets: Union[List[Target], WeightStatistics]) -> pd.DataFrame:
     """
     Extracts the molecular weight and cellular location for each target, returning
-    a DataFrame.
+    a DataFrame. For WeightStatistics the sampled weights are returned.
 
     Args:
-        targets (List[Target]): A list of Target objects containing Polypeptide objects
-                                 with molecular weight and cellular location data.
+        targets (Union[List[Target], WeightStatistics]): A list of Target objects containing
+                                 Polypeptide objects with molecular weight and cellular location
+                                 data, or statistics collected while parsing them.
 
     Returns:
         pd.DataFrame: A DataFrame with two columns: "Cellular Location" and "Molecular Weight".
     """
+    if isinstance(targets, WeightStatistics):
+        return targets.sample_frame()
+
     list = []
 
     for target in targets:
@@ -71,26 +57,57 @@ def get_weights(targets: List[Target]) -> pd.DataFrame:
     return pd.DataFrame(list, columns=["Cellular Location", "Molecular Weight"])
 
 
-def run_anova(targets: List[Target]):
+def weight_histograms(df: pd.DataFrame, bins: int = 60) -> tuple:
+    """
+    Counts molecular weights per cellular location in shared bins, in one
+    vectorised pass over all weights.
+
+    Args:
+        df (pd.DataFrame): DataFrame created by get_weights.
+        bins (int, optional): Number of weight bins.
+
+    Returns:
+        tuple: Cellular locations in order of appearance, the bins+1 bin edges and a
+               (locations x bins) array of counts.
+    """
+    codes, locations = pd.factorize(df["Cellular Location"])
+    weights = df["Molecular Weight"].to_numpy(dtype=float)
+
+    edges = np.histogram_bin_edges(weights, bins=bins)
+    bin_index = np.clip(np.searchsorted(edges, weights, side="right") - 1, 0, bins - 1)
+    counts = np.bincount(
+        codes * bins + bin_index, minlength=len(locations) * bins
+    ).reshape(len(locations), bins)
+
+    return np.asarray(locations), edges, counts
+
+
+def run_anova(targets: Union[List[Target], WeightStatistics]):
     """
     Runs an ANOVA test to determine if there are significant differences in molecular weights
     between different cellular locations based on the provided list of Target objects.
 
     Args:
-        targets (List[Target]): A list of Target objects containing Polypeptide objects
-                                 with molecular weight and cellular location data.
+        targets (Union[List[Target], WeightStatistics]): A list of Target objects containing
+                                 Polypeptide objects with molecular weight and cellular location
+                                 data, or statistics collected while parsing them.
 
     Prints:
         The F-statistic and p-value of the ANOVA test.
     """
-    df = get_weights(targets)
+    if isinstance(targets, WeightStatistics):
+        stat, p_value = targets.anova()
+    else:
+        from scipy.stats import f_oneway
+
+        df = get_weights(targets)
 
-    groups = [
-        df[df["Cellular Location"] == loc]["Molecular Weight"].values
-        for loc in df["Cellular Location"].unique()
-    ]
+        groups = [
+            df[df["Cellular Location"] == loc]["Molecular Weight"].values
+            for loc in df["Cellular Location"].unique()
+        ]
 
-    stat, p_value = f_oneway(*groups)
+        stat, p_value = f_oneway(*groups)
 
     print(f"ANOVA test: F-statistic = {stat:.3f}, p-value = {p_value:.3e}")
 
@@ -0,0 +1,66 @@
+from typing import List
+import numpy as np
+import pandas as pd
+
+
+def top_pathway_counts(df: pd.DataFrame, n: int) -> pd.DataFrame:
+    """
+    Selects the drugs interacting with the most pathways.
+
+    Args:
+        df (pd.DataFrame): DataFrame with DrugBank_ID and Nr_of_pathways columns.
+        n (int): Number of drugs to keep.
+
+    Returns:
+        pd.DataFrame: The n drugs with the most pathways, most first; ties are
+                      ordered by DrugBank ID.
+    """
+    return (
+        df.sort_values(["Nr_of_pathways", "DrugBank_ID"], ascending=[False, True])
+        .head(n)[["DrugBank_ID", "Nr_of_pathways"]]
+        .reset_index(drop=True)
+    )
+
+
+def pathway_count_distribution(df: pd.DataFrame, max_bins: int = 30) -> pd.DataFrame:
+    """
+    Counts drugs by their number of pathways. Pathway numbers are grouped into
+    equally wide ranges if they span more than max_bins values.
+
+    Args:
+        df (pd.DataFrame): DataFrame with DrugBank_ID and Nr_of_pathways columns.
+        max_bins (int, optional): Largest number of bins.
+
+    Returns:
+        pd.DataFrame: "Nr_of_pathways" bin labels, e.g. "3" or "10-14", and
+                      "Nr_of_drugs" in each bin, including empty bins.
+    """
+    counts = df["Nr_of_pathways"].to_numpy(dtype=int)
+    low, high = counts.min(), counts.max()
+    width = max(1, -(-(high - low + 1) // max_bins))
+    starts = np.arange(low, high + 1, width)
+
+    nr_of_drugs = np.bincount((counts - low) // width, minlength=len(starts))
+    labels = [
+        str(start) if width == 1 else f"{start}-{start + width - 1}" for start in starts
+    ]
+    return pd.DataFrame({"Nr_of_pathways": labels, "Nr_of_drugs": nr_of_drugs})
+
+
+def paginate(df: pd.DataFrame, page_size: int) -> List[pd.DataFrame]:
+    """
+    Splits a DataFrame into pages of page_size rows.
+
+    Args:
+        df (pd.DataFrame): DataFrame to split.
+        page_size (int): Number of rows on every page but the last.
+
+    Returns:
+        List[pd.DataFrame]: The pages, in order.
+    """
+    if page_size < 1:
+        raise ValueError("Page size must be positive.")
+    return [
+        df.iloc[start : start + page_size].reset_index(drop=True)
+        for start in range(0, len(df), page_size)
+    ]
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+from analysis.sparse_utils import incidence_matrix, top_k_per_row
+
+
+class PathwaySimilarity:
+    """
+    Drug x pathway sparse incidence matrix and its projection onto drugs, giving
+    the number of shared pathways and the Jaccard similarity of drug pairs.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Args:
+            df (pd.DataFrame): DataFrame with "Pathway_ID" and "Drugs" columns, as
+                               created by create_pathway_interactions_data_frame.
+        """
+        pairs = df[["Drugs", "Pathway_ID"]].dropna()
+        pairs = pairs[pairs["Drugs"] != "None"]
+        self.drug_ids, self.pathway_ids, self.incidence = incidence_matrix(
+            pairs["Drugs"], pairs["Pathway_ID"]
+        )
+        self.positions = pd.Index(self.drug_ids)
+        self.nr_of_pathways = np.asarray(self.incidence.sum(axis=1)).ravel()
+
+    def neighbours(self, drug_id: str, k: int = 10) -> pd.DataFrame:
+        """
+        Finds drugs sharing the most pathways with the given drug.
+
+        Args:
+            drug_id (str): DrugBank ID of the query drug.
+            k (int, optional): Maximum number of neighbours.
+
+        Returns:
+            pd.DataFrame: Neighbours with shared pathway counts and Jaccard similarity.
+        """
+        position = self.positions.get_loc(drug_id)
+        return self._top_k(position, position + 1, k)
+
+    def top_k_neighbours(self, k: int = 10, block_size: int = 2000) -> pd.DataFrame:
+        """
+        Finds the k most similar drugs of every drug. Rows are projected in blocks,
+        so at most block_size rows of the drug x drug matrix exist at once.
+
+        Args:
+            k (int, optional): Number of neighbours per drug.
+            block_size (int, optional): Number of drugs projected at once.
+
+        Returns:
+            pd.DataFrame: DrugBank ID, neighbour DrugBank ID, number of shared
+                          pathways and Jaccard similarity, best neighbours first.
+        """
+        blocks = [
+            self._top_k(start, min(start + block_size, len(self.drug_ids)), k)
+            for start in range(0, len(self.drug_ids), block_size)
+        ]
+        if not blocks:
+            return self._frame(np.array([], dtype=int), np.array([], dtype=int), [], [])
+        return pd.concat(blocks, ignore_index=True)
+
+    def _top_k(self, start: int, stop: int, k: int) -> pd.DataFrame:
+        block = self.incidence[start:stop]
+        shared = (block @ self.incidence.T).tocoo()
+
+        rows = shared.row + start
+        keep = shared.col != rows
+        rows, cols, counts = rows[keep], shared.col[keep], shared.data[keep]
+
+        jaccard = counts / (
+            self.nr_of_pathways[rows] + self.nr_of_pathways[cols] - counts
+        )
+        best = top_k_per_row(rows, jaccard, k, cols)
+        return self._frame(rows[best], cols[best], counts[best], jaccard[best])
+
+    def _frame(self, rows, cols, counts, jaccard) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "DrugBank ID": self.drug_ids[rows],
+                "Neighbour DrugBank ID": self.drug_ids[cols],
+                "Shared pathways": np.asarray(counts, dtype=int),
+                "Jaccard": np.asarray(jaccard, dtype=float),
+            }
+        )
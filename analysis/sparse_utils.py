@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+def incidence_matrix(row_labels, column_labels) -> tuple:
+    """
+    Builds a binary sparse incidence matrix from pairs of labels. Repeated pairs
+    are stored once.
+
+    Args:
+        row_labels: Row label of every pair, e.g. DrugBank IDs.
+        column_labels: Column label of every pair, e.g. SMPDB IDs.
+
+    Returns:
+        tuple: Unique row labels, unique column labels (both in order of first
+               appearance) and the CSR matrix with a 1 for every pair.
+    """
+    rows, row_ids = pd.factorize(np.asarray(row_labels, dtype=object))
+    cols, column_ids = pd.factorize(np.asarray(column_labels, dtype=object))
+    matrix = sparse.coo_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(len(row_ids), len(column_ids)),
+    ).tocsr()
+    matrix.data[:] = 1
+    return (
+        np.asarray(row_ids, dtype=object),
+        np.asarray(column_ids, dtype=object),
+        matrix,
+    )
+
+
+def top_k_per_row(
+    rows: np.ndarray, scores: np.ndarray, k: int, tie_breaker: np.ndarray
+) -> np.ndarray:
+    """
+    Selects the k best scored entries of every row of a sparse result.
+
+    Args:
+        rows (np.ndarray): Row index of every entry.
+        scores (np.ndarray): Score of every entry, higher is better.
+        k (int): Number of entries kept per row.
+        tie_breaker (np.ndarray): Secondary sort key for equal scores, lower first.
+
+    Returns:
+        np.ndarray: Indices of the kept entries, ordered by row and descending score.
+    """
+    order = np.lexsort((tie_breaker, -scores, rows))
+    sorted_rows = rows[order]
+    starts = np.flatnonzero(np.r_[True, sorted_rows[1:] != sorted_rows[:-1]])
+    counts = np.diff(np.r_[starts, len(sorted_rows)])
+    rank = np.arange(len(sorted_rows)) - np.repeat(starts, counts)
+    return order[rank < k]
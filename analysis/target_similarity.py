@@ -0,0 +1,112 @@
+from typing import List
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from analysis.sparse_utils import incidence_matrix, top_k_per_row
+from src.targets import Target
+
+
+class TargetSimilarity:
+    """
+    Drug x polypeptide sparse incidence matrix, built once from parsed targets,
+    with shared-target and co-occurrence products derived from it.
+    """
+
+    def __init__(self, targets: List[Target]):
+        """
+        Args:
+            targets (List[Target]): Targets from DataLoader.parse_targets.
+        """
+        self.drug_ids, self.polypeptide_ids, self.incidence = incidence_matrix(
+            [target.drug_id for target in targets],
+            [target.polypeptide.id for target in targets],
+        )
+        self.positions = pd.Index(self.drug_ids)
+        self.nr_of_targets = np.asarray(self.incidence.sum(axis=1)).ravel()
+
+        gene_names = {
+            target.polypeptide.id: target.polypeptide.gene_name for target in targets
+        }
+        self.gene_names = np.asarray(
+            [gene_names[p] for p in self.polypeptide_ids], dtype=object
+        )
+
+    def shared_target_drugs(self, drug_id: str, k: int = None) -> pd.DataFrame:
+        """
+        Finds drugs sharing at least one target with the given drug.
+
+        Args:
+            drug_id (str): DrugBank ID of the query drug.
+            k (int, optional): Maximum number of drugs to return. All if None.
+
+        Returns:
+            pd.DataFrame: Drugs with the number of shared targets and Jaccard
+                          similarity, most similar first.
+        """
+        position = self.positions.get_loc(drug_id)
+        shared = (self.incidence[position] @ self.incidence.T).tocoo()
+
+        keep = shared.col != position
+        cols, counts = shared.col[keep], shared.data[keep]
+        jaccard = counts / (
+            self.nr_of_targets[position] + self.nr_of_targets[cols] - counts
+        )
+        best = top_k_per_row(
+            np.zeros(len(cols), dtype=int), jaccard, len(cols) if k is None else k, cols
+        )
+
+        return pd.DataFrame(
+            {
+                "DrugBank ID": self.drug_ids[cols[best]],
+                "Shared targets": counts[best],
+                "Jaccard": jaccard[best],
+            }
+        )
+
+    def target_cooccurrence(self) -> pd.DataFrame:
+        """
+        Counts, for every pair of polypeptides, the drugs targeting both of them.
+
+        Returns:
+            pd.DataFrame: Pairs of polypeptide IDs with their gene names and the
+                          number of drugs targeting both, most frequent first.
+        """
+        cooccurrence = sparse.triu(self.incidence.T @ self.incidence, k=1).tocoo()
+        df = pd.DataFrame(
+            {
+                "Polypeptide ID A": self.polypeptide_ids[cooccurrence.row],
+                "Gene name A": self.gene_names[cooccurrence.row],
+                "Polypeptide ID B": self.polypeptide_ids[cooccurrence.col],
+                "Gene name B": self.gene_names[cooccurrence.col],
+                "Nr_of_drugs": cooccurrence.data,
+            }
+        )
+        return df.sort_values(
+            ["Nr_of_drugs", "Polypeptide ID A", "Polypeptide ID B"],
+            ascending=[False, True, True],
+            ignore_index=True,
+        )
+
+    def drugs_per_gene(self) -> pd.DataFrame:
+        """
+        Counts the distinct drugs targeting each gene. A drug targeting several
+        polypeptides of the same gene is counted once.
+
+        Returns:
+            pd.DataFrame: Gene name and number of drugs, most targeted first.
+        """
+        gene_codes, genes = pd.factorize(self.gene_names, use_na_sentinel=False)
+        polypeptide_to_gene = sparse.csr_matrix(
+            (
+                np.ones(len(gene_codes), dtype=np.int32),
+                (np.arange(len(gene_codes)), gene_codes),
+            ),
+            shape=(len(gene_codes), len(genes)),
+        )
+        drug_gene = self.incidence @ polypeptide_to_gene
+        counts = np.diff(drug_gene.tocsc().indptr)
+
+        df = pd.DataFrame({"Gene name": genes, "Nr_of_drugs": counts})
+        return df.sort_values(
+            ["Nr_of_drugs", "Gene name"], ascending=[False, True], ignore_index=True
+        )
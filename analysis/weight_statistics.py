@@ -0,0 +1,140 @@
+import math
+import random
+from typing import Iterable
+import pandas as pd
+from src.targets import Polypeptide, Target
+
+
+class WeightStatistics:
+    """
+    Running molecular weight statistics per cellular location: count, mean and
+    variance with Welford's algorithm, and a fixed-size reservoir sample of the
+    weights. Targets are added one at a time, e.g. while they are streamed.
+    """
+
+    def __init__(self, reservoir_size: int = 1000, seed: int = 0):
+        """
+        Args:
+            reservoir_size (int, optional): Largest number of weights sampled per location.
+            seed (int, optional): Seed of the reservoir sampling.
+        """
+        self.reservoir_size = reservoir_size
+        self.random = random.Random(seed)
+        # Location mapped to [count, mean, sum of squared deviations].
+        self.moments = {}
+        self.samples = {}
+
+    @classmethod
+    def from_targets(cls, targets: Iterable[Target], **kwargs) -> "WeightStatistics":
+        """
+        Builds the statistics from targets, without keeping them.
+
+        Args:
+            targets (Iterable[Target]): Targets, e.g. from DataLoader.iter_targets.
+            **kwargs: Arguments of WeightStatistics.
+
+        Returns:
+            WeightStatistics: The statistics.
+        """
+        statistics = cls(**kwargs)
+        for target in targets:
+            statistics.add_target(target)
+        return statistics
+
+    def add_target(self, target: Target):
+        """
+        Adds the weight of a target's polypeptide. Targets streamed by
+        DataLoader.iter_targets are added with WeightStatistics.from_targets.
+        """
+        self.add_polypeptide(target.polypeptide)
+
+    def add_polypeptide(self, polypeptide: Polypeptide):
+        """Adds the weight of a polypeptide with a cellular location and a numeric weight."""
+        if polypeptide.cellular_location and polypeptide.molecular_weight:
+            try:
+                weight = float(polypeptide.molecular_weight)
+            except ValueError:
+                return
+            self.add(polypeptide.cellular_location, weight)
+
+    def add(self, location: str, weight: float):
+        """
+        Adds one weight.
+
+        Args:
+            location (str): Cellular location.
+            weight (float): Molecular weight.
+        """
+        moments = self.moments.setdefault(location, [0, 0.0, 0.0])
+        moments[0] += 1
+        delta = weight - moments[1]
+        moments[1] += delta / moments[0]
+        moments[2] += delta * (weight - moments[1])
+
+        # Reservoir sampling keeps each weight seen so far with equal probability.
+        sample = self.samples.setdefault(location, [])
+        if len(sample) < self.reservoir_size:
+            sample.append(weight)
+        else:
+            position = self.random.randrange(moments[0])
+            if position < self.reservoir_size:
+                sample[position] = weight
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Returns the statistics in the format of compute_average_weights.
+
+        Returns:
+            pd.DataFrame: Cellular location, average molecular weight and population
+                          standard deviation.
+        """
+        return pd.DataFrame(
+            {
+                "Cellular Location": list(self.moments),
+                "Average Molecular Weight": [m[1] for m in self.moments.values()],
+                "Standard Deviation": [
+                    math.sqrt(m[2] / m[0]) for m in self.moments.values()
+                ],
+            }
+        )
+
+    def sample_frame(self) -> pd.DataFrame:
+        """
+        Returns the sampled weights in the format of get_weights.
+
+        Returns:
+            pd.DataFrame: "Cellular Location" and "Molecular Weight" of the sample.
+        """
+        rows = [
+            (location, weight)
+            for location, sample in self.samples.items()
+            for weight in sample
+        ]
+        return pd.DataFrame(rows, columns=["Cellular Location", "Molecular Weight"])
+
+    def anova(self) -> tuple:
+        """
+        Computes the one-way ANOVA of weights between locations from the running
+        counts, means and squared deviations, with the same result as
+        scipy.stats.f_oneway on all weights.
+
+        Returns:
+            tuple: F-statistic and p-value. Both are nan for fewer than two locations
+                   or no more weights than locations, and the statistic is inf when
+                   every location holds a single repeated weight, as in f_oneway.
+        """
+        from scipy.stats import f
+
+        counts = [m[0] for m in self.moments.values()]
+        total = sum(counts)
+        groups = len(counts)
+        if groups < 2 or total <= groups:
+            return math.nan, math.nan
+        grand_mean = sum(m[0] * m[1] for m in self.moments.values()) / total
+
+        between = sum(m[0] * (m[1] - grand_mean) ** 2 for m in self.moments.values())
+        within = sum(m[2] for m in self.moments.values())
+        if within == 0:
+            return (math.inf, 0.0) if between > 0 else (math.nan, math.nan)
+        statistic = (between / (groups - 1)) / (within / (total - groups))
+        return statistic, f.sf(statistic, groups - 1, total - groups)
@@ -0,0 +1,140 @@
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from data_processing.data_frames import UniversalDataFrame
+from data_processing.data_loader import DRUG_FIELDS
+from analysis.molecular_analysis import compute_average_weights
+from main import save_data_frames
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description="Builds and saves the DataFrames for many DrugBank XML files."
+    )
+    parser.add_argument("--paths", type=str, nargs="+", required=True)
+    parser.add_argument("--output_dir", type=str, default="results/batch")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+    return args
+
+
+def process_file(file_path: str, output_dir: str) -> dict:
+    """
+    Parses one XML file, builds its DataFrames and saves them as JSON files.
+    Runs in a worker process.
+
+    Args:
+        file_path (str): Path to the DrugBank XML file.
+        output_dir (str): Directory for the JSON files of this XML file.
+
+    Returns:
+        dict: Number of rows of each saved DataFrame.
+    """
+    df_builder = UniversalDataFrame(file_path)
+    # All drug fields are used below, so they are parsed once up front instead of
+    # builder by builder.
+    df_builder.get_drugs(DRUG_FIELDS)
+    df_pathways_interactions = df_builder.create_pathway_interactions_data_frame()
+
+    data_frames = {
+        "df_drugs": df_builder.create_drugs_basic_informations_df(),
+        "df_synonyms": df_builder.create_synonyms_data_frame(),
+        "df_products": df_builder.create_products_data_frame(),
+        "df_pathways": df_builder.create_pathways_data_frame(),
+        "df_pathways_interactions": df_pathways_interactions,
+        "df_nr_pathways": df_builder.create_nr_of_pathways_data_frame(),
+        "df_all_pathways_nr": df_builder.create_all_pathways_nr_data_frame(
+            df_pathways_interactions
+        ),
+        "protein_df": df_builder.create_targets_interactions_dataframe(),
+        "df_groups_number": df_builder.create_groups_data_frame(),
+        "df_drug_interactions": df_builder.create_drug_interactions_data_frame(),
+        "df_molecular_weight": compute_average_weights(df_builder.targets),
+    }
+
+    os.makedirs(output_dir, exist_ok=True)
+    save_data_frames(data_frames, output_dir)
+
+    return {name: len(df) for name, df in data_frames.items()}
+
+
+def output_dirs(file_paths: list, output_dir: str) -> list:
+    """Names one output directory per XML file after the file, avoiding collisions."""
+    dirs = []
+    used = set()
+    for file_path in file_paths:
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        name = stem
+        number = 1
+        while name in used:
+            number += 1
+            name = f"{stem}_{number}"
+        used.add(name)
+        dirs.append(os.path.join(output_dir, name))
+    return dirs
+
+
+async def run_batch(file_paths: list, output_dir: str, workers: int) -> list:
+    """
+    Processes many XML files concurrently on a bounded pool of worker processes,
+    reporting progress as each file finishes.
+
+    Args:
+        file_paths (list): Paths to the DrugBank XML files.
+        output_dir (str): Directory for all results and the combined index.
+        workers (int): Maximum number of worker processes.
+
+    Returns:
+        list: One result entry per file, in the order of file_paths.
+    """
+    loop = asyncio.get_running_loop()
+    dirs = output_dirs(file_paths, output_dir)
+    results = [None] * len(file_paths)
+    done = 0
+
+    async def run_one(position: int, pool: ProcessPoolExecutor):
+        nonlocal done
+        file_path = file_paths[position]
+        start = time.perf_counter()
+        entry = {"path": file_path, "output_dir": dirs[position]}
+        try:
+            entry["rows"] = await loop.run_in_executor(
+                pool, process_file, file_path, dirs[position]
+            )
+            entry["status"] = "ok"
+        except Exception as e:
+            entry["status"] = "error"
+            entry["error"] = f"{type(e).__name__}: {e}"
+        entry["seconds"] = round(time.perf_counter() - start, 3)
+        results[position] = entry
+
+        done += 1
+        print(
+            f"[{done}/{len(file_paths)}] {file_path}: {entry['status']} "
+            f"in {entry['seconds']:.1f} s"
+        )
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        await asyncio.gather(*(run_one(i, pool) for i in range(len(file_paths))))
+
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "index.json"), "w") as file:
+        json.dump(results, file, indent=4)
+
+    return results
+
+
+def main():
+    args = parse_arguments()
+    results = asyncio.run(run_batch(args.paths, args.output_dir, args.workers))
+    failed = [entry["path"] for entry in results if entry["status"] != "ok"]
+    if failed:
+        print(f"Failed files: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
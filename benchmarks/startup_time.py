@@ -0,0 +1,70 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import os
+
+HEAVY_MODULES = ["matplotlib", "seaborn", "networkx", "scipy"]
+
+MODULES = [
+    "main",
+    "data_processing.data_frames",
+    "analysis.counts",
+    "analysis.molecular_analysis",
+    "visualisations.charts",
+    "visualisations.graphs",
+    "visualisations.gene_graph",
+]
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [m for m in {heavy!r} if m in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def measure_import(module: str, repeats: int) -> tuple:
+    """
+    Measures the time of importing a module in fresh interpreter processes.
+
+    Args:
+        module (str): Dotted name of the module to import.
+        repeats (int): Number of interpreter processes to start.
+
+    Returns:
+        tuple: Median import time in seconds and the heavy modules it loaded.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times = []
+    loaded = ""
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        times.append(float(output[0]))
+        loaded = output[1] if len(output) > 1 else ""
+    return statistics.median(times), loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measures cold import time of the project modules."
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'Module':<32}{'Median [ms]':>12}  Heavy modules loaded")
+    for module in MODULES:
+        elapsed, loaded = measure_import(module, args.repeats)
+        print(f"{module:<32}{elapsed * 1000:>12.1f}  {loaded or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+from typing import TYPE_CHECKING, Dict, List
+from data_processing.field_spec import FIELD_SPEC, spec_columns
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def import_pyarrow():
+    """
+    Imports pyarrow on first use. It is optional and only needed for Arrow tables,
+    so it is neither imported at startup nor listed in requirements.txt.
+    """
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(
+            "Arrow tables need the pyarrow package: pip install pyarrow"
+        ) from error
+    return pyarrow
+
+
+def arrow_schema(entity: str, columns: List[str] = None) -> "pa.Schema":
+    """
+    Builds the Arrow schema of an entity from FIELD_SPEC. Text fields are strings
+    and "list" fields, e.g. synonyms or pathway drugs, are lists of strings.
+
+    Args:
+        entity (str): Entity name, e.g. "drug".
+        columns (List[str], optional): Columns to include. All if None.
+
+    Returns:
+        pa.Schema: The schema.
+    """
+    pa = import_pyarrow()
+    _, fields = FIELD_SPEC[entity]
+    list_columns = {field[0] for field in fields if field[2:] == ("list",)}
+    columns = columns or spec_columns(entity)
+    return pa.schema(
+        [
+            (
+                column,
+                pa.list_(pa.string()) if column in list_columns else pa.string(),
+            )
+            for column in columns
+        ]
+    )
+
+
+def to_arrow_tables(columns: Dict[str, dict]) -> Dict[str, "pa.Table"]:
+    """
+    Converts columns returned by FieldExtractor.extract_columns into Arrow tables,
+    without building pandas object columns first. The extractor should be created
+    with placeholder=(), so empty list fields become empty lists.
+
+    Args:
+        columns (Dict[str, dict]): Entity mapped to its columns of values.
+
+    Returns:
+        Dict[str, pa.Table]: Entity mapped to its Arrow table.
+    """
+    pa = import_pyarrow()
+    return {
+        entity: pa.table(values, schema=arrow_schema(entity, list(values)))
+        for entity, values in columns.items()
+    }
@@ -0,0 +1,220 @@
+import argparse
+import os
+from typing import Callable, Dict, Iterable, Iterator, List
+import pandas as pd
+from data_processing.data_loader import DataLoader, NAMESPACE
+from data_processing.field_spec import FieldExtractor
+from data_processing.product_table import PRODUCT_COLUMNS
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+class ChunkedDataFrame:
+    """
+    Streams the XML file and yields the products, targets, drug interactions and
+    pathway interactions DataFrames of UniversalDataFrame in fixed-size chunks, so
+    only one chunk and one drug are kept in memory at a time.
+    """
+
+    def __init__(self, xml_file: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            xml_file (str): Path to the DrugBank XML file.
+            chunk_size (int, optional): Number of rows in every chunk but the last.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive.")
+        self.data_loader = DataLoader(xml_file)
+        self.chunk_size = chunk_size
+
+    def iter_products_data_frame(self) -> Iterator[pd.DataFrame]:
+        """Yields chunks of the create_products_data_frame DataFrame."""
+
+        def build(columns: dict) -> pd.DataFrame:
+            df = pd.DataFrame(columns["product"], columns=PRODUCT_COLUMNS)
+            # Chunks are built from whole drugs, so duplicates are dropped per drug
+            # as in ProductTable.
+            return df.drop_duplicates()
+
+        return self._iter_chunks({"product": PRODUCT_COLUMNS}, "product", build)
+
+    def iter_targets_interactions_dataframe(self) -> Iterator[pd.DataFrame]:
+        """Yields chunks of the create_targets_interactions_dataframe DataFrame."""
+        target_columns = [
+            "Target ID",
+            "Source",
+            "External ID",
+            "Polypeptide name",
+            "Gene name",
+            "GenAtlas ID",
+            "Chromosome number",
+            "Cellular location",
+        ]
+
+        def build(columns: dict) -> pd.DataFrame:
+            df = pd.DataFrame(columns["target"])
+            return df.rename(columns={"Target ID": "DrugBank ID"})
+
+        return self._iter_chunks({"target": target_columns}, "target", build)
+
+    def iter_drug_interactions_data_frame(self) -> Iterator[pd.DataFrame]:
+        """Yields chunks of the create_drug_interactions_data_frame DataFrame."""
+
+        def build(columns: dict) -> pd.DataFrame:
+            drugs = columns["drug"]
+            names = dict(zip(drugs["DrugBank ID"], drugs["Name"]))
+            interactions = columns["interaction"]
+            return pd.DataFrame(
+                {
+                    "DrugBank ID": interactions["DrugBank ID"],
+                    "Drug Name": [names[i] for i in interactions["DrugBank ID"]],
+                    "Target Name": interactions["Partner Name"],
+                    "Interaction Description": interactions["Interaction Description"],
+                }
+            )
+
+        return self._iter_chunks(
+            {
+                "drug": ["DrugBank ID", "Name"],
+                "interaction": [
+                    "DrugBank ID",
+                    "Partner Name",
+                    "Interaction Description",
+                ],
+            },
+            "interaction",
+            build,
+        )
+
+    def iter_pathway_interactions_data_frame(self) -> Iterator[pd.DataFrame]:
+        """Yields chunks of the create_pathway_interactions_data_frame DataFrame."""
+
+        def build(columns: dict) -> pd.DataFrame:
+            df = pd.DataFrame(columns["pathway"]).rename(
+                columns={"Pathway ID": "Pathway_ID", "Pathway name": "Name"}
+            )
+            return df.explode("Drugs")
+
+        return self._iter_chunks(
+            {"pathway": ["Pathway ID", "Pathway name", "Drugs"]}, "pathway", build
+        )
+
+    def _iter_chunks(
+        self,
+        columns: Dict[str, List[str]],
+        entity: str,
+        build: Callable[[dict], pd.DataFrame],
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Extracts the columns drug by drug and yields chunks of chunk_size rows of the
+        DataFrames made by build. Rows are only built once chunk_size rows of the
+        given entity have been read.
+        """
+        extractor = FieldExtractor(columns, {"db": NAMESPACE})
+        pending = None
+        output = None
+
+        for drug, _ in self.data_loader.iter_drug_elements():
+            output = extractor.extract_columns([drug], output)
+            if len(next(iter(output[entity].values()))) >= self.chunk_size:
+                pending = yield from self._split(pending, build(output))
+                output = None
+
+        if output is not None:
+            pending = yield from self._split(pending, build(output))
+        if pending is not None and len(pending):
+            yield pending.reset_index(drop=True)
+
+    def _split(self, pending: pd.DataFrame, df: pd.DataFrame) -> pd.DataFrame:
+        """Yields full chunks of the pending rows followed by df, returns the rest."""
+        if pending is not None and len(pending):
+            df = pd.concat([pending, df], ignore_index=True)
+        start = 0
+        while len(df) - start >= self.chunk_size:
+            yield df.iloc[start : start + self.chunk_size].reset_index(drop=True)
+            start += self.chunk_size
+        return df.iloc[start:]
+
+
+def export_chunks(chunks: Iterable[pd.DataFrame], path: str) -> int:
+    """
+    Writes DataFrame chunks to a JSON Lines file, one record per row, without
+    joining them first.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): Chunks to write.
+        path (str): Path of the file to write.
+
+    Returns:
+        int: Number of rows written.
+    """
+    rows = 0
+    with open(path, "w") as file:
+        for chunk in chunks:
+            if len(chunk):
+                file.write(chunk.to_json(orient="records", lines=True))
+            rows += len(chunk)
+    return rows
+
+
+def aggregate_counts(chunks: Iterable[pd.DataFrame], by: List[str]) -> pd.DataFrame:
+    """
+    Counts rows grouped by the given columns, one chunk at a time.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): Chunks to count.
+        by (List[str]): Columns to group by, e.g. ["Country"].
+
+    Returns:
+        pd.DataFrame: The grouping columns and the "Count" column, most frequent
+                      first.
+    """
+    total = None
+    for chunk in chunks:
+        counts = chunk.groupby(by).size()
+        total = counts if total is None else total.add(counts, fill_value=0)
+
+    if total is None:
+        return pd.DataFrame(columns=by + ["Count"])
+    df = total.astype(int).rename("Count").reset_index()
+    return df.sort_values(
+        ["Count"] + by, ascending=[False] + [True] * len(by), ignore_index=True
+    )
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description="Exports large DataFrames in chunks, as JSON Lines files."
+    )
+    parser.add_argument("--path", type=str, required=True)
+    parser.add_argument("--output_dir", type=str, default="results")
+    parser.add_argument("--chunk_size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+    return args
+
+
+def main():
+    args = parse_arguments()
+    builder = ChunkedDataFrame(args.path, args.chunk_size)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    exports = {
+        "df_products": builder.iter_products_data_frame,
+        "protein_df": builder.iter_targets_interactions_dataframe,
+        "df_drug_interactions": builder.iter_drug_interactions_data_frame,
+        "df_pathways_interactions": builder.iter_pathway_interactions_data_frame,
+    }
+    for name, chunks in exports.items():
+        rows = export_chunks(chunks(), os.path.join(args.output_dir, f"{name}.jsonl"))
+        print(f"{name}: {rows}")
+
+    df_all_pathways_nr = aggregate_counts(
+        builder.iter_pathway_interactions_data_frame(), ["Drugs"]
+    ).rename(columns={"Drugs": "DrugBank_ID", "Count": "Nr_of_pathways"})
+    df_all_pathways_nr.to_json(
+        os.path.join(args.output_dir, "df_all_pathways_nr.json"), indent=4
+    )
+
+
+if __name__ == "__main__":
+    main()
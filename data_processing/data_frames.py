@@ -1,14 +1,78 @@
 import pandas as pd
-from data_processing.data_loader import DataLoader
+from data_processing.data_loader import DRUG_FIELDS, DataLoader
+from data_processing.drug_filter import DrugFilter
+from data_processing.product_table import ProductTable
+from data_processing.product_cube import ProductCube, cube_path
+from data_processing.group_masks import GroupMasks
+from data_processing.summary import CorpusSummary
 
 
 class UniversalDataFrame:
 
-    def __init__(self, xml_file: str):
-        self.data_loader = DataLoader(xml_file)
-        self.targets = self.data_loader.parse_targets()
-        self.drugs = self.data_loader.parse_drugs()
-        self.pathways = self.data_loader.parse_pathways()
+    def __init__(self, xml_file: str, drug_filter: DrugFilter = None):
+        """
+        Args:
+            xml_file (str): Path to the DrugBank XML file.
+            drug_filter (DrugFilter, optional): If given, only matching drugs are
+                parsed and the summary and product cube are not cached on disk.
+        """
+        self._init_state(xml_file, drug_filter, DataLoader(xml_file, drug_filter))
+
+    def _init_state(
+        self, xml_file: str, drug_filter: DrugFilter, data_loader: DataLoader
+    ):
+        """
+        Sets the state of the builders, nothing parsed or built yet. Subclasses
+        without an XML file to parse call it with a None loader.
+        """
+        self.xml_file = xml_file
+        self.drug_filter = drug_filter
+        self.data_loader = data_loader
+        # Entities are parsed on first use; drugs only with the fields requested so far.
+        self._targets = None
+        self._pathways = None
+        self._drugs = None
+        self.drug_fields = frozenset()
+        self.products_table = None
+        self.arrow_tables = None
+        self.summary = None
+        self.group_masks = None
+
+    @property
+    def targets(self) -> list:
+        """Targets of all drugs, parsed on first use."""
+        if self._targets is None:
+            self._targets = self.data_loader.parse_targets()
+        return self._targets
+
+    @property
+    def pathways(self) -> list:
+        """Pathways of all drugs, parsed on first use."""
+        if self._pathways is None:
+            self._pathways = self.data_loader.parse_pathways()
+        return self._pathways
+
+    @property
+    def drugs(self) -> list:
+        """Drugs with all fields, parsed on first use."""
+        return self.get_drugs(DRUG_FIELDS)
+
+    def get_drugs(self, fields) -> list:
+        """
+        Returns the drugs with at least the given fields. The file is parsed again
+        only if a field was not parsed before, together with the earlier fields.
+
+        Args:
+            fields (Iterable[str]): Drug fields, from data_loader.DRUG_FIELDS.
+
+        Returns:
+            list: Drug objects.
+        """
+        fields = frozenset(fields)
+        if self._drugs is None or not fields <= self.drug_fields:
+            self.drug_fields |= fields
+            self._drugs = self.data_loader.parse_drugs(fields=self.drug_fields)
+        return self._drugs
 
     def create_targets_interactions_dataframe(self) -> pd.DataFrame:
         """Creates a DataFrame with targets interaction information."""
@@ -39,7 +103,17 @@ class UniversalDataFrame:
     def create_drugs_basic_informations_df(self) -> pd.DataFrame:
         """Creates a DataFrame with drugs basic information."""
 
-        drug_dicts = [drug.to_dict() for drug in self.drugs]
+        drugs = self.get_drugs(
+            [
+                "name",
+                "description",
+                "state",
+                "indication",
+                "mechanism_of_action",
+                "food_interactions",
+            ]
+        )
+        drug_dicts = [drug.to_dict() for drug in drugs]
         selected_columns = [
             "DrugBank ID",
             "Name",
@@ -55,8 +129,14 @@ class UniversalDataFrame:
 
         return df
 
-    def create_products_data_frame(self, drugs: list) -> pd.DataFrame:
-        """Creates a DataFrame with products information."""
+    def create_products_data_frame(self, drugs: list = None) -> pd.DataFrame:
+        """
+        Creates a DataFrame with products information. Without a list of drugs the
+        products are read into a columnar ProductTable, without Product objects.
+        """
+
+        if drugs is None:
+            return self.create_products_table().to_frame()
 
         products_data = []
 
@@ -79,6 +159,44 @@ class UniversalDataFrame:
         df = pd.DataFrame(products_data)
         return df
 
+    def create_products_table(self) -> ProductTable:
+        """Creates a ProductTable with products of all drugs, indexed by NDC, labeller and country."""
+        if self.products_table is None:
+            self.products_table = self.data_loader.parse_products_table()
+        return self.products_table
+
+    def create_arrow_table(self, entity: str):
+        """
+        Returns the "drug", "product", "target", "pathway" or "interaction" entity as
+        a pyarrow.Table. All tables are parsed in one pass on the first call and the
+        same immutable tables are handed out afterwards, without copying. Use the
+        table's to_pandas() method to get a DataFrame. Requires pyarrow.
+        """
+        if self.arrow_tables is None:
+            self.arrow_tables = self.data_loader.parse_arrow_tables()
+        if entity not in self.arrow_tables:
+            raise ValueError(f"Unknown entity: {entity}.")
+        return self.arrow_tables[entity]
+
+    def create_product_cube(self) -> ProductCube:
+        """
+        Creates a ProductCube with product counts by drug, labeller, country, agency,
+        route and form. The cube is saved next to the XML file and reused while the
+        file does not change; cubes of filtered drugs are not saved.
+        """
+        if self.drug_filter is not None:
+            return ProductCube.from_frame(self.create_products_table().to_frame())
+        path = cube_path(self.data_loader.xml_data)
+        cube = ProductCube.load(path, self.data_loader.xml_data)
+        if cube is None:
+            cube = ProductCube.from_frame(self.create_products_table().to_frame())
+            try:
+                cube.save(path, self.data_loader.xml_data)
+            except OSError:
+                # E.g. a read-only data directory; the cube is then not cached.
+                pass
+        return cube
+
     def create_pathways_data_frame(self) -> pd.DataFrame:
         """Creates a DataFrame with pathways information."""
 
@@ -95,7 +213,7 @@ class UniversalDataFrame:
                 "DrugBank ID": drug.drug_id,
                 "Synonyms": ", ".join(drug.synonyms) if drug.synonyms else "None",
             }
-            for drug in self.drugs
+            for drug in self.get_drugs(["synonyms"])
         ]
 
         df = pd.DataFrame(data)
@@ -106,7 +224,7 @@ class UniversalDataFrame:
     def create_nr_of_pathways_data_frame(self) -> pd.DataFrame:
         """Creates a DataFrame containing each DrugBank ID(from shorter database) and its number of interactive pathways."""
 
-        count = {drug.drug_id: 0 for drug in self.drugs}
+        count = {drug.drug_id: 0 for drug in self.get_drugs([])}
         for pathway in self.pathways:
             for drug in pathway.drugs:
                 if drug in count:
@@ -129,22 +247,32 @@ class UniversalDataFrame:
 
         return drug_counts
 
+    def create_summary(self) -> CorpusSummary:
+        """
+        Creates a CorpusSummary with the headline counts of the file, streamed in a
+        single pass. The summary is saved next to the XML file and reused while the
+        file does not change; summaries of filtered drugs are not saved.
+        """
+        if self.summary is None:
+            if self.drug_filter is None:
+                self.summary = CorpusSummary.load_or_build(self.xml_file)
+            else:
+                self.summary = CorpusSummary.from_xml(self.xml_file, self.drug_filter)
+        return self.summary
+
+    def create_group_masks(self) -> GroupMasks:
+        """
+        Creates GroupMasks with the groups of all drugs encoded as bitmasks, for
+        vectorised group queries such as approved and not withdrawn drugs.
+        """
+        if self.group_masks is None:
+            self.group_masks = GroupMasks.from_drugs(self.get_drugs(["groups"]))
+        return self.group_masks
+
     def create_groups_data_frame(self) -> pd.DataFrame:
         """Creates a DataFrame containing number of drugs in each drug group eg. investigational, approved."""
 
-        drug_dicts = [drug.to_dict() for drug in self.drugs]
-        df_exploded = pd.DataFrame(drug_dicts).explode("Groups")
-        df = df_exploded.groupby("Groups").size().reset_index(name="Count")
-
-        approved_not_withdrawn_count = 0
-        for drug in self.drugs:
-            if "approved" in drug.groups:
-                if "withdrawn" not in drug.groups:
-                    approved_not_withdrawn_count += 1
-
-        g_count = f"Zatwierdzonych i nie wycofanych leków jest {approved_not_withdrawn_count}."
-        # todo gdzie to wyswietlic
-        return df
+        return self.create_group_masks().groups_frame()
 
     def create_drug_interactions_data_frame(self) -> pd.DataFrame:
         """Creates a DataFrame with drug names and their drug interactions: drug names and description."""
@@ -156,7 +284,7 @@ class UniversalDataFrame:
             "Interaction Description": [],
         }
 
-        for drug in self.drugs:
+        for drug in self.get_drugs(["name", "drug_interactions"]):
             for interaction in drug.drug_interactions:
                 for target_name, description in interaction.items():
                     data["DrugBank ID"].append(drug.drug_id)
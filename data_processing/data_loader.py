@@ -1,174 +1,364 @@
 import xml.etree.ElementTree as ET
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Tuple
+import pandas as pd
 from src.targets import Target, Polypeptide
 from src.drugs import Drug
 from src.products import Product
 from src.pathways import Pathway
+from src.interactions import Interaction
+from data_processing.drug_filter import DrugFilter
+from data_processing.drug_index import load_drug_index
+from data_processing.arrow_tables import import_pyarrow, to_arrow_tables
+from data_processing.field_spec import (
+    FIELD_SPEC,
+    NAMESPACE,
+    FieldExtractor,
+    compile_entity,
+)
+from data_processing.product_table import PRODUCT_COLUMNS, ProductTable
+
+# Drug attributes filled from columns of the "drug" entity in FIELD_SPEC.
+DRUG_COLUMNS = {
+    "name": "Name",
+    "description": "Description",
+    "state": "Form",
+    "indication": "Indications",
+    "mechanism_of_action": "Mechanism_of_action",
+    "food_interactions": "Food_interactions",
+    "synonyms": "Synonyms",
+    "groups": "Groups",
+}
+
+# Optional Drug fields; the DrugBank ID and type are always parsed.
+DRUG_FIELDS = frozenset(DRUG_COLUMNS) | {"drug_interactions", "products"}
+
+# Readers of every entity compiled once from FIELD_SPEC, the single description
+# of where each value is in the XML.
+READERS = {entity: compile_entity(entity, {"db": NAMESPACE}) for entity in FIELD_SPEC}
 
 
 class DataLoader:
 
-    def __init__(self, xml_data: str):
+    def __init__(self, xml_data: str, drug_filter: DrugFilter = None):
+        """
+        Args:
+            xml_data (str): Path to the DrugBank XML file.
+            drug_filter (DrugFilter, optional): If given, only matching drugs are
+                parsed. The file is then streamed and other drugs are skipped as soon
+                as a field does not match, without building any objects.
+        """
         self.xml_data = xml_data
+        self.drug_filter = drug_filter
 
     def _load_data_from_file(self):
         tree = ET.parse(self.xml_data)
         root = tree.getroot()
 
         # Namespace handling for XML parsing
-        ns = {"db": "http://www.drugbank.ca"}
+        ns = {"db": NAMESPACE}
         return root, ns
 
-    def parse_targets(self) -> List[Target]:
-        """Parse XML data and return a list of Target objects."""
+    def iter_drug_elements(self) -> Iterator[Tuple[ET.Element, dict]]:
+        """
+        Stream top-level <drug> elements one at a time, without keeping the whole
+        tree in memory. Each element is cleared once the next one is requested.
+        Drugs rejected by the drug filter are not yielded.
+        """
+        tag = f"{{{NAMESPACE}}}drug"
+        ns = {"db": NAMESPACE}
+        drug_filter = self.drug_filter
+        depth = 0
+        root = None
+        rejected = False
+
+        for event, element in ET.iterparse(self.xml_data, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                depth += 1
+                if depth == 2 and drug_filter:
+                    rejected = drug_filter.rejects_type(element.get("type"))
+                continue
+
+            depth -= 1
+            if depth == 2 and drug_filter:
+                # A complete direct child of the current drug.
+                rejected = rejected or drug_filter.rejects_child(element)
+                if rejected:
+                    element.clear()
+            elif depth == 1 and element.tag == tag:
+                if not rejected and (
+                    drug_filter is None or drug_filter.matches(element, ns)
+                ):
+                    yield element, ns
+                root.clear()
+
+    @staticmethod
+    def _drug_fields(fields: Iterable[str]) -> frozenset:
+        """Checks the requested Drug fields; all of them if None."""
+        if fields is None:
+            return DRUG_FIELDS
+        fields = frozenset(fields)
+        unknown = fields - DRUG_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown drug fields: {sorted(unknown)}.")
+        return fields
+
+    def _drug_elements(self) -> Iterator[Tuple[ET.Element, dict]]:
+        """
+        <drug> elements to parse: all drugs of the parsed tree, or the drugs streamed
+        through the drug filter if there is one.
+        """
+        if self.drug_filter is not None:
+            return self.iter_drug_elements()
         root, ns = self._load_data_from_file()
+        return ((drug, ns) for drug in root.findall("db:drug", ns))
 
+    def parse_targets(self) -> List[Target]:
+        """Parse XML data and return a list of Target objects."""
         targets = []
 
-        for drug in root.findall("db:drug", ns):
-            for target in drug.findall("db:targets/db:target", ns):
-                id = target.find("db:id", ns).text
-                name = target.find("db:name", ns).text
-                polypeptide_general = target.find("db:polypeptide", ns)
+        for drug, ns in self._drug_elements():
+            targets.extend(self._parse_targets(drug, ns))
 
-                if polypeptide_general is None:
-                    continue
+        return targets
 
-                genatlas_id = None
+    def iter_targets(self) -> Iterator[Target]:
+        """Stream the XML file and yield Target objects one at a time, without keeping them."""
+        for drug, ns in self.iter_drug_elements():
+            yield from self._parse_targets(drug, ns)
 
-                for ext_id in polypeptide_general.findall(
-                    "db:external-identifiers/db:external-identifier", ns
-                ):
-                    resource = ext_id.find("db:resource", ns).text
-                    if resource == "GenAtlas":
-                        genatlas_id = ext_id.find("db:identifier", ns).text
-
-                polypeptide = Polypeptide(
-                    id=polypeptide_general.attrib["id"],
-                    source=polypeptide_general.attrib["source"],
-                    name=polypeptide_general.find("db:name", ns).text,
-                    gene_name=polypeptide_general.find("db:gene-name", ns).text,
-                    genatlas_id=genatlas_id,
-                    chromosome_location=polypeptide_general.find(
-                        "db:chromosome-location", ns
-                    ).text,
-                    cellular_location=polypeptide_general.find(
-                        "db:cellular-location", ns
-                    ).text,
-                    mollecular_weight=polypeptide_general.find(
-                        "db:molecular-weight", ns
-                    ).text,
-                )
+    def _parse_targets(self, drug: ET.Element, ns: dict) -> Iterator[Target]:
+        """Build Target objects from the targets of a single <drug> element."""
+        drug_id = READERS["drug"][1]["DrugBank ID"](drug)
+        path, read = READERS["target"]
+        for target in drug.findall(path, ns):
+            polypeptide = Polypeptide(
+                id=read["External ID"](target),
+                source=read["Source"](target),
+                name=read["Polypeptide name"](target),
+                gene_name=read["Gene name"](target),
+                genatlas_id=read["GenAtlas ID"](target),
+                chromosome_location=read["Chromosome number"](target),
+                cellular_location=read["Cellular location"](target),
+                mollecular_weight=read["Molecular weight"](target),
+            )
 
-                new_Target = Target(id, name, polypeptide)
-                targets.append(new_Target)
+            new_Target = Target(
+                read["Target ID"](target),
+                read["Target name"](target),
+                polypeptide,
+                drug_id=drug_id,
+            )
+            yield new_Target
 
-        return targets
+    def parse_drugs(self, fields: Iterable[str] = None) -> List[Drug]:
+        """
+        Parse XML data and return a list of Drug objects.
 
-    def parse_drugs(self) -> List[Drug]:
-        """Parse XML data and return a list of Drug objects."""
+        Args:
+            fields (Iterable[str], optional): Drug fields to parse, from DRUG_FIELDS.
+                Other fields are not read and are None, unlike empty fields, which
+                hold ["None"] or an empty set. All fields if None.
 
-        root, ns = self._load_data_from_file()
+        Raises:
+            ValueError: If a field is unknown.
+        """
+        fields = self._drug_fields(fields)
 
         drugs = []
-        drug_interactions = []
 
-        for drug in root.findall("db:drug", ns):
-            id = drug.find("db:drugbank-id[@primary='true']", ns).text
-            name = drug.find("db:name", ns).text
-            type = drug.get("type")
-            description = drug.find("db:description", ns).text
-            form = drug.find("db:state", ns).text
-            indication = drug.find("db:indication", ns).text
-            mechanism_of_action = drug.find("db:mechanism-of-action", ns).text
-            food_interactions = [
-                food.text
-                for food in drug.findall("db:food-interactions/db:food-interaction", ns)
-            ]
+        for drug, ns in self._drug_elements():
+            drugs.append(self._parse_drug(drug, ns, fields))
 
-            for interaction in drug.findall(
-                "db:drug-interactions/db:drug-interaction", ns
-            ):
-                drug_name = interaction.find("db:name", ns).text
-                interaction_description = interaction.find("db:description", ns).text
-                drug_interactions.append({drug_name: interaction_description})
-            synonyms = [
-                synonym.text for synonym in drug.findall("db:synonyms/db:synonym", ns)
-            ]
-            groups = [group.text for group in drug.findall("db:groups/db:group", ns)]
-
-            products = set()
-            for product in drug.findall("db:products/db:product", ns):
-                product_name = product.find("db:name", ns).text
-                producer = product.find("db:labeller", ns).text
-                national_drug_code = product.find("db:ndc-product-code", ns).text
-                form = product.find("db:dosage-form", ns).text
-                method_of_application = product.find("db:route", ns).text
-                dose_information = product.find("db:strength", ns).text
-                country = product.find("db:country", ns).text
-                agency = product.find("db:source", ns).text
-
-                new_Product = Product(
-                    product_name,
-                    producer,
-                    national_drug_code,
-                    form,
-                    method_of_application,
-                    dose_information,
-                    country,
-                    agency,
+        return drugs
+
+    def parse_drug(self, drug_id: str) -> Drug:
+        """Parse only the drug with the given DrugBank ID and return it as a Drug object."""
+        return self.parse_drugs_by_id([drug_id])[0]
+
+    def parse_drugs_by_id(self, drug_ids: List[str]) -> List[Drug]:
+        """
+        Parse only the drugs with the given DrugBank IDs, reading their byte ranges
+        from the offset index instead of parsing the whole file.
+
+        Args:
+            drug_ids (List[str]): DrugBank IDs of the drugs to parse.
+
+        Returns:
+            List[Drug]: Drug objects in the order of the given IDs.
+
+        Raises:
+            ValueError: If a drug is not in the file or is rejected by the drug
+                        filter.
+        """
+        index = load_drug_index(self.xml_data)
+        ns = {"db": NAMESPACE}
+
+        for drug_id in drug_ids:
+            if drug_id not in index:
+                raise ValueError(f"DrugBank ID {drug_id} not found.")
+
+        drugs = {}
+        with open(self.xml_data, "rb") as file:
+            # Reading in file order keeps the seeks sequential for large subsets.
+            for drug_id in sorted(set(drug_ids), key=lambda d: index[d][0]):
+                offset, length = index[drug_id]
+                file.seek(offset)
+                fragment = file.read(length)
+                wrapper = ET.fromstring(
+                    b'<drugbank xmlns="'
+                    + NAMESPACE.encode()
+                    + b'">'
+                    + fragment
+                    + b"</drugbank>"
                 )
-                products.add(new_Product)
-
-            new_Drug = Drug(
-                name,
-                id,
-                type,
-                description,
-                form,
-                indication,
-                mechanism_of_action,
-                food_interactions=food_interactions,
-                drug_interactions=drug_interactions,
-                synonyms=synonyms,
-                groups=groups,
-                products=products,
-            )
+                drug = wrapper.find("db:drug", ns)
+                if self.drug_filter is not None and not self.drug_filter.matches(
+                    drug, ns
+                ):
+                    raise ValueError(
+                        f"DrugBank ID {drug_id} does not match the drug filter."
+                    )
+                drugs[drug_id] = self._parse_drug(drug, ns)
 
-            drugs.append(new_Drug)
+        return [drugs[drug_id] for drug_id in drug_ids]
 
-        return drugs
+    def _parse_drug(
+        self, drug: ET.Element, ns: dict, fields: frozenset = DRUG_FIELDS
+    ) -> Drug:
+        """Build a Drug object with the given fields from a single <drug> element."""
+        read = READERS["drug"][1]
+        values = {
+            attribute: read[column](drug)
+            for attribute, column in DRUG_COLUMNS.items()
+            if attribute in fields
+        }
 
-    def parse_pathways(self) -> List[Pathway]:
-        """Parse XML Data and returns a list of Pathway objects."""
-        root, ns = self._load_data_from_file()
+        drug_interactions = []
+        if "drug_interactions" in fields:
+            path, read_interaction = READERS["interaction"]
+            drug_interactions = [
+                {
+                    read_interaction["Partner Name"](interaction): read_interaction[
+                        "Interaction Description"
+                    ](interaction)
+                }
+                for interaction in drug.findall(path, ns)
+            ]
 
-        pathways = []
-        drugs_list = []
+        products = set()
+        if "products" in fields:
+            path, read_product = READERS["product"]
+            # Product arguments follow the order of PRODUCT_FIELDS.
+            products = {
+                Product(*(read(product) for read in read_product.values()))
+                for product in drug.findall(path, ns)
+            }
+
+        new_Drug = Drug(
+            values.get("name"),
+            read["DrugBank ID"](drug),
+            read["Type"](drug),
+            values.get("description"),
+            values.get("state"),
+            values.get("indication"),
+            values.get("mechanism_of_action"),
+            food_interactions=values.get("food_interactions"),
+            drug_interactions=drug_interactions,
+            synonyms=values.get("synonyms"),
+            groups=values.get("groups"),
+            products=products,
+        )
+        # Unparsed fields are None, so they are not mistaken for empty ones, e.g.
+        # groups == ["None"] for a drug without groups.
+        for attribute in DRUG_FIELDS - fields:
+            setattr(new_Drug, attribute, None)
+
+        return new_Drug
+
+    def parse_products_table(self) -> ProductTable:
+        """Parse XML data and return products of all drugs as a ProductTable."""
+        extractor = FieldExtractor({"product": PRODUCT_COLUMNS}, {"db": NAMESPACE})
+        columns = extractor.extract_columns(drug for drug, _ in self._drug_elements())
 
-        for drug in root.findall("db:drug", ns):
-            for pathway in drug.findall("db:pathways/db:pathway", ns):
-                pathway_id = pathway.find("db:smpdb-id", ns).text
-                pathway_name = pathway.find("db:name", ns).text
-                category = pathway.find("db:category", ns).text
+        return ProductTable.from_columns(columns["product"])
 
-                drugs_list = [
-                    drug_elem.find("db:drugbank-id", ns).text
-                    for drug_elem in pathway.findall("db:drugs/db:drug", ns)
-                ]
+    def extract_fields(
+        self, columns: Dict[str, List[str]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Stream the XML file once and extract the requested columns of every entity
+        declared in field_spec.FIELD_SPEC.
 
-                enzymes_list = [
-                    enzyme_elem.text
-                    for enzyme_elem in pathway.findall("db:enzymes/db:uniprot-id", ns)
-                ]
+        Args:
+            columns (Dict[str, List[str]], optional): Entity ("drug", "product",
+                "target", "pathway" or "interaction") mapped to the columns to extract,
+                or to None for all of them. All entities and columns if None.
 
+        Returns:
+            Dict[str, pd.DataFrame]: Entity mapped to a DataFrame of its columns.
+        """
+        extractor = FieldExtractor(columns, {"db": NAMESPACE})
+        return extractor.extract(drug for drug, _ in self.iter_drug_elements())
+
+    def parse_arrow_tables(self, columns: Dict[str, List[str]] = None) -> dict:
+        """
+        Stream the XML file once and return the requested columns as pyarrow tables,
+        with list<string> columns for synonyms, groups, food interactions and
+        pathway drugs and enzymes. Requires pyarrow.
+
+        Args:
+            columns (Dict[str, List[str]], optional): Entity mapped to the columns to
+                extract, as in extract_fields. All entities and columns if None.
+
+        Returns:
+            dict: Entity mapped to a pyarrow.Table of its columns.
+        """
+        import_pyarrow()
+        # Empty lists stay empty instead of the ["None"] placeholder of Drug objects.
+        extractor = FieldExtractor(columns, {"db": NAMESPACE}, placeholder=())
+        values = extractor.extract_columns(
+            drug for drug, _ in self.iter_drug_elements()
+        )
+        return to_arrow_tables(values)
+
+    def parse_pathways(self) -> List[Pathway]:
+        """Parse XML Data and returns a list of Pathway objects."""
+        pathways = []
+        path, read = READERS["pathway"]
+
+        for drug, ns in self._drug_elements():
+            for pathway in drug.findall(path, ns):
                 new_Pathway = Pathway(
-                    id=pathway_id,
-                    name=pathway_name,
-                    category=category,
-                    drugs=drugs_list,
-                    enzymes=enzymes_list,
+                    id=read["Pathway ID"](pathway),
+                    name=read["Pathway name"](pathway),
+                    category=read["Category"](pathway),
+                    drugs=read["Drugs"](pathway),
+                    enzymes=read["Enzymes"](pathway),
                 )
                 pathways.append(new_Pathway)
 
         return pathways
+
+    def parse_interactions(self) -> List[Interaction]:
+        """Parse XML data and return a list of Interaction objects."""
+        interactions = []
+
+        for drug, ns in self._drug_elements():
+            interactions.extend(self._parse_interactions(drug, ns))
+
+        return interactions
+
+    def _parse_interactions(self, drug: ET.Element, ns: dict) -> Iterator[Interaction]:
+        """Build Interaction objects from the interactions of a single <drug> element."""
+        drug_id = READERS["drug"][1]["DrugBank ID"](drug)
+        path, read = READERS["interaction"]
+        for interaction in drug.findall(path, ns):
+            new_Interaction = Interaction(
+                drug_id=drug_id,
+                partner_id=read["Partner DrugBank ID"](interaction),
+                partner_name=read["Partner Name"](interaction),
+                description=read["Interaction Description"](interaction),
+            )
+            yield new_Interaction
@@ -0,0 +1,478 @@
+import argparse
+import sqlite3
+import pandas as pd
+from data_processing.data_loader import DataLoader
+from collections import Counter
+from data_processing.data_frames import UniversalDataFrame
+from data_processing.group_masks import GroupMasks
+from data_processing.product_cube import ProductCube
+from data_processing.product_table import ProductTable
+from data_processing.summary import CorpusSummary
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS drugs (
+    drugbank_id TEXT PRIMARY KEY,
+    name TEXT,
+    type TEXT,
+    description TEXT,
+    state TEXT,
+    indication TEXT,
+    mechanism_of_action TEXT
+);
+CREATE TABLE IF NOT EXISTS synonyms (
+    drugbank_id TEXT NOT NULL REFERENCES drugs(drugbank_id),
+    synonym TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS drug_groups (
+    drugbank_id TEXT NOT NULL REFERENCES drugs(drugbank_id),
+    group_name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS food_interactions (
+    drugbank_id TEXT NOT NULL REFERENCES drugs(drugbank_id),
+    description TEXT
+);
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    drugbank_id TEXT NOT NULL REFERENCES drugs(drugbank_id),
+    name TEXT,
+    labeller TEXT,
+    ndc_product_code TEXT,
+    dosage_form TEXT,
+    route TEXT,
+    strength TEXT,
+    country TEXT,
+    source TEXT
+);
+CREATE TABLE IF NOT EXISTS polypeptides (
+    polypeptide_id TEXT PRIMARY KEY,
+    source TEXT,
+    name TEXT,
+    gene_name TEXT,
+    genatlas_id TEXT,
+    chromosome_location TEXT,
+    cellular_location TEXT,
+    molecular_weight TEXT
+);
+CREATE TABLE IF NOT EXISTS targets (
+    id INTEGER PRIMARY KEY,
+    target_id TEXT NOT NULL,
+    drugbank_id TEXT REFERENCES drugs(drugbank_id),
+    name TEXT,
+    polypeptide_id TEXT REFERENCES polypeptides(polypeptide_id)
+);
+CREATE TABLE IF NOT EXISTS pathways (
+    id INTEGER PRIMARY KEY,
+    smpdb_id TEXT NOT NULL,
+    name TEXT,
+    category TEXT
+);
+CREATE TABLE IF NOT EXISTS pathway_members (
+    pathway_id INTEGER NOT NULL REFERENCES pathways(id),
+    drugbank_id TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pathway_enzymes (
+    pathway_id INTEGER NOT NULL REFERENCES pathways(id),
+    uniprot_id TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS interactions (
+    drugbank_id TEXT NOT NULL REFERENCES drugs(drugbank_id),
+    partner_id TEXT,
+    partner_name TEXT,
+    description TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_synonyms_drug ON synonyms(drugbank_id);
+CREATE INDEX IF NOT EXISTS idx_synonyms_synonym ON synonyms(synonym);
+CREATE INDEX IF NOT EXISTS idx_groups_drug ON drug_groups(drugbank_id);
+CREATE INDEX IF NOT EXISTS idx_food_drug ON food_interactions(drugbank_id);
+CREATE INDEX IF NOT EXISTS idx_products_drug ON products(drugbank_id);
+CREATE INDEX IF NOT EXISTS idx_products_ndc ON products(ndc_product_code);
+CREATE INDEX IF NOT EXISTS idx_polypeptides_gene ON polypeptides(gene_name);
+CREATE INDEX IF NOT EXISTS idx_targets_drug ON targets(drugbank_id);
+CREATE INDEX IF NOT EXISTS idx_targets_polypeptide ON targets(polypeptide_id);
+CREATE INDEX IF NOT EXISTS idx_pathways_smpdb ON pathways(smpdb_id);
+CREATE INDEX IF NOT EXISTS idx_pathway_members_pathway ON pathway_members(pathway_id);
+CREATE INDEX IF NOT EXISTS idx_pathway_members_drug ON pathway_members(drugbank_id);
+CREATE INDEX IF NOT EXISTS idx_pathway_enzymes_pathway ON pathway_enzymes(pathway_id);
+CREATE INDEX IF NOT EXISTS idx_interactions_drug ON interactions(drugbank_id);
+CREATE INDEX IF NOT EXISTS idx_interactions_partner ON interactions(partner_id);
+"""
+
+# Drug and Pathway objects use ["None"] as a placeholder for empty lists.
+PLACEHOLDER = ["None"]
+
+
+def _without_placeholder(values: list) -> list:
+    return [] if values == PLACEHOLDER else values
+
+
+class DrugBankDatabase:
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.executescript(SCHEMA)
+
+    def ingest(self, xml_file: str):
+        """
+        Parses the given DrugBank XML file and loads its content into the database.
+        Existing rows are removed first, so ingesting a newer release replaces the old one.
+
+        Args:
+            xml_file (str): Path to the DrugBank XML file.
+        """
+        data_loader = DataLoader(xml_file)
+        drugs = data_loader.parse_drugs()
+        targets = data_loader.parse_targets()
+        pathways = data_loader.parse_pathways()
+        interactions = data_loader.parse_interactions()
+
+        with self.connection:
+            self._clear()
+            self._insert_drugs(drugs)
+            self._insert_targets(targets)
+            self._insert_pathways(pathways)
+            self.connection.executemany(
+                "INSERT INTO interactions VALUES (?, ?, ?, ?)",
+                [
+                    (i.drug_id, i.partner_id, i.partner_name, i.description)
+                    for i in interactions
+                ],
+            )
+
+    def query(self, sql: str, params: tuple = ()) -> pd.DataFrame:
+        """
+        Runs an SQL query against the database.
+
+        Args:
+            sql (str): The SQL query to run.
+            params (tuple, optional): Parameters bound to the query placeholders.
+
+        Returns:
+            pd.DataFrame: The query result.
+        """
+        return pd.read_sql_query(sql, self.connection, params=params)
+
+    def close(self):
+        self.connection.close()
+
+    def _clear(self):
+        for table in (
+            "interactions",
+            "pathway_enzymes",
+            "pathway_members",
+            "pathways",
+            "targets",
+            "polypeptides",
+            "products",
+            "food_interactions",
+            "drug_groups",
+            "synonyms",
+            "drugs",
+        ):
+            self.connection.execute(f"DELETE FROM {table}")
+
+    def _insert_drugs(self, drugs: list):
+        cursor = self.connection.cursor()
+        for drug in drugs:
+            cursor.execute(
+                "INSERT INTO drugs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    drug.drug_id,
+                    drug.name,
+                    drug.drug_type,
+                    drug.description,
+                    drug.state,
+                    drug.indication,
+                    drug.mechanism_of_action,
+                ),
+            )
+            cursor.executemany(
+                "INSERT INTO synonyms VALUES (?, ?)",
+                [(drug.drug_id, s) for s in _without_placeholder(drug.synonyms)],
+            )
+            cursor.executemany(
+                "INSERT INTO drug_groups VALUES (?, ?)",
+                [(drug.drug_id, g) for g in _without_placeholder(drug.groups)],
+            )
+            cursor.executemany(
+                "INSERT INTO food_interactions VALUES (?, ?)",
+                [
+                    (drug.drug_id, f)
+                    for f in _without_placeholder(drug.food_interactions)
+                ],
+            )
+            cursor.executemany(
+                "INSERT INTO products (drugbank_id, name, labeller, ndc_product_code,"
+                " dosage_form, route, strength, country, source)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        drug.drug_id,
+                        p.name,
+                        p.producer,
+                        p.ndc,
+                        p.form,
+                        p.application,
+                        p.dosage,
+                        p.country,
+                        p.agency,
+                    )
+                    for p in drug.products
+                ],
+            )
+
+    def _insert_targets(self, targets: list):
+        cursor = self.connection.cursor()
+        for target in targets:
+            polypeptide = target.polypeptide
+            cursor.execute(
+                "INSERT OR IGNORE INTO polypeptides VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    polypeptide.id,
+                    polypeptide.source,
+                    polypeptide.name,
+                    polypeptide.gene_name,
+                    polypeptide.genatlas_id,
+                    polypeptide.chromosome_location,
+                    polypeptide.cellular_location,
+                    polypeptide.molecular_weight,
+                ),
+            )
+            cursor.execute(
+                "INSERT INTO targets (target_id, drugbank_id, name, polypeptide_id)"
+                " VALUES (?, ?, ?, ?)",
+                (target.id, target.drug_id, target.name, polypeptide.id),
+            )
+
+    def _insert_pathways(self, pathways: list):
+        cursor = self.connection.cursor()
+        for pathway in pathways:
+            cursor.execute(
+                "INSERT INTO pathways (smpdb_id, name, category) VALUES (?, ?, ?)",
+                (pathway.id, pathway.name, pathway.category),
+            )
+            row_id = cursor.lastrowid
+            cursor.executemany(
+                "INSERT INTO pathway_members VALUES (?, ?)",
+                [(row_id, d) for d in _without_placeholder(pathway.drugs)],
+            )
+            cursor.executemany(
+                "INSERT INTO pathway_enzymes VALUES (?, ?)",
+                [(row_id, e) for e in _without_placeholder(pathway.enzymes)],
+            )
+
+
+class DatabaseDataFrame(UniversalDataFrame):
+    """UniversalDataFrame whose builders read from a DrugBankDatabase with SQL."""
+
+    def __init__(self, db_path: str):
+        # The state of UniversalDataFrame, without an XML file to parse.
+        self._init_state(None, None, None)
+        self.database = DrugBankDatabase(db_path)
+
+    @property
+    def targets(self) -> list:
+        raise ValueError("DatabaseDataFrame has no parsed targets; use SQL queries.")
+
+    @property
+    def pathways(self) -> list:
+        raise ValueError("DatabaseDataFrame has no parsed pathways; use SQL queries.")
+
+    def get_drugs(self, fields) -> list:
+        raise ValueError("DatabaseDataFrame has no parsed drugs; use SQL queries.")
+
+    def create_arrow_table(self, entity: str):
+        raise ValueError("Arrow tables are only built from XML files.")
+
+    def _list_column(self, sql: str, key: str, value: str, keys: pd.Series) -> list:
+        """Collects child rows into one list per key, using ["None"] for no rows."""
+        grouped = self.database.query(sql).groupby(key)[value].agg(list).to_dict()
+        return [grouped.get(k, list(PLACEHOLDER)) for k in keys]
+
+    def create_targets_interactions_dataframe(self) -> pd.DataFrame:
+        """Creates a DataFrame with targets interaction information."""
+        return self.database.query("""
+            SELECT t.target_id AS "DrugBank ID",
+                   p.source AS "Source",
+                   p.polypeptide_id AS "External ID",
+                   p.name AS "Polypeptide name",
+                   p.gene_name AS "Gene name",
+                   p.genatlas_id AS "GenAtlas ID",
+                   p.chromosome_location AS "Chromosome number",
+                   p.cellular_location AS "Cellular location"
+            FROM targets t JOIN polypeptides p USING (polypeptide_id)
+            ORDER BY t.id
+            """)
+
+    def create_drugs_basic_informations_df(self) -> pd.DataFrame:
+        """Creates a DataFrame with drugs basic information."""
+        df = self.database.query("""
+            SELECT drugbank_id AS "DrugBank ID",
+                   name AS "Name",
+                   type AS "Type",
+                   description AS "Description",
+                   state AS "Form",
+                   indication AS "Indications",
+                   mechanism_of_action AS "Mechanism_of_action"
+            FROM drugs ORDER BY rowid
+            """)
+        df["Food_interactions"] = self._list_column(
+            "SELECT drugbank_id, description FROM food_interactions ORDER BY rowid",
+            "drugbank_id",
+            "description",
+            df["DrugBank ID"],
+        )
+        return df
+
+    def create_products_data_frame(self, drugs: list = None) -> pd.DataFrame:
+        """Creates a DataFrame with products information."""
+        return self.database.query("""
+            SELECT drugbank_id AS "DrugBank ID",
+                   name AS "Product Name",
+                   labeller AS "Producer",
+                   ndc_product_code AS "National Drug Code",
+                   dosage_form AS "Form",
+                   route AS "Method of application",
+                   strength AS "Dose information",
+                   country AS "Country",
+                   source AS "Agency"
+            FROM products ORDER BY id
+            """)
+
+    def create_pathways_data_frame(self) -> pd.DataFrame:
+        """Creates a DataFrame with pathways information."""
+        df = self.database.query("""
+            SELECT id, smpdb_id AS "Pathway_ID", name AS "Name", category AS "Category"
+            FROM pathways ORDER BY id
+            """)
+        df["Drugs"] = self._list_column(
+            "SELECT pathway_id, drugbank_id FROM pathway_members ORDER BY rowid",
+            "pathway_id",
+            "drugbank_id",
+            df["id"],
+        )
+        df["Enzymes"] = self._list_column(
+            "SELECT pathway_id, uniprot_id FROM pathway_enzymes ORDER BY rowid",
+            "pathway_id",
+            "uniprot_id",
+            df["id"],
+        )
+        return df.drop(columns="id")
+
+    def create_synonyms_data_frame(self) -> pd.DataFrame:
+        """Creates a DataFrame containing DrugBank ID as primary key and its synonyms."""
+        df = self.database.query(
+            'SELECT drugbank_id AS "DrugBank ID" FROM drugs ORDER BY rowid'
+        )
+        synonyms = self._list_column(
+            "SELECT drugbank_id, synonym FROM synonyms ORDER BY rowid",
+            "drugbank_id",
+            "synonym",
+            df["DrugBank ID"],
+        )
+        df["Synonyms"] = [", ".join(s) for s in synonyms]
+        return df
+
+    def create_nr_of_pathways_data_frame(self) -> pd.DataFrame:
+        """Creates a DataFrame containing each DrugBank ID(from shorter database) and its number of interactive pathways."""
+        return self.database.query("""
+            SELECT d.drugbank_id AS "DrugBank_ID",
+                   COUNT(m.pathway_id) AS "Nr_of_pathways"
+            FROM drugs d LEFT JOIN pathway_members m USING (drugbank_id)
+            GROUP BY d.drugbank_id
+            ORDER BY d.rowid
+            """)
+
+    def create_groups_data_frame(self) -> pd.DataFrame:
+        """Creates a DataFrame containing number of drugs in each drug group eg. investigational, approved."""
+        return self.database.query("""
+            SELECT COALESCE(g.group_name, 'None') AS "Groups", COUNT(*) AS "Count"
+            FROM drugs d LEFT JOIN drug_groups g USING (drugbank_id)
+            GROUP BY 1
+            ORDER BY 1
+            """)
+
+    def create_group_masks(self) -> GroupMasks:
+        """Creates GroupMasks from the drug_groups table."""
+        if self.group_masks is None:
+            drug_ids = self.database.query(
+                "SELECT drugbank_id FROM drugs ORDER BY rowid"
+            )["drugbank_id"]
+            groups = self._list_column(
+                "SELECT drugbank_id, group_name FROM drug_groups ORDER BY rowid",
+                "drugbank_id",
+                "group_name",
+                drug_ids,
+            )
+            self.group_masks = GroupMasks.from_groups(drug_ids.tolist(), groups)
+        return self.group_masks
+
+    def create_summary(self) -> CorpusSummary:
+        """Creates a CorpusSummary with the headline counts, counted with SQL."""
+        if self.summary is None:
+            summary = CorpusSummary()
+            types = self.database.query(
+                "SELECT type, COUNT(*) AS count FROM drugs GROUP BY type"
+            )
+            summary.drugs_per_type = Counter(dict(zip(types["type"], types["count"])))
+            summary.nr_of_drugs = int(types["count"].sum())
+            summary.set_group_counts(self.create_group_masks())
+            for attribute, table in [
+                ("nr_of_pathways", "pathways"),
+                ("nr_of_products", "products"),
+                ("nr_of_targets", "targets"),
+                ("nr_of_interactions", "interactions"),
+            ]:
+                count = self.database.query(f"SELECT COUNT(*) AS count FROM {table}")
+                setattr(summary, attribute, int(count["count"][0]))
+            self.summary = summary
+        return self.summary
+
+    def create_products_table(self) -> ProductTable:
+        """Creates a ProductTable from the products table."""
+        if self.products_table is None:
+            self.products_table = ProductTable(self.create_products_data_frame())
+        return self.products_table
+
+    def create_product_cube(self) -> ProductCube:
+        """Creates a ProductCube from the products table, without saving it."""
+        return ProductCube.from_frame(self.create_products_table().to_frame())
+
+    def create_drug_interactions_data_frame(self) -> pd.DataFrame:
+        """Creates a DataFrame with drug names and their drug interactions: drug names and description."""
+        return self.database.query("""
+            SELECT i.drugbank_id AS "DrugBank ID",
+                   d.name AS "Drug Name",
+                   i.partner_name AS "Target Name",
+                   i.description AS "Interaction Description"
+            FROM interactions i JOIN drugs d USING (drugbank_id)
+            ORDER BY i.rowid
+            """)
+
+    def create_pathway_interactions_data_frame(self) -> pd.DataFrame:
+        """Creates a DataFrame with pathways ids and names with drugs they interact with."""
+        df = self.create_pathways_data_frame()
+        selected_columns = ["Pathway_ID", "Name", "Drugs"]
+        return df[selected_columns].explode("Drugs").reset_index(drop=True)
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description="Loads a DrugBank XML file into an SQLite database."
+    )
+    parser.add_argument("--path", type=str, required=True)
+    parser.add_argument("--db", type=str, default="drugbank.db")
+    args = parser.parse_args()
+    return args
+
+
+def main():
+    args = parse_arguments()
+    database = DrugBankDatabase(args.db)
+    database.ingest(args.path)
+    database.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+from typing import Iterable
+import xml.etree.ElementTree as ET
+from data_processing.field_spec import DRUG_ID_PATH, FIELD_SPEC, field_path, first_step
+
+STATE_PATH = field_path("drug", "Form")
+GROUP_PATH = field_path("drug", "Groups")
+PATHWAY_PATH = FIELD_SPEC["pathway"][0]
+
+# Tags of the direct <drug> children checked while streaming, from FIELD_SPEC.
+DRUGBANK_ID_TAG, PRIMARY_ID = first_step(DRUG_ID_PATH)
+STATE_TAG, _ = first_step(STATE_PATH)
+GROUPS_TAG, _ = first_step(GROUP_PATH)
+PATHWAYS_TAG, _ = first_step(PATHWAY_PATH)
+
+
+class DrugFilter:
+    """
+    Predicate on drug-level fields of a <drug> element: type, groups, DrugBank ID
+    and state, and optionally having at least one pathway. While streaming, a drug
+    is rejected as soon as its type attribute or one of these child elements does
+    not match, so the rest of its subtree is dropped without building any objects.
+    """
+
+    def __init__(
+        self,
+        types: Iterable[str] = None,
+        groups: Iterable[str] = None,
+        excluded_groups: Iterable[str] = None,
+        drug_ids: Iterable[str] = None,
+        states: Iterable[str] = None,
+        with_pathways: bool = False,
+    ):
+        """
+        Args:
+            types (Iterable[str], optional): Allowed drug types, e.g. "small molecule".
+            groups (Iterable[str], optional): Groups the drug must be in, e.g.
+                                              "approved".
+            excluded_groups (Iterable[str], optional): Groups the drug must not be in,
+                                                       e.g. "withdrawn".
+            drug_ids (Iterable[str], optional): Allowed primary DrugBank IDs.
+            states (Iterable[str], optional): Allowed states, e.g. "solid".
+            with_pathways (bool, optional): Keep only drugs with at least one pathway.
+        """
+        self.types = set(types) if types is not None else None
+        self.groups = set(groups or ())
+        self.excluded_groups = set(excluded_groups or ())
+        self.drug_ids = set(drug_ids) if drug_ids is not None else None
+        self.states = set(states) if states is not None else None
+        self.with_pathways = with_pathways
+
+    def rejects_type(self, drug_type: str) -> bool:
+        """Checks the type attribute, available when the <drug> element starts."""
+        return self.types is not None and drug_type not in self.types
+
+    def rejects_child(self, child: ET.Element) -> bool:
+        """Checks a complete direct child of a <drug> element."""
+        if child.tag == DRUGBANK_ID_TAG:
+            return (
+                self.drug_ids is not None
+                and all(child.get(name) == value for name, value in PRIMARY_ID.items())
+                and child.text not in self.drug_ids
+            )
+        if child.tag == STATE_TAG:
+            return self.states is not None and child.text not in self.states
+        if child.tag == GROUPS_TAG:
+            return not self._groups_match({group.text for group in child})
+        if child.tag == PATHWAYS_TAG:
+            return self.with_pathways and len(child) == 0
+        return False
+
+    def matches(self, drug: ET.Element, ns: dict) -> bool:
+        """
+        Checks a complete <drug> element, including fields it does not have.
+
+        Args:
+            drug (ET.Element): The <drug> element.
+            ns (dict): XML namespaces.
+
+        Returns:
+            bool: True if the drug matches every predicate.
+        """
+        if self.rejects_type(drug.get("type")):
+            return False
+        if self.drug_ids is not None:
+            drug_id = drug.find(DRUG_ID_PATH, ns)
+            if drug_id is None or drug_id.text not in self.drug_ids:
+                return False
+        if self.states is not None:
+            if drug.findtext(STATE_PATH, None, ns) not in self.states:
+                return False
+        groups = {group.text for group in drug.findall(GROUP_PATH, ns)}
+        if not self._groups_match(groups):
+            return False
+        if self.with_pathways:
+            return drug.find(PATHWAY_PATH, ns) is not None
+        return True
+
+    def _groups_match(self, groups: set) -> bool:
+        return self.groups <= groups and not self.excluded_groups & groups
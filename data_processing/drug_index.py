@@ -0,0 +1,115 @@
+import json
+import mmap
+import os
+import re
+from typing import Dict, Tuple
+from data_processing.field_spec import DRUG_ID_PATH, first_step
+
+# Matches opening and closing <drug> tags, but not <drugbank-id>, <drugs> or
+# <drug-interaction>. Nested <drug> elements (pathway members) are skipped by depth.
+DRUG_TAG = re.compile(rb"<(/?)drug[\s>/]")
+
+# The primary ID element, written from the "DrugBank ID" path of FIELD_SPEC.
+_ID_TAG, _ID_ATTRIBUTES = first_step(DRUG_ID_PATH)
+_ID_NAME = _ID_TAG.rpartition("}")[2]
+PRIMARY_ID = re.compile(
+    "<{name}{attributes}>([^<]+)</{name}>".format(
+        name=re.escape(_ID_NAME),
+        attributes="".join(
+            f' {re.escape(key)}="{re.escape(value)}"'
+            for key, value in _ID_ATTRIBUTES.items()
+        ),
+    ).encode()
+)
+
+
+def index_path(xml_file: str) -> str:
+    """Returns the path of the offset index stored next to the given XML file."""
+    return f"{xml_file}.idx.json"
+
+
+def build_drug_index(xml_file: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Scans the XML file once and records where each top-level <drug> element is.
+
+    Args:
+        xml_file (str): Path to the DrugBank XML file.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: Byte offset and length of every top-level drug
+                                    element, keyed by its primary DrugBank ID.
+    """
+    index = {}
+
+    with open(xml_file, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return index
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # The document root has depth 1, so top-level drugs open at depth 1.
+            depth = 1
+            start = None
+            for match in DRUG_TAG.finditer(data):
+                if match.group(1):
+                    depth -= 1
+                    if depth == 1:
+                        end = data.find(b">", match.end() - 1) + 1
+                        primary_id = PRIMARY_ID.search(data, start, end)
+                        if primary_id is None:
+                            raise ValueError(f"Drug at byte {start} has no primary ID.")
+                        index[primary_id.group(1).decode("utf-8")] = (
+                            start,
+                            end - start,
+                        )
+                else:
+                    if depth == 1:
+                        start = match.start()
+                    depth += 1
+
+    return index
+
+
+def save_drug_index(xml_file: str, index: Dict[str, Tuple[int, int]]):
+    """
+    Saves the offset index next to the XML file, together with the file size and
+    modification time used to detect a stale index.
+
+    Args:
+        xml_file (str): Path to the DrugBank XML file.
+        index (Dict[str, Tuple[int, int]]): Index created by build_drug_index.
+    """
+    stat = os.stat(xml_file)
+    with open(index_path(xml_file), "w") as file:
+        json.dump(
+            {"size": stat.st_size, "mtime": stat.st_mtime, "drugs": index},
+            file,
+        )
+
+
+def load_drug_index(xml_file: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Loads the offset index of the XML file, building and saving it first if it is
+    missing or the XML file has changed since it was built. If the index cannot be
+    saved, e.g. in a read-only data directory, it is only kept in memory.
+
+    Args:
+        xml_file (str): Path to the DrugBank XML file.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: Byte offset and length of every top-level drug.
+    """
+    stat = os.stat(xml_file)
+    try:
+        with open(index_path(xml_file)) as file:
+            stored = json.load(file)
+        if stored["size"] == stat.st_size and stored["mtime"] == stat.st_mtime:
+            return {key: tuple(value) for key, value in stored["drugs"].items()}
+    except (OSError, ValueError, KeyError):
+        pass
+
+    index = build_drug_index(xml_file)
+    try:
+        save_drug_index(xml_file, index)
+    except OSError:
+        pass
+    return index
@@ -0,0 +1,282 @@
+import re
+import xml.etree.ElementTree as ET
+from typing import Callable, Dict, Iterable, List, Tuple
+import pandas as pd
+from data_processing.product_table import PRODUCT_FIELDS
+
+NAMESPACE = "http://www.drugbank.ca"
+
+# Columns extracted for each entity, as entity name mapped to the path of its
+# elements relative to a <drug> and a list of (column, path[, "list"]) fields.
+# Paths are relative to the entity element; a final "@name" segment reads an
+# attribute and the "list" kind collects the text of every matching element.
+# Rows of every entity except "drug" start with the "DrugBank ID" of their drug.
+FIELD_SPEC = {
+    "drug": (
+        ".",
+        [
+            ("DrugBank ID", "db:drugbank-id[@primary='true']"),
+            ("Name", "db:name"),
+            ("Type", "@type"),
+            ("Description", "db:description"),
+            ("Form", "db:state"),
+            ("Indications", "db:indication"),
+            ("Mechanism_of_action", "db:mechanism-of-action"),
+            (
+                "Food_interactions",
+                "db:food-interactions/db:food-interaction",
+                "list",
+            ),
+            ("Synonyms", "db:synonyms/db:synonym", "list"),
+            ("Groups", "db:groups/db:group", "list"),
+        ],
+    ),
+    "product": ("db:products/db:product", PRODUCT_FIELDS),
+    "target": (
+        # Targets without a polypeptide are skipped, as in DataLoader.parse_targets.
+        "db:targets/db:target[db:polypeptide]",
+        [
+            ("Target ID", "db:id"),
+            ("Target name", "db:name"),
+            ("Source", "db:polypeptide/@source"),
+            ("External ID", "db:polypeptide/@id"),
+            ("Polypeptide name", "db:polypeptide/db:name"),
+            ("Gene name", "db:polypeptide/db:gene-name"),
+            (
+                "GenAtlas ID",
+                "db:polypeptide/db:external-identifiers/"
+                "db:external-identifier[db:resource='GenAtlas']/db:identifier",
+            ),
+            ("Chromosome number", "db:polypeptide/db:chromosome-location"),
+            ("Cellular location", "db:polypeptide/db:cellular-location"),
+            ("Molecular weight", "db:polypeptide/db:molecular-weight"),
+        ],
+    ),
+    "pathway": (
+        "db:pathways/db:pathway",
+        [
+            ("Pathway ID", "db:smpdb-id"),
+            ("Pathway name", "db:name"),
+            ("Category", "db:category"),
+            ("Drugs", "db:drugs/db:drug/db:drugbank-id", "list"),
+            ("Enzymes", "db:enzymes/db:uniprot-id", "list"),
+        ],
+    ),
+    "interaction": (
+        "db:drug-interactions/db:drug-interaction",
+        [
+            ("Partner DrugBank ID", "db:drugbank-id"),
+            ("Partner Name", "db:name"),
+            ("Interaction Description", "db:description"),
+        ],
+    ),
+}
+
+# First step of a path: prefix, element name and an optional attribute condition.
+STEP = re.compile(r"(?:(\w+):)?([\w-]+)(?:\[@([\w-]+)='([^']*)'\])?")
+
+
+def field_path(entity: str, column: str, spec: dict = FIELD_SPEC) -> str:
+    """Returns the path of a column, relative to the entity element."""
+    _, fields = spec[entity]
+    for field in fields:
+        if field[0] == column:
+            return field[1]
+    raise ValueError(f"Unknown {entity} column: {column}.")
+
+
+def first_step(path: str) -> Tuple[str, dict]:
+    """
+    Splits the first step of a path into the tag of the element it matches and its
+    attribute condition, e.g. "db:drugbank-id[@primary='true']" into
+    ("{http://www.drugbank.ca}drugbank-id", {"primary": "true"}).
+
+    Raises:
+        ValueError: If the step is not an element name with an optional condition.
+    """
+    match = STEP.fullmatch(path.split("/")[0])
+    if match is None:
+        raise ValueError(f"Unsupported path step in {path}.")
+    prefix, name, attribute, value = match.groups()
+    tag = f"{{{NAMESPACE}}}{name}" if prefix else name
+    return tag, {attribute: value} if attribute else {}
+
+
+DRUG_ID_PATH = field_path("drug", "DrugBank ID")
+
+# Value of empty "list" fields, like in Drug and Pathway.
+LIST_PLACEHOLDER = ("None",)
+
+
+def spec_columns(entity: str, spec: dict = FIELD_SPEC) -> List[str]:
+    """Returns all columns of an entity, in spec order."""
+    path, fields = spec[entity]
+    columns = [field[0] for field in fields]
+    return columns if path == "." else ["DrugBank ID"] + columns
+
+
+def compile_field(
+    field: tuple, ns: dict, placeholder: tuple = LIST_PLACEHOLDER
+) -> Callable[[ET.Element], object]:
+    """
+    Turns a (column, path[, kind]) field into a function reading its value from an
+    entity element.
+
+    Args:
+        field (tuple): Field from FIELD_SPEC.
+        ns (dict): XML namespace mapping.
+        placeholder (tuple, optional): Items returned by "list" fields without any
+                                       matching element; () for an empty list.
+
+    Returns:
+        Callable[[ET.Element], object]: Function returning the text, attribute or
+                                        list of texts, None if the element is missing.
+    """
+    path = field[1]
+    kind = field[2] if len(field) > 2 else "text"
+
+    if kind == "list":
+        return lambda element: [item.text for item in element.findall(path, ns)] or [
+            *placeholder
+        ]
+
+    parent, _, last = path.rpartition("/")
+    if last.startswith("@"):
+        attribute = last[1:]
+        if not parent:
+            return lambda element: element.get(attribute)
+
+        def read_attribute(element):
+            child = element.find(parent, ns)
+            return None if child is None else child.get(attribute)
+
+        return read_attribute
+
+    def read_text(element):
+        child = element.find(path, ns)
+        return None if child is None else child.text
+
+    return read_text
+
+
+def compile_entity(
+    entity: str, ns: dict, spec: dict = FIELD_SPEC
+) -> Tuple[str, Dict[str, Callable[[ET.Element], object]]]:
+    """
+    Compiles every field of an entity, e.g. for building entity objects.
+
+    Args:
+        entity (str): Entity name in the spec.
+        ns (dict): XML namespace mapping.
+        spec (dict, optional): Field spec in the FIELD_SPEC format.
+
+    Returns:
+        Tuple[str, Dict[str, Callable]]: Path of the entity elements relative to a
+                                         <drug> and column mapped to its reader.
+    """
+    path, fields = spec[entity]
+    return path, {field[0]: compile_field(field, ns) for field in fields}
+
+
+class FieldExtractor:
+    """
+    Reads the requested columns of several entities from <drug> elements in a
+    single pass, using accessors compiled once from a declarative spec.
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, List[str]] = None,
+        ns: dict = None,
+        spec=FIELD_SPEC,
+        placeholder: tuple = LIST_PLACEHOLDER,
+    ):
+        """
+        Args:
+            columns (Dict[str, List[str]], optional): Entity mapped to the columns to
+                extract. All columns of all entities in the spec if None, and all
+                columns of an entity mapped to None.
+            ns (dict, optional): XML namespace mapping.
+            spec (dict, optional): Field spec in the FIELD_SPEC format.
+            placeholder (tuple, optional): Items of empty "list" fields; () for
+                                           empty lists, e.g. in Arrow tables.
+        """
+        ns = ns or {"db": NAMESPACE}
+        columns = columns or {entity: None for entity in spec}
+
+        self.ns = ns
+        self.read_drug_id = compile_field(("DrugBank ID", DRUG_ID_PATH), ns)
+        self.plan = []
+        for entity, requested in columns.items():
+            if entity not in spec:
+                raise ValueError(f"Unknown entity: {entity}.")
+            path, fields = spec[entity]
+            available = spec_columns(entity, spec)
+            requested = available if requested is None else requested
+
+            unknown = set(requested) - set(available)
+            if unknown:
+                raise ValueError(f"Unknown {entity} columns: {sorted(unknown)}.")
+
+            # The owning drug's ID is read once per drug, not once per row.
+            with_drug_id = path != "." and "DrugBank ID" in requested
+            readers = [
+                (field[0], compile_field(field, ns, placeholder))
+                for field in fields
+                if field[0] in requested
+            ]
+            readers.sort(key=lambda reader: requested.index(reader[0]))
+            self.plan.append((entity, path, with_drug_id, readers))
+
+    def extract_columns(
+        self, drugs: Iterable[ET.Element], output: Dict[str, dict] = None
+    ) -> Dict[str, dict]:
+        """
+        Extracts the requested columns from every drug.
+
+        Args:
+            drugs (Iterable[ET.Element]): Top-level <drug> elements, e.g. streamed by
+                                          DataLoader.iter_drug_elements.
+            output (Dict[str, dict], optional): Columns returned by a previous call,
+                                                to append the new rows to.
+
+        Returns:
+            Dict[str, dict]: Entity mapped to its columns, each a list of values.
+        """
+        if output is None:
+            output = {
+                entity: {
+                    column: []
+                    for column in (["DrugBank ID"] if with_drug_id else [])
+                    + [column for column, _ in readers]
+                }
+                for entity, _, with_drug_id, readers in self.plan
+            }
+
+        for drug in drugs:
+            drug_id = self.read_drug_id(drug)
+            for entity, path, with_drug_id, readers in self.plan:
+                columns = output[entity]
+                elements = [drug] if path == "." else drug.findall(path, self.ns)
+                for element in elements:
+                    if with_drug_id:
+                        columns["DrugBank ID"].append(drug_id)
+                    for column, read in readers:
+                        columns[column].append(read(element))
+
+        return output
+
+    def extract(self, drugs: Iterable[ET.Element]) -> Dict[str, pd.DataFrame]:
+        """
+        Extracts the requested columns from every drug into DataFrames.
+
+        Args:
+            drugs (Iterable[ET.Element]): Top-level <drug> elements.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Entity mapped to a DataFrame of its columns.
+        """
+        return {
+            entity: pd.DataFrame(columns, columns=list(columns))
+            for entity, columns in self.extract_columns(drugs).items()
+        }
@@ -0,0 +1,161 @@
+from typing import Iterable, List
+import numpy as np
+import pandas as pd
+
+# Groups of the DrugBank schema, always given the lowest bits in this order.
+KNOWN_GROUPS = [
+    "approved",
+    "withdrawn",
+    "investigational",
+    "experimental",
+    "vet_approved",
+    "nutraceutical",
+    "illicit",
+]
+MAX_GROUPS = 64
+
+
+class GroupMasks:
+    """
+    Drug groups of all drugs encoded as one 64-bit mask per drug, bit i being set
+    if the drug is in group names[i]. Drugs without groups have the mask 0 and are
+    counted as "None". Group queries are NumPy operations on the whole column.
+    """
+
+    def __init__(self, drug_ids: List[str], masks: np.ndarray, names: List[str]):
+        """
+        Args:
+            drug_ids (List[str]): DrugBank IDs, in the order of masks.
+            masks (np.ndarray): uint64 group mask of every drug.
+            names (List[str]): Group name of every bit.
+        """
+        self.drug_ids = drug_ids
+        self.masks = masks
+        self.names = names
+        self.bits = {name: np.uint64(1 << bit) for bit, name in enumerate(names)}
+
+    @classmethod
+    def from_groups(
+        cls, drug_ids: List[str], groups: Iterable[List[str]]
+    ) -> "GroupMasks":
+        """
+        Encodes the groups of every drug. Groups outside KNOWN_GROUPS get the next
+        free bits, in the order they are first seen.
+
+        Args:
+            drug_ids (List[str]): DrugBank IDs.
+            groups (Iterable[List[str]]): Groups of every drug; "None" is ignored.
+
+        Returns:
+            GroupMasks: The encoded groups.
+        """
+        names = list(KNOWN_GROUPS)
+        bits = {name: 1 << bit for bit, name in enumerate(names)}
+        masks = []
+        for drug_groups in groups:
+            mask = 0
+            for group in drug_groups:
+                if group == "None":
+                    continue
+                if group not in bits:
+                    if len(names) == MAX_GROUPS:
+                        raise ValueError(f"More than {MAX_GROUPS} drug groups.")
+                    bits[group] = 1 << len(names)
+                    names.append(group)
+                mask |= bits[group]
+            masks.append(mask)
+        return cls(list(drug_ids), np.array(masks, dtype=np.uint64), names)
+
+    @classmethod
+    def from_drugs(cls, drugs: Iterable) -> "GroupMasks":
+        """Encodes the groups of Drug objects."""
+        drugs = list(drugs)
+        return cls.from_groups(
+            [drug.drug_id for drug in drugs], [drug.groups for drug in drugs]
+        )
+
+    def mask_of(self, groups: Iterable[str]) -> np.uint64:
+        """
+        Returns the mask with the bits of the given groups set.
+
+        Raises:
+            ValueError: If a group is unknown.
+        """
+        mask = np.uint64(0)
+        for group in groups:
+            if group not in self.bits:
+                raise ValueError(f"Unknown drug group: {group}.")
+            mask |= self.bits[group]
+        return mask
+
+    def has(self, group: str) -> np.ndarray:
+        """
+        Returns a boolean array, True for drugs in the group. Arrays can be combined
+        with &, | and ~, e.g. has("approved") & ~has("withdrawn").
+        """
+        return (self.masks & self.mask_of([group])) != 0
+
+    def select(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+    ) -> np.ndarray:
+        """
+        Selects drugs by their groups.
+
+        Args:
+            all_of (Iterable[str], optional): Groups the drug must be in.
+            any_of (Iterable[str], optional): Groups of which the drug must be in at
+                                              least one; ignored if empty.
+            none_of (Iterable[str], optional): Groups the drug must not be in.
+
+        Returns:
+            np.ndarray: Boolean array, True for the selected drugs.
+        """
+        required = self.mask_of(all_of)
+        selected = (self.masks & required) == required
+        selected &= (self.masks & self.mask_of(none_of)) == 0
+        any_of = list(any_of)
+        if any_of:
+            selected &= (self.masks & self.mask_of(any_of)) != 0
+        return selected
+
+    def count(self, **groups) -> int:
+        """Returns the number of drugs selected by select(**groups)."""
+        return int(np.count_nonzero(self.select(**groups)))
+
+    def counts(self) -> dict:
+        """
+        Counts the drugs of every group from the set bits of all masks, with the
+        drugs without groups as "None".
+
+        Returns:
+            dict: Group name mapped to its number of drugs, for non-empty groups.
+        """
+        # Little-endian bytes of every mask, unpacked into one row of 64 bits.
+        bytes_ = self.masks.astype("<u8").view(np.uint8).reshape(-1, 8)
+        bits = np.unpackbits(bytes_, axis=1, bitorder="little").sum(axis=0)
+        counts = {name: int(bits[bit]) for bit, name in enumerate(self.names)}
+        counts["None"] = int(np.count_nonzero(self.masks == 0))
+        return {name: count for name, count in counts.items() if count}
+
+    def groups_frame(self) -> pd.DataFrame:
+        """
+        Returns the number of drugs in each group, in the format of
+        UniversalDataFrame.create_groups_data_frame.
+
+        Returns:
+            pd.DataFrame: "Groups" and "Count" columns, sorted by group.
+        """
+        counts = self.counts()
+        groups = sorted(counts)
+        return pd.DataFrame(
+            {"Groups": groups, "Count": [counts[group] for group in groups]}
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the "DrugBank ID" and "Groups mask" columns."""
+        return pd.DataFrame(
+            {"DrugBank ID": self.drug_ids, "Groups mask": self.masks.astype(np.int64)}
+        )
@@ -0,0 +1,147 @@
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Iterable, List
+import numpy as np
+import pandas as pd
+from src.drugs import Drug
+
+SEPARATORS = re.compile(r"[^0-9a-z]+")
+
+
+def normalise_name(name: str) -> str:
+    """
+    Normalises a drug name or synonym for case-, accent- and punctuation-insensitive
+    lookups.
+
+    Args:
+        name (str): The name to normalise.
+
+    Returns:
+        str: The lower-cased name with accents removed and any run of other
+             characters replaced by a single space.
+    """
+    name = name.casefold()
+    if not name.isascii():
+        name = unicodedata.normalize("NFKD", name)
+        name = "".join(c for c in name if not unicodedata.combining(c))
+    return SEPARATORS.sub(" ", name).strip()
+
+
+def trigrams(name: str) -> set:
+    """Returns the character trigrams of a normalised name, padded at both ends."""
+    padded = f"  {name} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class NameResolver:
+    """
+    Resolves free-text drug names to DrugBank IDs, first by exact match on the
+    normalised names and synonyms, then by character-trigram similarity.
+    """
+
+    def __init__(self, names: dict):
+        """
+        Args:
+            names (dict): Normalised name mapped to the DrugBank ID it resolves to.
+        """
+        self.exact = names
+        self.keys = list(names)
+        self.key_ids = [names[key] for key in self.keys]
+
+        postings = defaultdict(list)
+        for position, key in enumerate(self.keys):
+            for trigram in trigrams(key):
+                postings[trigram].append(position)
+        self.postings = {t: np.asarray(p, dtype=np.int32) for t, p in postings.items()}
+        self.key_sizes = np.asarray(
+            [len(trigrams(key)) for key in self.keys], dtype=np.float64
+        )
+
+    @classmethod
+    def from_drugs(cls, drugs: List[Drug]) -> "NameResolver":
+        """
+        Builds a resolver from drug names and synonyms. Drug names take precedence
+        over synonyms when the same name belongs to more than one drug.
+
+        Args:
+            drugs (List[Drug]): List of Drug objects.
+
+        Returns:
+            NameResolver: The resolver.
+        """
+        names = {}
+        for drug in drugs:
+            names.setdefault(normalise_name(drug.drug_id), drug.drug_id)
+            if drug.name:
+                names.setdefault(normalise_name(drug.name), drug.drug_id)
+        for drug in drugs:
+            for synonym in drug.synonyms:
+                if synonym and synonym != "None":
+                    names.setdefault(normalise_name(synonym), drug.drug_id)
+        names.pop("", None)
+        return cls(names)
+
+    def resolve(self, name: str, min_similarity: float = 0.5) -> tuple:
+        """
+        Resolves a single name.
+
+        Args:
+            name (str): Free-text drug name.
+            min_similarity (float, optional): Minimum trigram similarity (Dice
+                coefficient) of a fuzzy match. Use 1.0 to allow only exact matches.
+
+        Returns:
+            tuple: DrugBank ID, matched normalised name and similarity score, or
+                   (None, None, 0.0) if nothing is similar enough.
+        """
+        key = normalise_name(name)
+        drug_id = self.exact.get(key)
+        if drug_id is not None:
+            return drug_id, key, 1.0
+        if min_similarity >= 1.0 or not key:
+            return None, None, 0.0
+        return self._fuzzy(key, min_similarity)
+
+    def resolve_batch(
+        self, names: Iterable[str], min_similarity: float = 0.5
+    ) -> pd.DataFrame:
+        """
+        Resolves many names at once. Each distinct name is resolved only once, and
+        the trigram search runs only for names without an exact match.
+
+        Args:
+            names (Iterable[str]): Free-text drug names.
+            min_similarity (float, optional): Minimum similarity of a fuzzy match.
+
+        Returns:
+            pd.DataFrame: One row per input name with the DrugBank ID, matched name
+                          and similarity score (None, None and 0.0 if unresolved).
+        """
+        names = pd.Series(list(names), dtype=object)
+        codes, uniques = pd.factorize(names, use_na_sentinel=False)
+
+        resolved = [self.resolve(str(name), min_similarity) for name in uniques]
+        drug_ids, matches, scores = zip(*resolved) if resolved else ((), (), ())
+
+        return pd.DataFrame(
+            {
+                "Name": names,
+                "DrugBank ID": np.asarray(drug_ids, dtype=object)[codes],
+                "Matched name": np.asarray(matches, dtype=object)[codes],
+                "Score": np.asarray(scores, dtype=np.float64)[codes],
+            }
+        )
+
+    def _fuzzy(self, key: str, min_similarity: float) -> tuple:
+        query = trigrams(key)
+        hits = [self.postings[t] for t in query if t in self.postings]
+        if not hits:
+            return None, None, 0.0
+
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.keys))
+        similarity = 2 * shared / (len(query) + self.key_sizes)
+        best = int(np.argmax(similarity))
+        if similarity[best] < min_similarity:
+            return None, None, 0.0
+        return self.key_ids[best], self.keys[best], float(similarity[best])
@@ -0,0 +1,168 @@
+import json
+import os
+from itertools import combinations
+from typing import List
+import pandas as pd
+
+# Finest grain stored in the cube; every query is answered by summing over it
+# or over one of the precomputed roll-ups of the business dimensions.
+DIMENSIONS = [
+    "DrugBank ID",
+    "Producer",
+    "Country",
+    "Agency",
+    "Method of application",
+    "Form",
+]
+ROLLUP_DIMENSIONS = ["Country", "Agency", "Method of application", "Form"]
+
+
+def cube_path(xml_file: str) -> str:
+    """Returns the path of the product cube stored next to the given XML file."""
+    return f"{xml_file}.cube.json"
+
+
+class ProductCube:
+    """
+    Product counts aggregated by drug, labeller, country, agency, route and form,
+    with every roll-up of country, agency, route and form precomputed.
+    """
+
+    def __init__(self, base: pd.Series):
+        """
+        Args:
+            base (pd.Series): Product counts indexed by all DIMENSIONS.
+        """
+        self.base = base[base != 0]
+        self.rollups = {
+            frozenset(dimensions): self._aggregate(self.base, list(dimensions))
+            for size in range(len(ROLLUP_DIMENSIONS) + 1)
+            for dimensions in combinations(ROLLUP_DIMENSIONS, size)
+        }
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "ProductCube":
+        """
+        Builds the cube from a products DataFrame.
+
+        Args:
+            df (pd.DataFrame): DataFrame created by create_products_data_frame.
+
+        Returns:
+            ProductCube: The cube.
+        """
+        return cls(cls._count(df))
+
+    def query(self, by: List[str], where: dict = None) -> pd.DataFrame:
+        """
+        Counts products grouped by the given dimensions, optionally restricted to
+        selected values of any dimension. Missing values are reported as "None".
+
+        Args:
+            by (List[str]): Dimensions to group by, e.g. ["Country", "Form"].
+            where (dict, optional): Dimension mapped to a value or list of values to
+                                    keep, e.g. {"Producer": "Lab1"}.
+
+        Returns:
+            pd.DataFrame: The grouping dimensions and the "Count" column.
+        """
+        where = where or {}
+        needed = set(by) | set(where)
+        unknown = needed - set(DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown dimensions: {sorted(unknown)}.")
+
+        if needed <= set(ROLLUP_DIMENSIONS):
+            counts = self.rollups[frozenset(needed)]
+        else:
+            counts = self.base
+
+        frame = counts.reset_index()
+        for dimension, values in where.items():
+            values = values if isinstance(values, list) else [values]
+            frame = frame[frame[dimension].isin(values)]
+
+        if not by:
+            return pd.DataFrame({"Count": [int(frame["Count"].sum())]})
+        return (
+            frame.groupby(by)["Count"]
+            .sum()
+            .loc[lambda counts: counts != 0]
+            .reset_index()
+        )
+
+    def update(self, df: pd.DataFrame):
+        """
+        Adds products of new drugs to the cube. Products of drugs already in the cube
+        replace their previous counts.
+
+        Args:
+            df (pd.DataFrame): Products of the new drugs, as created by
+                               create_products_data_frame.
+        """
+        replaced = self.base.index.get_level_values("DrugBank ID").isin(
+            df["DrugBank ID"].unique()
+        )
+        delta = self._count(df).sub(self.base[replaced], fill_value=0)
+
+        self.base = self.base.add(delta, fill_value=0).astype(int)
+        self.base = self.base[self.base != 0]
+        for dimensions in self.rollups:
+            rollup = self.rollups[dimensions].add(
+                self._aggregate(delta, list(dimensions)), fill_value=0
+            )
+            self.rollups[dimensions] = rollup[rollup != 0].astype(int)
+
+    def save(self, path: str, source_file: str = None):
+        """
+        Saves the finest-grain counts to a JSON file.
+
+        Args:
+            path (str): Path of the file to write.
+            source_file (str, optional): XML file the cube was built from. Its size and
+                                         modification time are stored to detect changes.
+        """
+        data = {"base": self.base.reset_index().to_dict(orient="split")["data"]}
+        if source_file:
+            stat = os.stat(source_file)
+            data.update({"size": stat.st_size, "mtime": stat.st_mtime})
+        with open(path, "w") as file:
+            json.dump(data, file)
+
+    @classmethod
+    def load(cls, path: str, source_file: str = None) -> "ProductCube":
+        """
+        Loads a cube saved with save().
+
+        Args:
+            path (str): Path of the saved cube.
+            source_file (str, optional): If given, the cube is only returned if this
+                                         file has not changed since the cube was saved.
+
+        Returns:
+            ProductCube: The cube, or None if it is missing or out of date.
+        """
+        try:
+            with open(path) as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if source_file:
+            stat = os.stat(source_file)
+            if data.get("size") != stat.st_size or data.get("mtime") != stat.st_mtime:
+                return None
+
+        frame = pd.DataFrame(data["base"], columns=DIMENSIONS + ["Count"])
+        return cls(frame.set_index(DIMENSIONS)["Count"])
+
+    @staticmethod
+    def _count(df: pd.DataFrame) -> pd.Series:
+        # Missing values are stored as "None", like empty lists in Drug and Pathway.
+        return df[DIMENSIONS].fillna("None").groupby(DIMENSIONS).size().rename("Count")
+
+    @staticmethod
+    def _aggregate(counts: pd.Series, dimensions: List[str]) -> pd.Series:
+        if not dimensions:
+            return pd.Series([counts.sum()], name="Count")
+        return counts.groupby(level=dimensions).sum()
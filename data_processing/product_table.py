@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+PRODUCT_COLUMNS = [
+    "DrugBank ID",
+    "Product Name",
+    "Producer",
+    "National Drug Code",
+    "Form",
+    "Method of application",
+    "Dose information",
+    "Country",
+    "Agency",
+]
+
+# Product fields read from each <product> element, in PRODUCT_COLUMNS order.
+PRODUCT_FIELDS = [
+    ("Product Name", "db:name"),
+    ("Producer", "db:labeller"),
+    ("National Drug Code", "db:ndc-product-code"),
+    ("Form", "db:dosage-form"),
+    ("Method of application", "db:route"),
+    ("Dose information", "db:strength"),
+    ("Country", "db:country"),
+    ("Agency", "db:source"),
+]
+
+
+class ProductTable:
+    """
+    Products of all drugs kept column-wise, deduplicated per drug, with indexes by
+    National Drug Code, labeller and country.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        # A 64-bit hash of each row is the dedup key, instead of hashing
+        # Product objects one by one.
+        key = pd.util.hash_pandas_object(df[PRODUCT_COLUMNS], index=False)
+        self.df = df.loc[~key.duplicated().to_numpy()].reset_index(drop=True)
+
+        self.ndc_index = self._index("National Drug Code")
+        self.labeller_index = self._index("Producer")
+        self.country_index = self._index("Country")
+
+    @classmethod
+    def from_columns(cls, columns: dict) -> "ProductTable":
+        """
+        Builds the table from a dictionary of equally long column lists.
+
+        Args:
+            columns (dict): Lists of values keyed by the names in PRODUCT_COLUMNS.
+
+        Returns:
+            ProductTable: The deduplicated table.
+        """
+        return cls(pd.DataFrame(columns, columns=PRODUCT_COLUMNS))
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the table as a DataFrame with the create_products_data_frame columns."""
+        return self.df.copy()
+
+    def by_ndc(self, ndc: str) -> pd.DataFrame:
+        """Returns the products with the given National Drug Code."""
+        return self._lookup(self.ndc_index, ndc)
+
+    def by_labeller(self, labeller: str) -> pd.DataFrame:
+        """Returns all products of the given labeller."""
+        return self._lookup(self.labeller_index, labeller)
+
+    def by_country(self, country: str) -> pd.DataFrame:
+        """Returns all products marketed in the given country."""
+        return self._lookup(self.country_index, country)
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def _index(self, column: str) -> dict:
+        """Maps every value of the column to the positions of rows holding it."""
+        return self.df.groupby(column, sort=False, dropna=True).indices
+
+    def _lookup(self, index: dict, value: str) -> pd.DataFrame:
+        positions = index.get(value, np.array([], dtype=np.intp))
+        return self.df.iloc[positions].reset_index(drop=True)
@@ -0,0 +1,189 @@
+import argparse
+import hashlib
+import os
+import xml.etree.ElementTree as ET
+from collections import Counter
+import pandas as pd
+from data_processing.data_loader import DataLoader, NAMESPACE
+from data_processing.field_spec import DRUG_ID_PATH
+
+# Sub-entities fingerprinted separately: container path, element path and the
+# child elements whose text identifies the entity within its drug. Unlike the
+# FIELD_SPEC paths, these match every raw element, e.g. targets without a
+# polypeptide, since any change to the release is reported.
+SUB_ENTITIES = {
+    "product": ("products", "db:products/db:product", ["db:ndc-product-code"]),
+    "target": ("targets", "db:targets/db:target", ["db:id"]),
+    "pathway": ("pathways", "db:pathways/db:pathway", ["db:smpdb-id"]),
+    "interaction": (
+        "drug-interactions",
+        "db:drug-interactions/db:drug-interaction",
+        ["db:drugbank-id"],
+    ),
+}
+# Products without an NDC code are identified by their descriptive fields.
+PRODUCT_FALLBACK_KEY = [
+    "db:name",
+    "db:labeller",
+    "db:dosage-form",
+    "db:strength",
+    "db:route",
+    "db:country",
+    "db:source",
+]
+SUB_ENTITY_TAGS = {f"{{{NAMESPACE}}}{tag}" for tag, _, _ in SUB_ENTITIES.values()}
+
+DIFF_COLUMNS = ["Entity", "DrugBank ID", "Key", "Change"]
+
+
+def _update_hash(digest, element: ET.Element, skip: set = frozenset()):
+    """Feeds the tag, sorted attributes, stripped text and children into the hash."""
+    digest.update(element.tag.encode())
+    for name, value in sorted(element.attrib.items()):
+        digest.update(f"@{name}={value}".encode())
+    digest.update(b"\x00" + (element.text or "").strip().encode() + b"\x00")
+    for child in element:
+        if child.tag not in skip:
+            _update_hash(digest, child, skip)
+    digest.update(b"\x01")
+
+
+def fingerprint(element: ET.Element, skip: set = frozenset()) -> bytes:
+    """
+    Computes a whitespace-insensitive 8-byte fingerprint of an element.
+
+    Args:
+        element (ET.Element): Element to fingerprint.
+        skip (set, optional): Tags of child elements left out of the fingerprint.
+
+    Returns:
+        bytes: The fingerprint.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    _update_hash(digest, element, skip)
+    return digest.digest()
+
+
+def _entity_key(element: ET.Element, paths: list, ns: dict) -> str:
+    values = [element.findtext(path, default="", namespaces=ns) for path in paths]
+    return "|".join(value.strip() for value in values)
+
+
+def fingerprint_drug(drug: ET.Element, ns: dict) -> tuple:
+    """
+    Fingerprints a drug's own fields and each of its sub-entities.
+
+    Args:
+        drug (ET.Element): A top-level <drug> element.
+        ns (dict): XML namespace mapping.
+
+    Returns:
+        tuple: DrugBank ID, fingerprint of the drug without its products, targets,
+               pathways and interactions, and a dictionary mapping each sub-entity
+               type to {key: fingerprint}.
+    """
+    drug_id = drug.findtext(DRUG_ID_PATH, namespaces=ns)
+    entities = {}
+    for entity, (_, path, key_paths) in SUB_ENTITIES.items():
+        fingerprints = {}
+        seen = Counter()
+        for element in drug.findall(path, ns):
+            key = _entity_key(element, key_paths, ns)
+            if entity == "product" and not key:
+                key = _entity_key(element, PRODUCT_FALLBACK_KEY, ns)
+            # Repeated keys within one drug are numbered in document order.
+            seen[key] += 1
+            if seen[key] > 1:
+                key = f"{key}#{seen[key]}"
+            fingerprints[key] = fingerprint(element)
+        entities[entity] = fingerprints
+    return drug_id, fingerprint(drug, SUB_ENTITY_TAGS), entities
+
+
+def fingerprint_release(xml_file: str) -> dict:
+    """
+    Streams an XML release and fingerprints every drug and sub-entity. Only IDs
+    and fingerprints are kept, not the documents.
+
+    Args:
+        xml_file (str): Path to the DrugBank XML file.
+
+    Returns:
+        dict: DrugBank ID mapped to the drug fingerprint and sub-entity fingerprints.
+    """
+    release = {}
+    for drug, ns in DataLoader(xml_file).iter_drug_elements():
+        drug_id, drug_fingerprint, entities = fingerprint_drug(drug, ns)
+        release[drug_id] = (drug_fingerprint, entities)
+    return release
+
+
+def _compare(entity: str, drug_id: str, old: dict, new: dict, records: list):
+    for key in old.keys() - new.keys():
+        records.append((entity, drug_id, key, "removed"))
+    for key in new.keys() - old.keys():
+        records.append((entity, drug_id, key, "added"))
+    for key in old.keys() & new.keys():
+        if old[key] != new[key]:
+            records.append((entity, drug_id, key, "changed"))
+
+
+def diff_releases(old_xml: str, new_xml: str) -> pd.DataFrame:
+    """
+    Finds drugs, products, targets, pathways and interactions added, removed or
+    changed between two releases. Sub-entities of added or removed drugs are
+    reported as added or removed as well.
+
+    Args:
+        old_xml (str): Path to the older DrugBank XML file.
+        new_xml (str): Path to the newer DrugBank XML file.
+
+    Returns:
+        pd.DataFrame: One row per change with the entity type, DrugBank ID of the
+                      drug it belongs to, entity key and kind of change.
+    """
+    old_release = fingerprint_release(old_xml)
+    new_release = fingerprint_release(new_xml)
+    empty = (None, {entity: {} for entity in SUB_ENTITIES})
+
+    records = []
+    for drug_id in old_release.keys() | new_release.keys():
+        old_fingerprint, old_entities = old_release.get(drug_id, empty)
+        new_fingerprint, new_entities = new_release.get(drug_id, empty)
+        _compare(
+            "drug",
+            drug_id,
+            {} if old_fingerprint is None else {drug_id: old_fingerprint},
+            {} if new_fingerprint is None else {drug_id: new_fingerprint},
+            records,
+        )
+        for entity in SUB_ENTITIES:
+            _compare(
+                entity, drug_id, old_entities[entity], new_entities[entity], records
+            )
+
+    df = pd.DataFrame(records, columns=DIFF_COLUMNS)
+    return df.sort_values(["DrugBank ID", "Entity", "Key"], ignore_index=True)
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description="Lists changes between two DrugBank XML releases."
+    )
+    parser.add_argument("--old", type=str, required=True)
+    parser.add_argument("--new", type=str, required=True)
+    parser.add_argument("--output", type=str, default="results/release_diff.jsonl")
+    args = parser.parse_args()
+    return args
+
+
+def main():
+    args = parse_arguments()
+    df = diff_releases(args.old, args.new)
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    df.to_json(args.output, orient="records", lines=True)
+    print(df.groupby(["Entity", "Change"]).size().to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+import json
+import os
+from collections import Counter
+from typing import Iterable, List
+import xml.etree.ElementTree as ET
+from data_processing.data_loader import READERS, DataLoader
+from data_processing.drug_filter import DrugFilter
+from data_processing.group_masks import GroupMasks
+
+
+def summary_path(xml_file: str) -> str:
+    """Returns the path of the corpus summary stored next to the given XML file."""
+    return f"{xml_file}.summary.json"
+
+
+class CorpusSummary:
+    """
+    Headline counts of a DrugBank file: drugs per type and per group, approved and
+    not withdrawn drugs, pathways, products, targets and drug interactions. All of
+    them are collected in a single pass over the drugs.
+    """
+
+    def __init__(self):
+        self.nr_of_drugs = 0
+        self.drugs_per_type = Counter()
+        self.groups = Counter()
+        self.approved_not_withdrawn = 0
+        self.nr_of_pathways = 0
+        self.nr_of_products = 0
+        self.nr_of_targets = 0
+        self.nr_of_interactions = 0
+
+    def add_drug(
+        self,
+        type: str,
+        nr_of_pathways: int,
+        nr_of_products: int,
+        nr_of_targets: int,
+        nr_of_interactions: int,
+    ):
+        """
+        Adds the counts of one drug. Its groups are counted by set_group_counts.
+
+        Args:
+            type (str): Drug type, e.g. "small molecule".
+            nr_of_pathways (int): Number of pathways of the drug.
+            nr_of_products (int): Number of distinct products of the drug.
+            nr_of_targets (int): Number of targets with a polypeptide.
+            nr_of_interactions (int): Number of drug interactions.
+        """
+        self.nr_of_drugs += 1
+        self.drugs_per_type[type] += 1
+        self.nr_of_pathways += nr_of_pathways
+        self.nr_of_products += nr_of_products
+        self.nr_of_targets += nr_of_targets
+        self.nr_of_interactions += nr_of_interactions
+
+    def set_group_counts(self, group_masks: GroupMasks):
+        """
+        Takes the number of drugs per group, with drugs without groups as "None",
+        and of approved and not withdrawn drugs from the group masks of all drugs.
+
+        Args:
+            group_masks (GroupMasks): Groups of all counted drugs.
+        """
+        self.groups = Counter(group_masks.counts())
+        self.approved_not_withdrawn = group_masks.count(
+            all_of=["approved"], none_of=["withdrawn"]
+        )
+
+    @classmethod
+    def from_xml(cls, xml_file: str, drug_filter: DrugFilter = None) -> "CorpusSummary":
+        """
+        Streams the XML file once and counts every drug, without building Drug,
+        Target or Pathway objects.
+
+        Args:
+            xml_file (str): Path to the DrugBank XML file.
+            drug_filter (DrugFilter, optional): If given, only matching drugs are
+                                                counted.
+
+        Returns:
+            CorpusSummary: The summary.
+        """
+        summary = cls()
+        read = READERS["drug"][1]
+        drug_ids = []
+        groups = []
+        for drug, ns in DataLoader(xml_file, drug_filter).iter_drug_elements():
+            summary._add_element(drug, ns)
+            drug_ids.append(read["DrugBank ID"](drug))
+            groups.append(read["Groups"](drug))
+        summary.set_group_counts(GroupMasks.from_groups(drug_ids, groups))
+        return summary
+
+    @classmethod
+    def from_entities(
+        cls, drugs: Iterable, pathways: Iterable, targets: Iterable
+    ) -> "CorpusSummary":
+        """
+        Builds the summary from Drug, Pathway and Target objects which are already
+        parsed, with the same counts as from_xml. Otherwise from_xml is faster.
+
+        Args:
+            drugs (Iterable): Drug objects.
+            pathways (Iterable): Pathway objects, one per pathway entry of a drug.
+            targets (Iterable): Target objects.
+
+        Returns:
+            CorpusSummary: The summary.
+        """
+        summary = cls()
+        drugs = list(drugs)
+        for drug in drugs:
+            summary.add_drug(
+                drug.drug_type,
+                0,
+                len(drug.products),
+                0,
+                len(drug.drug_interactions),
+            )
+        summary.set_group_counts(GroupMasks.from_drugs(drugs))
+        summary.nr_of_pathways = sum(1 for _ in pathways)
+        summary.nr_of_targets = sum(1 for _ in targets)
+        return summary
+
+    @classmethod
+    def load_or_build(cls, xml_file: str) -> "CorpusSummary":
+        """
+        Loads the summary saved next to the XML file, or builds and saves it if it
+        is missing or out of date. It is not saved if the file cannot be written.
+        """
+        path = summary_path(xml_file)
+        summary = cls.load(path, xml_file)
+        if summary is None:
+            summary = cls.from_xml(xml_file)
+            try:
+                summary.save(path, xml_file)
+            except OSError:
+                pass
+        return summary
+
+    def to_dict(self) -> dict:
+        """Returns the counts as a JSON-serialisable dictionary."""
+        return {
+            "nr_of_drugs": self.nr_of_drugs,
+            "drugs_per_type": dict(self.drugs_per_type),
+            "groups": dict(self.groups),
+            "approved_not_withdrawn": self.approved_not_withdrawn,
+            "nr_of_pathways": self.nr_of_pathways,
+            "nr_of_products": self.nr_of_products,
+            "nr_of_targets": self.nr_of_targets,
+            "nr_of_interactions": self.nr_of_interactions,
+        }
+
+    def save(self, path: str, source_file: str = None):
+        """
+        Saves the counts to a JSON file.
+
+        Args:
+            path (str): Path of the file to write.
+            source_file (str, optional): XML file the summary was built from. Its size
+                                         and modification time are stored to detect
+                                         changes.
+        """
+        data = self.to_dict()
+        if source_file:
+            stat = os.stat(source_file)
+            data.update({"size": stat.st_size, "mtime": stat.st_mtime})
+        with open(path, "w") as file:
+            json.dump(data, file)
+
+    @classmethod
+    def load(cls, path: str, source_file: str = None) -> "CorpusSummary":
+        """
+        Loads a summary saved with save().
+
+        Args:
+            path (str): Path of the saved summary.
+            source_file (str, optional): If given, the summary is only returned if this
+                                         file has not changed since it was saved.
+
+        Returns:
+            CorpusSummary: The summary, or None if it is missing or out of date.
+        """
+        try:
+            with open(path) as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if source_file:
+            stat = os.stat(source_file)
+            if data.get("size") != stat.st_size or data.get("mtime") != stat.st_mtime:
+                return None
+
+        summary = cls()
+        for key, value in data.items():
+            if key in ("drugs_per_type", "groups"):
+                value = Counter(value)
+            if hasattr(summary, key):
+                setattr(summary, key, value)
+        return summary
+
+    def _add_element(self, drug: ET.Element, ns: dict):
+        """Adds the counts of a single <drug> element, found with the FIELD_SPEC paths."""
+        product_path, read_product = READERS["product"]
+        products = {
+            tuple(read(product) for read in read_product.values())
+            for product in drug.findall(product_path, ns)
+        }
+        self.add_drug(
+            READERS["drug"][1]["Type"](drug),
+            len(drug.findall(READERS["pathway"][0], ns)),
+            len(products),
+            # Only targets with a polypeptide match the target path.
+            len(drug.findall(READERS["target"][0], ns)),
+            len(drug.findall(READERS["interaction"][0], ns)),
+        )
@@ -0,0 +1,215 @@
+import gzip
+import json
+import re
+from collections import defaultdict
+from typing import List
+import numpy as np
+import pandas as pd
+from src.drugs import Drug
+
+TOKEN = re.compile(r"[a-z0-9]+")
+PHRASE = re.compile(r'"([^"]*)"')
+
+# Position gap inserted between text fields, so that phrases never match across them.
+FIELD_GAP = 1000
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits text into lower-case alphanumeric tokens.
+
+    Args:
+        text (str): Text to tokenize.
+
+    Returns:
+        List[str]: The tokens in order of appearance.
+    """
+    return TOKEN.findall(text.lower()) if text else []
+
+
+def _drug_texts(drug: Drug) -> List[str]:
+    food_interactions = [f for f in drug.food_interactions if f != "None"]
+    return [
+        drug.description,
+        drug.indication,
+        drug.mechanism_of_action,
+        *food_interactions,
+    ]
+
+
+class TextSearchIndex:
+    """
+    Inverted index over drug descriptions, indications, mechanisms of action and
+    food interactions, ranking matches with BM25.
+    """
+
+    def __init__(
+        self,
+        drug_ids: List[str],
+        names: List[str],
+        doc_lengths: List[int],
+        postings: dict,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ):
+        self.drug_ids = drug_ids
+        self.names = names
+        self.doc_lengths = np.asarray(doc_lengths, dtype=np.float64)
+        self.postings = postings
+        self.k1 = k1
+        self.b = b
+        self.average_length = self.doc_lengths.mean() if len(doc_lengths) else 0.0
+        self._arrays = {}
+
+    @classmethod
+    def build(cls, drugs: List[Drug]) -> "TextSearchIndex":
+        """
+        Builds the index from parsed drugs.
+
+        Args:
+            drugs (List[Drug]): List of Drug objects.
+
+        Returns:
+            TextSearchIndex: The index, with one document per drug.
+        """
+        postings = defaultdict(dict)
+        doc_lengths = []
+
+        for doc, drug in enumerate(drugs):
+            position = 0
+            length = 0
+            for text in _drug_texts(drug):
+                tokens = tokenize(text)
+                for offset, token in enumerate(tokens):
+                    postings[token].setdefault(doc, []).append(position + offset)
+                position += len(tokens) + FIELD_GAP
+                length += len(tokens)
+            doc_lengths.append(length)
+
+        return cls(
+            [drug.drug_id for drug in drugs],
+            [drug.name for drug in drugs],
+            doc_lengths,
+            dict(postings),
+        )
+
+    def save(self, path: str):
+        """
+        Saves the index to a gzip-compressed JSON file.
+
+        Args:
+            path (str): Path of the file to write.
+        """
+        data = {
+            "drug_ids": self.drug_ids,
+            "names": self.names,
+            "doc_lengths": self.doc_lengths.astype(int).tolist(),
+            "postings": {
+                term: [[doc, positions] for doc, positions in docs.items()]
+                for term, docs in self.postings.items()
+            },
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            json.dump(data, file)
+
+    @classmethod
+    def load(cls, path: str) -> "TextSearchIndex":
+        """
+        Loads an index saved with save().
+
+        Args:
+            path (str): Path of the saved index.
+
+        Returns:
+            TextSearchIndex: The loaded index.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            data = json.load(file)
+        postings = {
+            term: {doc: positions for doc, positions in docs}
+            for term, docs in data["postings"].items()
+        }
+        return cls(data["drug_ids"], data["names"], data["doc_lengths"], postings)
+
+    def search(self, query: str, top_k: int = 10) -> pd.DataFrame:
+        """
+        Finds the drugs best matching the query. Words are matched independently,
+        text in double quotes must appear as an exact phrase.
+
+        Args:
+            query (str): Query, e.g. 'kinase "blood pressure"'.
+            top_k (int, optional): Maximum number of results.
+
+        Returns:
+            pd.DataFrame: DrugBank ID, name and BM25 score of the matching drugs,
+                          best first.
+        """
+        phrases = [tokenize(p) for p in PHRASE.findall(query)]
+        phrases = [p for p in phrases if p]
+        terms = tokenize(PHRASE.sub(" ", query)) + [t for p in phrases for t in p]
+
+        scores = np.zeros(len(self.drug_ids))
+        for term in set(terms):
+            if term not in self.postings:
+                continue
+            docs, frequencies = self._term_arrays(term)
+            idf = np.log(1 + (len(self.drug_ids) - len(docs) + 0.5) / (len(docs) + 0.5))
+            norm = self.k1 * (
+                1 - self.b + self.b * self.doc_lengths[docs] / self.average_length
+            )
+            scores[docs] += idf * frequencies * (self.k1 + 1) / (frequencies + norm)
+
+        if phrases:
+            candidates = None
+            for phrase in phrases:
+                candidates = {
+                    doc
+                    for doc in self._docs_with_all(phrase, candidates)
+                    if self._contains_phrase(doc, phrase)
+                }
+            candidates = np.fromiter(candidates, dtype=int, count=len(candidates))
+        else:
+            candidates = np.flatnonzero(scores)
+
+        if len(candidates) > top_k:
+            best = np.argpartition(-scores[candidates], top_k - 1)[:top_k]
+            candidates = candidates[best]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        return pd.DataFrame(
+            {
+                "DrugBank ID": [self.drug_ids[doc] for doc in candidates],
+                "Name": [self.names[doc] for doc in candidates],
+                "Score": scores[candidates],
+            }
+        )
+
+    def _term_arrays(self, term: str) -> tuple:
+        """Returns document ids and term frequencies of a term as cached NumPy arrays."""
+        if term not in self._arrays:
+            docs = self.postings[term]
+            self._arrays[term] = (
+                np.fromiter(docs.keys(), dtype=int, count=len(docs)),
+                np.fromiter(
+                    (len(p) for p in docs.values()), dtype=np.float64, count=len(docs)
+                ),
+            )
+        return self._arrays[term]
+
+    def _docs_with_all(self, terms: List[str], docs: set = None) -> set:
+        """Returns the documents (optionally from the given set) containing every term."""
+        postings = sorted((self.postings.get(t, {}) for t in set(terms)), key=len)
+        for term_docs in postings:
+            docs = set(term_docs) if docs is None else docs.intersection(term_docs)
+        return docs
+
+    def _contains_phrase(self, doc: int, phrase: List[str]) -> bool:
+        """Checks whether the tokens of the phrase appear consecutively in a document."""
+        positions = [self.postings.get(term, {}).get(doc) for term in phrase]
+        if any(p is None for p in positions):
+            return False
+        following = [set(p) for p in positions[1:]]
+        return any(
+            all(start + i + 1 in following[i] for i in range(len(following)))
+            for start in positions[0]
+        )
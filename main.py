@@ -10,6 +10,8 @@ from visualisations.graphs import (
 )
 
 from visualisations.gene_graph import create_plot
+from visualisations.figure_cache import FigureCache, InputFile
+from visualisations.layouts import LayoutCache
 
 from visualisations.charts import (
     plot_pathways_vertical_histogram,
@@ -21,9 +23,11 @@ from visualisations.charts import (
 )
 
 from analysis.molecular_analysis import compute_average_weights, run_anova
+from analysis.weight_statistics import WeightStatistics
 from analysis.counts import (
     show_nr_of_pathways,
     show_nr_of_approved_not_withdrawn_drugs,
+    show_summary,
 )
 import argparse
 import os
@@ -32,81 +36,152 @@ import os
 def parse_arguments():
     parser = argparse.ArgumentParser()
     parser.add_argument("--path", type=str, required=True)
-    parser.add_argument("--drug_id", type=str, required=True)
-    parser.add_argument("--gene_id", type=str, required=True)
+    parser.add_argument("--drug_id", type=str)
+    parser.add_argument("--gene_id", type=str)
+    parser.add_argument(
+        "--tables_only",
+        action="store_true",
+        help="Only build and save the DataFrames, without drawing any plots.",
+    )
     args = parser.parse_args()
+    if not args.tables_only and (args.drug_id is None or args.gene_id is None):
+        parser.error("--drug_id and --gene_id are required unless --tables_only is set")
     return args
 
 
+def save_data_frames(data_frames: dict, output_dir: str = "results"):
+    """
+    Saves each DataFrame as a JSON file named after its key.
+
+    Args:
+        data_frames (dict): DataFrames keyed by name.
+        output_dir (str, optional): Directory to save the files in.
+    """
+    for name, df in data_frames.items():
+        df.to_json(os.path.join(output_dir, f"{name}.json"), indent=4)
+
+
 def main():
 
     args = parse_arguments()
     file_path = args.path
     drug_id = args.drug_id  # DB00047
     gene_id = args.gene_id  # C1QA
+    draw_plots = not args.tables_only
 
     data_loader = DataLoader(file_path)
-    targets = data_loader.parse_targets()
-    drugs = data_loader.parse_drugs()
 
     df_builder = UniversalDataFrame(file_path)
+    # Every drug field is used below, so the drugs are parsed once with all of them.
+    drugs = df_builder.drugs
 
     os.makedirs("results", exist_ok=True)
+    cache = FigureCache()
+    layout_cache = LayoutCache()
+
+    # Headline counts, collected in one pass and cached next to the XML file.
+    summary = df_builder.create_summary()
+    show_summary(summary)
 
     # Number 1
     df_drugs = df_builder.create_drugs_basic_informations_df()
 
     # Number 2
     df_synonyms = df_builder.create_synonyms_data_frame()
-    generate_draw_synonyms_graph(drug_id, drugs, "results/synonyms_graph.png")
+    if draw_plots:
+        # Only the drawn drug is passed, so the cache key does not hash every drug.
+        cache.render(
+            generate_draw_synonyms_graph,
+            drug_id,
+            [drug for drug in drugs if drug.drug_id == drug_id],
+            path_to_save="results/synonyms_graph.png",
+            layout_cache=layout_cache,
+        )
 
     # Number 3
-    df_products = df_builder.create_products_data_frame(drugs)
+    df_products = df_builder.create_products_data_frame()
 
     # Number 4
     df_pathways = df_builder.create_pathways_data_frame()
-    show_nr_of_pathways(df_pathways)
+    show_nr_of_pathways(summary)
 
     # Number 5
     df_pathways_interactions = df_builder.create_pathway_interactions_data_frame()
-    create_pathways_bipartite_graph(
-        df_pathways_interactions, "results/pathways_bipartite_graph.png"
-    )
+    if draw_plots:
+        cache.render(
+            create_pathways_bipartite_graph,
+            df_pathways_interactions,
+            path_to_save="results/pathways_bipartite_graph.png",
+        )
 
     # Number 6
     df_nr_pathways = df_builder.create_nr_of_pathways_data_frame()
     df_all_pathways_nr = df_builder.create_all_pathways_nr_data_frame(
         df_pathways_interactions
     )
-    plot_pathways_horizontal_histogram(
-        df_nr_pathways, "results/pathways_horizontal_histogram.png"
-    )
-    plot_pathways_vertical_histogram(
-        df_all_pathways_nr, "results/pathways_vertical_histogram.png"
-    )
+    if draw_plots:
+        cache.render(
+            plot_pathways_horizontal_histogram,
+            df_nr_pathways,
+            path_to_save="results/pathways_horizontal_histogram.png",
+        )
+        cache.render(
+            plot_pathways_vertical_histogram,
+            df_all_pathways_nr,
+            path_to_save="results/pathways_vertical_histogram.png",
+        )
 
     # Number 7
     protein_df = df_builder.create_targets_interactions_dataframe()
 
     # Number 8
-    create_pie_plot_targets(protein_df, "results/targets_pie_plot.png")
+    if draw_plots:
+        cache.render(
+            create_pie_plot_targets,
+            protein_df,
+            path_to_save="results/targets_pie_plot.png",
+        )
 
     # Number 9
     df_groups_number = df_builder.create_groups_data_frame()
-    show_nr_of_approved_not_withdrawn_drugs(drugs)
-    create_groups_pie_plot(df_groups_number, df_drugs, "results/groups_pie_plot.png")
+    show_nr_of_approved_not_withdrawn_drugs(summary)
+    if draw_plots:
+        cache.render(
+            create_groups_pie_plot,
+            df_groups_number,
+            df_drugs,
+            path_to_save="results/groups_pie_plot.png",
+        )
 
     # Number 10
     df_drug_interactions = df_builder.create_drug_interactions_data_frame()
 
     # Number 11
-    create_plot(file_path, "results/gene_plot.png", gene_id)
+    if draw_plots:
+        cache.render(
+            create_plot,
+            InputFile(file_path),
+            gene_id=gene_id,
+            path_to_save="results/gene_plot.png",
+            layout_cache=layout_cache,
+        )
 
     # Number 12
-    df_molecular_weight = compute_average_weights(targets)
-    plot_average_weights(targets, "results/average_molecular_weights_plot.png")
-    plot_distribution(targets, "results/distribution_of_molecular_weights_plot.png")
-    run_anova(targets)
+    # Weight statistics are collected while streaming the targets, without a list.
+    weight_statistics = WeightStatistics.from_targets(data_loader.iter_targets())
+    df_molecular_weight = compute_average_weights(weight_statistics)
+    if draw_plots:
+        cache.render(
+            plot_average_weights,
+            weight_statistics,
+            path_to_save="results/average_molecular_weights_plot.png",
+        )
+        cache.render(
+            plot_distribution,
+            weight_statistics,
+            path_to_save="results/distribution_of_molecular_weights_plot.png",
+        )
+    run_anova(weight_statistics)
 
     # Results
     data_frames = {
@@ -123,8 +198,9 @@ def main():
         "df_molecular_weight": df_molecular_weight,
     }
 
-    for name, df in data_frames.items():
-        df.to_json(f"results/{name}.json", indent=4)
+    save_data_frames(data_frames)
+    if draw_plots:
+        print(cache.report())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+import json
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+
+class QueryClient:
+    """Thin client for a running QueryServer."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, timeout: float = 5.0):
+        self.base_url = f"http://{host}:{port}"
+        self.timeout = timeout
+
+    def lookup_name(self, name: str) -> list:
+        """Returns the DrugBank IDs whose name or synonym matches the given name."""
+        return self._request("GET", "/name", name=name)["drugbank_ids"]
+
+    def resolve(self, name: str) -> dict:
+        """Resolves a free-text name to its best matching DrugBank ID and score."""
+        return self._request("GET", "/resolve", name=name)
+
+    def synonyms(self, drug_id: str) -> list:
+        """Returns the synonyms of the drug with the given DrugBank ID."""
+        return self._request("GET", "/synonyms", drug_id=drug_id)["synonyms"]
+
+    def drugs_for_gene(self, gene_name: str) -> list:
+        """Returns the DrugBank IDs of drugs targeting the given gene."""
+        return self._request("GET", "/gene", gene=gene_name)["drugbank_ids"]
+
+    def interaction(self, drug_id: str, other_id: str) -> str:
+        """Returns the description of the interaction between two drugs, or None."""
+        return self._request("GET", "/interaction", a=drug_id, b=other_id)[
+            "description"
+        ]
+
+    def health(self) -> dict:
+        """Returns the loaded file, number of drugs, reload status and last reload error."""
+        return self._request("GET", "/health")
+
+    def reload(self, xml_file: str = None) -> bool:
+        """
+        Asks the server to load a new XML release without stopping.
+
+        Args:
+            xml_file (str, optional): Path to the new release, as seen by the server.
+                                      It must be inside the server's data directory.
+
+        Raises:
+            HTTPError: With code 403 if the file is outside the data directory.
+
+        Returns:
+            bool: True if the reload was started; False if one is already running.
+        """
+        params = {"path": xml_file} if xml_file else {}
+        try:
+            self._request("POST", "/reload", **params)
+        except HTTPError as e:
+            if e.code == 409:
+                return False
+            raise
+        return True
+
+    def _request(self, method: str, endpoint: str, **params) -> dict:
+        url = f"{self.base_url}{endpoint}"
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        with urlopen(Request(url, method=method), timeout=self.timeout) as response:
+            return json.loads(response.read())
@@ -0,0 +1,233 @@
+import argparse
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from data_processing.data_loader import DataLoader
+from data_processing.name_resolver import NameResolver, normalise_name
+
+
+class CorpusIndex:
+    """
+    In-memory lookup tables built from a single streamed pass over a DrugBank XML
+    file. Drug names, targets and interactions are read from each <drug> element
+    before it is released.
+    """
+
+    def __init__(self, xml_file: str):
+        self.xml_file = xml_file
+        data_loader = DataLoader(xml_file)
+        fields = frozenset(["name", "synonyms"])
+
+        self.drug_names = {}
+        self.drug_synonyms = {}
+        self.interactions = {}
+        drugs = []
+        names = defaultdict(set)
+        genes = defaultdict(set)
+        for element, ns in data_loader.iter_drug_elements():
+            drug = data_loader._parse_drug(element, ns, fields)
+            drugs.append(drug)
+            self.drug_names[drug.drug_id] = drug.name
+            synonyms = [s for s in drug.synonyms if s != "None"]
+            self.drug_synonyms[drug.drug_id] = synonyms
+            for name in [drug.name, *synonyms]:
+                if name:
+                    names[normalise_name(name)].add(drug.drug_id)
+            for target in data_loader._parse_targets(element, ns):
+                genes[target.polypeptide.gene_name].add(target.drug_id)
+            for interaction in data_loader._parse_interactions(element, ns):
+                self.interactions[(interaction.drug_id, interaction.partner_id)] = (
+                    interaction.description
+                )
+        self.names = {name: sorted(ids) for name, ids in names.items()}
+        self.genes = {gene: sorted(ids) for gene, ids in genes.items()}
+        self.resolver = NameResolver.from_drugs(drugs)
+
+    def lookup_name(self, name: str) -> list:
+        """Returns the DrugBank IDs whose name or synonym matches the given name."""
+        return self.names.get(normalise_name(name), [])
+
+    def resolve(self, name: str) -> dict:
+        """Resolves a free-text name to a single DrugBank ID, allowing fuzzy matches."""
+        drug_id, matched_name, score = self.resolver.resolve(name)
+        return {"drugbank_id": drug_id, "matched_name": matched_name, "score": score}
+
+    def synonyms(self, drug_id: str) -> list:
+        """Returns the synonyms of the drug with the given DrugBank ID."""
+        return self.drug_synonyms.get(drug_id, [])
+
+    def drugs_for_gene(self, gene_name: str) -> list:
+        """Returns the DrugBank IDs of drugs targeting a polypeptide with the given gene name."""
+        return self.genes.get(gene_name, [])
+
+    def interaction(self, drug_id: str, other_id: str) -> str:
+        """Returns the description of the interaction between two drugs, or None."""
+        description = self.interactions.get((drug_id, other_id))
+        if description is None:
+            description = self.interactions.get((other_id, drug_id))
+        return description
+
+
+class QueryServer(ThreadingHTTPServer):
+    """
+    HTTP server answering lookups from a CorpusIndex held in memory.
+
+    A reload builds the new index in a background thread and swaps it in once it is
+    complete, so requests keep being answered from the old index in the meantime.
+    Only files inside the data directory can be reloaded.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        xml_file: str,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        data_dir: str = None,
+    ):
+        # Defaults to the directory of the served file.
+        self.data_dir = os.path.realpath(data_dir or os.path.dirname(xml_file) or ".")
+        self.index = CorpusIndex(xml_file)
+        self.reloading = False
+        # Error of the last failed reload and when it happened, cleared on success.
+        self.reload_error = None
+        self.reload_error_time = None
+        self._reload_lock = threading.Lock()
+        super().__init__((host, port), QueryRequestHandler)
+
+    def reload(self, xml_file: str = None) -> bool:
+        """
+        Starts rebuilding the index from a new XML file in a background thread.
+
+        Args:
+            xml_file (str, optional): Path to the new release. Defaults to the current file.
+
+        Raises:
+            ValueError: If the file is outside the data directory.
+
+        Returns:
+            bool: False if another reload is still running; True otherwise.
+        """
+        if xml_file is not None:
+            path = os.path.realpath(xml_file)
+            if os.path.commonpath([path, self.data_dir]) != self.data_dir:
+                raise ValueError(f"{xml_file} is outside the data directory.")
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+        self.reloading = True
+        thread = threading.Thread(
+            target=self._reload, args=(xml_file or self.index.xml_file,), daemon=True
+        )
+        thread.start()
+        return True
+
+    def _reload(self, xml_file: str):
+        try:
+            self.index = CorpusIndex(xml_file)
+            self.reload_error = None
+            self.reload_error_time = None
+        except Exception as e:
+            # The client already got 202, so the error is reported by /health.
+            self.reload_error = f"{type(e).__name__}: {e}"
+            self.reload_error_time = time.time()
+        finally:
+            self.reloading = False
+            self._reload_lock.release()
+
+
+class QueryRequestHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        index = self.server.index
+
+        try:
+            if url.path == "/health":
+                body = {
+                    "xml_file": index.xml_file,
+                    "drugs": len(index.drug_names),
+                    "reloading": self.server.reloading,
+                    "reload_error": self.server.reload_error,
+                    "reload_error_time": self.server.reload_error_time,
+                }
+            elif url.path == "/name":
+                body = {"drugbank_ids": index.lookup_name(params["name"])}
+            elif url.path == "/resolve":
+                body = index.resolve(params["name"])
+            elif url.path == "/synonyms":
+                body = {"synonyms": index.synonyms(params["drug_id"])}
+            elif url.path == "/gene":
+                body = {"drugbank_ids": index.drugs_for_gene(params["gene"])}
+            elif url.path == "/interaction":
+                body = {"description": index.interaction(params["a"], params["b"])}
+            else:
+                self._send_json(404, {"error": f"Unknown path {url.path}."})
+                return
+        except KeyError as e:
+            self._send_json(400, {"error": f"Missing parameter {e.args[0]}."})
+            return
+
+        self._send_json(200, body)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/reload":
+            self._send_json(404, {"error": f"Unknown path {url.path}."})
+            return
+
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        try:
+            started = self.server.reload(params.get("path"))
+        except ValueError as e:
+            self._send_json(403, {"error": str(e)})
+            return
+        if started:
+            self._send_json(202, {"reloading": True})
+        else:
+            self._send_json(409, {"error": "Reload already in progress."})
+
+    def _send_json(self, status: int, body: dict):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description="Serves DrugBank lookups from an in-memory index."
+    )
+    parser.add_argument("--path", type=str, required=True)
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    # Directory of the files which can be reloaded; defaults to that of --path.
+    parser.add_argument("--data_dir", type=str, default=None)
+    args = parser.parse_args()
+    return args
+
+
+def main():
+    args = parse_arguments()
+    server = QueryServer(args.path, args.host, args.port, args.data_dir)
+    print(f"Serving {args.path} on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -51,5 +51,9 @@ class Drug:
             "Drug interactions": self.drug_interactions,
             "Synonyms": self.synonyms,
             "Groups": self.groups,
-            "Products": [product.to_dict() for product in self.products],
+            "Products": (
+                [product.to_dict() for product in self.products]
+                if self.products is not None
+                else None
+            ),
         }
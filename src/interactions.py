@@ -0,0 +1,27 @@
+class Interaction:
+
+    def __init__(
+        self,
+        drug_id: str,
+        partner_id: str,
+        partner_name: str,
+        description: str,
+    ):
+        self.drug_id = drug_id
+        self.partner_id = partner_id
+        self.partner_name = partner_name
+        self.description = description
+
+    def to_dict(self) -> dict:
+        """
+        Converts the Interaction object to a dictionary representation.
+
+        Returns:
+            dict: A dictionary containing the interaction's attributes and their values.
+        """
+        return {
+            "DrugBank ID": self.drug_id,
+            "Partner DrugBank ID": self.partner_id,
+            "Partner Name": self.partner_name,
+            "Interaction Description": self.description,
+        }
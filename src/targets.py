@@ -41,10 +41,13 @@ class Polypeptide:
 
 class Target:
 
-    def __init__(self, id: str, name: str, polypeptide: Polypeptide):
+    def __init__(
+        self, id: str, name: str, polypeptide: Polypeptide, drug_id: str = None
+    ):
         self.id = id
         self.name = name
         self.polypeptide = polypeptide
+        self.drug_id = drug_id
 
     def to_dict(self) -> dict:
         """
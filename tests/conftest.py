@@ -0,0 +1,69 @@
+import pytest
+
+
+def drug_xml(
+    number: int,
+    type: str = "small molecule",
+    state: str = "solid",
+    groups: tuple = (),
+    products: int = 0,
+    targets: int = 0,
+    interactions: int = 0,
+    pathways: int = 0,
+) -> str:
+    """
+    Builds a <drug> element with the DrugBank ID DB<number> and the given numbers of
+    products, targets, drug interactions and pathways. Every drug also has a target
+    without a polypeptide, which is not parsed.
+    """
+    drug_id = f"DB{number:04d}"
+    groups = "".join(f"<group>{group}</group>" for group in groups)
+    products = "".join(
+        f"""<product><name>Prod{number}-{p}</name><labeller>Lab{p}</labeller>
+        <ndc-product-code>{number}-{p}</ndc-product-code><dosage-form>Tablet</dosage-form>
+        <strength>{p}mg</strength><route>Oral</route><country>US</country>
+        <source>FDA</source></product>""" for p in range(products)
+    )
+    targets = "<target><id>BE0</id><name>None</name></target>" + "".join(
+        f"""<target><id>BE{number}{t}</id><name>Target{t}</name>
+        <polypeptide id="P{t}" source="Swiss-Prot"><name>Poly{t}</name>
+        <gene-name>GENE{t}</gene-name><chromosome-location>{t}</chromosome-location>
+        <cellular-location>Membrane</cellular-location>
+        <molecular-weight>1000</molecular-weight></polypeptide></target>"""
+        for t in range(targets)
+    )
+    interactions = "".join(
+        f"""<drug-interaction><drugbank-id>DB{i:04d}</drugbank-id>
+        <name>Drug{i}</name><description>Effect {i}</description></drug-interaction>"""
+        for i in range(interactions)
+    )
+    pathways = "".join(
+        f"""<pathway><smpdb-id>SMP{p}</smpdb-id><name>Path{p}</name>
+        <category>metabolic</category><drugs>
+        <drug><drugbank-id>{drug_id}</drugbank-id></drug>
+        <drug><drugbank-id>DB{p:04d}</drugbank-id></drug></drugs></pathway>"""
+        for p in range(pathways)
+    )
+    return f"""<drug type="{type}">
+    <drugbank-id primary="true">{drug_id}</drugbank-id>
+    <drugbank-id>APRD{number}</drugbank-id><name>Drug{number}</name>
+    <description>Desc</description><groups>{groups}</groups><state>{state}</state>
+    <indication>Ind</indication><mechanism-of-action>MOA</mechanism-of-action>
+    <products>{products}</products><targets>{targets}</targets>
+    <drug-interactions>{interactions}</drug-interactions>
+    <pathways>{pathways}</pathways></drug>"""
+
+
+@pytest.fixture
+def xml_file(tmp_path, drugs):
+    """
+    Writes a DrugBank file with the drugs of the test module's drugs fixture, a list
+    of drug_xml keyword arguments, numbered from DB0000.
+    """
+    path = tmp_path / "drugbank.xml"
+    elements = "".join(drug_xml(number, **drug) for number, drug in enumerate(drugs))
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<drugbank xmlns="http://www.drugbank.ca">{elements}</drugbank>'
+    )
+    return str(path)
@@ -0,0 +1,96 @@
+import pytest
+from data_processing.data_frames import UniversalDataFrame
+from data_processing.data_loader import DataLoader
+from data_processing.field_spec import FIELD_SPEC, spec_columns
+
+pa = pytest.importorskip("pyarrow")
+
+MOCK_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<drugbank xmlns="http://www.drugbank.ca">
+<drug type="small molecule">
+    <drugbank-id primary="true">DB0001</drugbank-id>
+    <name>DrugOne</name>
+    <description>Desc</description>
+    <state>solid</state>
+    <indication>Ind</indication>
+    <mechanism-of-action>MOA</mechanism-of-action>
+    <synonyms>
+        <synonym>One</synonym>
+        <synonym>Uno</synonym>
+    </synonyms>
+    <groups>
+        <group>approved</group>
+    </groups>
+    <pathways>
+        <pathway>
+            <smpdb-id>SMP0001</smpdb-id>
+            <name>Path1</name>
+            <category>metabolic</category>
+            <drugs>
+                <drug><drugbank-id>DB0001</drugbank-id></drug>
+                <drug><drugbank-id>DB0002</drugbank-id></drug>
+            </drugs>
+            <enzymes>
+                <uniprot-id>P12345</uniprot-id>
+            </enzymes>
+        </pathway>
+    </pathways>
+</drug>
+<drug type="biotech">
+    <drugbank-id primary="true">DB0002</drugbank-id>
+    <name>DrugTwo</name>
+    <description>Desc</description>
+    <state>solid</state>
+    <indication>Ind</indication>
+    <mechanism-of-action>MOA</mechanism-of-action>
+</drug>
+</drugbank>"""
+
+
+@pytest.fixture
+def xml_file(tmp_path):
+    path = tmp_path / "drugbank.xml"
+    path.write_bytes(MOCK_XML.encode("utf-8"))
+    return str(path)
+
+
+def test_parse_arrow_tables_types(xml_file):
+    """Test if list fields become list<string> columns and the rest strings."""
+    tables = DataLoader(xml_file).parse_arrow_tables()
+
+    assert set(tables) == set(FIELD_SPEC)
+    drugs = tables["drug"]
+    assert drugs.column_names == spec_columns("drug")
+    assert drugs.schema.field("Synonyms").type == pa.list_(pa.string())
+    assert drugs.schema.field("Name").type == pa.string()
+    assert drugs.column("Synonyms").to_pylist() == [["One", "Uno"], []]
+
+    pathways = tables["pathway"]
+    assert pathways.schema.field("Enzymes").type == pa.list_(pa.string())
+    assert pathways.column("Drugs").to_pylist() == [["DB0001", "DB0002"]]
+    assert tables["product"].num_rows == 0
+
+
+def test_parse_arrow_tables_selected_columns(xml_file):
+    """Test if only the requested columns are returned."""
+    tables = DataLoader(xml_file).parse_arrow_tables(
+        {"drug": ["DrugBank ID", "Groups"]}
+    )
+
+    assert list(tables) == ["drug"]
+    assert tables["drug"].to_pydict() == {
+        "DrugBank ID": ["DB0001", "DB0002"],
+        "Groups": [["approved"], []],
+    }
+
+
+def test_create_arrow_table_is_shared(xml_file):
+    """Test if the same table is handed out again and converts to pandas on request."""
+    udf = UniversalDataFrame(xml_file)
+    table = udf.create_arrow_table("drug")
+
+    assert udf.create_arrow_table("drug") is table
+    df = table.to_pandas()
+    assert list(df["DrugBank ID"]) == ["DB0001", "DB0002"]
+    with pytest.raises(ValueError):
+        udf.create_arrow_table("enzyme")
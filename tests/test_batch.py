@@ -0,0 +1,51 @@
+import asyncio
+import json
+import os
+from batch import output_dirs, run_batch
+
+MOCK_XML = """<drugbank xmlns="http://www.drugbank.ca">
+    <drug type="small molecule">
+        <drugbank-id primary="true">DB0001</drugbank-id>
+        <name>DrugOne</name>
+        <description>Test drug description</description>
+        <groups><group>approved</group></groups>
+        <state>solid</state>
+        <indication>Used for testing</indication>
+        <mechanism-of-action>Test mechanism</mechanism-of-action>
+        <pathways>
+            <pathway>
+                <smpdb-id>SMP0001</smpdb-id>
+                <name>PathwayOne</name>
+                <drugs><drug><drugbank-id>DB0001</drugbank-id></drug></drugs>
+                <category>Metabolic</category>
+            </pathway>
+        </pathways>
+    </drug>
+</drugbank>"""
+
+
+def test_output_dirs_are_unique():
+    """Test if XML files with the same name get separate output directories."""
+    dirs = output_dirs(["a/drugbank.xml", "b/drugbank.xml", "c/other.xml"], "out")
+    assert dirs == [
+        os.path.join("out", "drugbank"),
+        os.path.join("out", "drugbank_2"),
+        os.path.join("out", "other"),
+    ]
+
+
+def test_run_batch(tmp_path):
+    """Test if every file is processed, failures are reported and an index is saved."""
+    good = tmp_path / "good.xml"
+    good.write_text(MOCK_XML)
+    bad = tmp_path / "bad.xml"
+    bad.write_text("<drugbank")
+    output_dir = str(tmp_path / "results")
+
+    results = asyncio.run(run_batch([str(good), str(bad)], output_dir, workers=1))
+
+    assert [entry["status"] for entry in results] == ["ok", "error"]
+    assert results[0]["rows"]["df_drugs"] == 1
+    assert os.path.exists(os.path.join(output_dir, "good", "df_drugs.json"))
+    with open(os.path.join(output_dir, "index.json")) as file:
+        assert json.load(file) == results
@@ -0,0 +1,82 @@
+import json
+import pytest
+import pandas as pd
+from data_processing.chunked_frames import (
+    ChunkedDataFrame,
+    aggregate_counts,
+    export_chunks,
+)
+from data_processing.data_frames import UniversalDataFrame
+
+
+@pytest.fixture
+def drugs():
+    # Varying numbers of products, targets, interactions and pathways.
+    return [
+        dict(
+            products=number % 3,
+            targets=number % 2 + 1,
+            interactions=number % 4,
+            pathways=number % 2,
+        )
+        for number in range(20)
+    ]
+
+
+@pytest.mark.parametrize(
+    "iterator, builder",
+    [
+        ("iter_products_data_frame", "create_products_data_frame"),
+        (
+            "iter_targets_interactions_dataframe",
+            "create_targets_interactions_dataframe",
+        ),
+        ("iter_drug_interactions_data_frame", "create_drug_interactions_data_frame"),
+        (
+            "iter_pathway_interactions_data_frame",
+            "create_pathway_interactions_data_frame",
+        ),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+def test_chunks_match_builders(xml_file, iterator, builder, chunk_size):
+    """Test if the chunks have a fixed size and together equal the full DataFrame."""
+    chunks = list(getattr(ChunkedDataFrame(xml_file, chunk_size), iterator)())
+    expected = getattr(UniversalDataFrame(xml_file), builder)()
+
+    assert all(len(chunk) == chunk_size for chunk in chunks[:-1])
+    assert 0 < len(chunks[-1]) <= chunk_size
+    assert pd.concat(chunks, ignore_index=True).equals(expected)
+
+
+def test_export_chunks(xml_file, tmp_path):
+    """Test if exported JSON Lines contain every row once."""
+    path = tmp_path / "products.jsonl"
+    chunks = ChunkedDataFrame(xml_file, 3).iter_products_data_frame()
+
+    rows = export_chunks(chunks, str(path))
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+
+    assert rows == len(records) == 19
+    assert records[0]["National Drug Code"] == "1-0"
+
+
+def test_aggregate_counts(xml_file):
+    """Test if counting chunk by chunk matches counting the full DataFrame."""
+    udf = UniversalDataFrame(xml_file)
+    expected = udf.create_all_pathways_nr_data_frame(
+        udf.create_pathway_interactions_data_frame()
+    )
+    chunks = ChunkedDataFrame(xml_file, 2).iter_pathway_interactions_data_frame()
+
+    df = aggregate_counts(chunks, ["Drugs"])
+    assert dict(zip(df["Drugs"], df["Count"])) == dict(
+        zip(expected["DrugBank_ID"], expected["Nr_of_pathways"])
+    )
+    assert df["Count"].is_monotonic_decreasing
+
+
+def test_invalid_chunk_size(xml_file):
+    """Test if a non-positive chunk size is rejected."""
+    with pytest.raises(ValueError):
+        ChunkedDataFrame(xml_file, 0)
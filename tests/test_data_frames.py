@@ -145,3 +145,19 @@ def test_approved_not_withdrawn_count(mock_data_loader, expected_count):
     assert (
         "approved" in df["Groups"].values
     ), "Missing 'approved' group in groups DataFrame"
+
+
+def test_builders_request_their_fields(mock_data_loader):
+    """Tests if drugs are parsed lazily, only with the fields the builders need."""
+    udf = UniversalDataFrame("dummy.xml")
+    mock_data_loader.parse_drugs.assert_not_called()
+
+    udf.create_synonyms_data_frame()
+    mock_data_loader.parse_drugs.assert_called_once_with(fields={"synonyms"})
+
+    # Fields parsed before are reused without parsing again.
+    udf.create_nr_of_pathways_data_frame()
+    assert mock_data_loader.parse_drugs.call_count == 1
+
+    udf.create_groups_data_frame()
+    mock_data_loader.parse_drugs.assert_called_with(fields={"synonyms", "groups"})
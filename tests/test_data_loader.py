@@ -90,3 +90,24 @@ def test_empty_xml():
         assert empty_loader.parse_drugs() == []
         assert empty_loader.parse_targets() == []
         assert empty_loader.parse_pathways() == []
+
+
+def test_parse_drugs_fields(mock_dataloader):
+    """Test if only the requested drug fields are parsed."""
+    drugs = mock_dataloader.parse_drugs(fields=["name", "state"])
+    assert drugs[0].drug_id == "DB0001"
+    assert drugs[0].drug_type == "small molecule"
+    assert drugs[0].name == "DrugOne"
+    assert drugs[0].state == "solid"
+    assert drugs[0].description is None
+    assert drugs[0].mechanism_of_action is None
+    # Unparsed lists are None rather than the ["None"] of empty ones.
+    assert drugs[0].synonyms is None
+    assert drugs[0].groups is None
+    assert drugs[0].food_interactions is None
+    assert drugs[0].drug_interactions is None
+    assert drugs[0].products is None
+    assert drugs[0].to_dict()["Products"] is None
+
+    with pytest.raises(ValueError):
+        mock_dataloader.parse_drugs(fields=["name", "unknown"])
@@ -0,0 +1,171 @@
+import pytest
+from data_processing.database import DrugBankDatabase, DatabaseDataFrame
+from data_processing.data_frames import UniversalDataFrame
+from data_processing.summary import CorpusSummary
+
+MOCK_XML = """<drugbank xmlns="http://www.drugbank.ca">
+    <drug type="small molecule">
+        <drugbank-id primary="true">DB0001</drugbank-id>
+        <name>DrugOne</name>
+        <description>Test drug description</description>
+        <groups>
+            <group>approved</group>
+            <group>withdrawn</group>
+        </groups>
+        <state>solid</state>
+        <indication>Used for testing</indication>
+        <mechanism-of-action>Test mechanism</mechanism-of-action>
+        <synonyms>
+            <synonym>One</synonym>
+            <synonym>First</synonym>
+        </synonyms>
+        <products>
+            <product>
+                <name>ProductOne</name>
+                <labeller>LabOne</labeller>
+                <ndc-product-code>0001-001</ndc-product-code>
+                <dosage-form>Tablet</dosage-form>
+                <strength>10 mg</strength>
+                <route>Oral</route>
+                <country>US</country>
+                <source>FDA NDC</source>
+            </product>
+        </products>
+        <drug-interactions>
+            <drug-interaction>
+                <drugbank-id>DB0002</drugbank-id>
+                <name>DrugTwo</name>
+                <description>Increases effect.</description>
+            </drug-interaction>
+        </drug-interactions>
+        <pathways>
+            <pathway>
+                <smpdb-id>SMP0001</smpdb-id>
+                <name>PathwayOne</name>
+                <drugs>
+                    <drug><drugbank-id>DB0001</drugbank-id></drug>
+                    <drug><drugbank-id>DB0002</drugbank-id></drug>
+                </drugs>
+                <category>Metabolic</category>
+            </pathway>
+        </pathways>
+        <targets>
+            <target>
+                <id>T0001</id>
+                <name>TargetOne</name>
+                <polypeptide id="P0001" source="Swiss-Prot">
+                    <name>ProteinOne</name>
+                    <gene-name>GeneOne</gene-name>
+                    <molecular-weight>50000.0</molecular-weight>
+                    <chromosome-location>10</chromosome-location>
+                    <cellular-location>cell membrane</cellular-location>
+                </polypeptide>
+            </target>
+        </targets>
+    </drug>
+    <drug type="biotech">
+        <drugbank-id primary="true">DB0002</drugbank-id>
+        <name>DrugTwo</name>
+        <description>Second drug</description>
+        <state>liquid</state>
+        <indication>Also testing</indication>
+        <mechanism-of-action>Other mechanism</mechanism-of-action>
+    </drug>
+</drugbank>"""
+
+
+@pytest.fixture
+def database(tmp_path):
+    xml_file = tmp_path / "drugbank.xml"
+    xml_file.write_text(MOCK_XML)
+    db_path = str(tmp_path / "drugbank.db")
+    database = DrugBankDatabase(db_path)
+    database.ingest(str(xml_file))
+    yield db_path
+    database.close()
+
+
+def test_ingest_populates_tables(database):
+    """Test if ingest loads every entity into its table."""
+    db = DrugBankDatabase(database)
+    assert len(db.query("SELECT * FROM drugs")) == 2
+    assert len(db.query("SELECT * FROM synonyms")) == 2
+    assert len(db.query("SELECT * FROM products")) == 1
+    assert len(db.query("SELECT * FROM pathway_members")) == 2
+    interactions = db.query("SELECT * FROM interactions")
+    assert interactions["partner_id"].tolist() == ["DB0002"]
+    genes = db.query(
+        "SELECT t.drugbank_id FROM targets t JOIN polypeptides p USING (polypeptide_id)"
+        " WHERE p.gene_name = ?",
+        ("GeneOne",),
+    )
+    assert genes["drugbank_id"].tolist() == ["DB0001"]
+    db.close()
+
+
+def test_ingest_replaces_previous_release(database, tmp_path):
+    """Test if ingesting again does not duplicate rows."""
+    db = DrugBankDatabase(database)
+    db.ingest(str(tmp_path / "drugbank.xml"))
+    assert len(db.query("SELECT * FROM drugs")) == 2
+    db.close()
+
+
+def test_database_data_frame_groups(database):
+    """Test if groups DataFrame counts drugs without groups as 'None'."""
+    df = DatabaseDataFrame(database).create_groups_data_frame()
+    assert dict(zip(df["Groups"], df["Count"])) == {
+        "None": 1,
+        "approved": 1,
+        "withdrawn": 1,
+    }
+
+
+def test_database_data_frame_lists(database):
+    """Test if list columns are rebuilt from child tables."""
+    udf = DatabaseDataFrame(database)
+    pathways = udf.create_pathways_data_frame()
+    assert pathways["Drugs"].tolist() == [["DB0001", "DB0002"]]
+    assert pathways["Enzymes"].tolist() == [["None"]]
+    synonyms = udf.create_synonyms_data_frame()
+    assert synonyms["Synonyms"].tolist() == ["One, First", "None"]
+    nr_pathways = udf.create_nr_of_pathways_data_frame()
+    assert nr_pathways["Nr_of_pathways"].tolist() == [1, 1]
+
+
+def test_database_data_frame_summary_matches_xml(database, tmp_path):
+    """Test if the SQL summary and group masks equal the ones built from the XML."""
+    udf = DatabaseDataFrame(database)
+    expected = CorpusSummary.from_xml(str(tmp_path / "drugbank.xml"))
+    assert udf.create_summary().to_dict() == expected.to_dict()
+    assert udf.create_group_masks().count(all_of=["approved"]) == 1
+    assert (
+        udf.create_group_masks().groups_frame().equals(udf.create_groups_data_frame())
+    )
+
+
+def test_database_data_frame_has_universal_state(database, tmp_path):
+    """Test if DatabaseDataFrame sets every attribute UniversalDataFrame has."""
+    xml_udf = UniversalDataFrame(str(tmp_path / "drugbank.xml"))
+    udf = DatabaseDataFrame(database)
+    assert set(vars(xml_udf)) <= set(vars(udf))
+    assert udf.data_loader is None
+
+
+def test_database_data_frame_products(database):
+    """Test if the product table and cube are built from the products table."""
+    udf = DatabaseDataFrame(database)
+    assert len(udf.create_products_table()) == 1
+    assert udf.create_products_table().by_ndc("0001-001")["Producer"].tolist() == [
+        "LabOne"
+    ]
+    assert udf.create_product_cube().base.sum() == 1
+
+
+def test_database_data_frame_without_entities(database):
+    """Test if XML-only features raise ValueError instead of AttributeError."""
+    udf = DatabaseDataFrame(database)
+    with pytest.raises(ValueError):
+        udf.drugs
+    with pytest.raises(ValueError):
+        udf.create_arrow_table("drug")
@@ -0,0 +1,104 @@
+import pytest
+from data_processing.data_frames import UniversalDataFrame
+from data_processing.data_loader import DataLoader
+from data_processing.drug_filter import DrugFilter
+
+
+@pytest.fixture
+def drugs():
+    # One product, target and interaction each, so filtered entities can be counted.
+    return [
+        dict(
+            type=type,
+            state=state,
+            groups=groups,
+            pathways=pathways,
+            products=1,
+            targets=1,
+            interactions=1,
+        )
+        for type, state, groups, pathways in [
+            ("small molecule", "solid", ["approved"], 1),
+            ("small molecule", "liquid", ["approved", "withdrawn"], 0),
+            ("biotech", "liquid", ["approved"], 2),
+            ("small molecule", "solid", ["investigational"], 0),
+            ("biotech", "gas", [], 1),
+        ]
+    ]
+
+
+@pytest.mark.parametrize(
+    "drug_filter, expected",
+    [
+        (DrugFilter(types=["small molecule"]), ["DB0000", "DB0001", "DB0003"]),
+        (
+            DrugFilter(groups=["approved"], excluded_groups=["withdrawn"]),
+            ["DB0000", "DB0002"],
+        ),
+        (DrugFilter(drug_ids=["DB0004", "DB0001"]), ["DB0001", "DB0004"]),
+        (DrugFilter(states=["liquid"]), ["DB0001", "DB0002"]),
+        (DrugFilter(with_pathways=True), ["DB0000", "DB0002", "DB0004"]),
+        (
+            DrugFilter(types=["small molecule"], groups=["approved"], states=["solid"]),
+            ["DB0000"],
+        ),
+    ],
+)
+def test_filtered_drugs(xml_file, drug_filter, expected):
+    """Test if only matching drugs are parsed, the same as filtering all drugs."""
+    drugs = DataLoader(xml_file, drug_filter).parse_drugs()
+    assert [drug.drug_id for drug in drugs] == expected
+
+    all_drugs = DataLoader(xml_file).parse_drugs()
+    assert [drug.drug_id for drug in all_drugs if drug.drug_id in expected] == expected
+
+
+def test_filter_applies_to_every_entity(xml_file):
+    """Test if targets, pathways, interactions and products follow the filter."""
+    data_loader = DataLoader(xml_file, DrugFilter(types=["biotech"]))
+    assert [target.drug_id for target in data_loader.parse_targets()] == [
+        "DB0002",
+        "DB0004",
+    ]
+    assert len(data_loader.parse_pathways()) == 3
+    assert [i.drug_id for i in data_loader.parse_interactions()] == [
+        "DB0002",
+        "DB0004",
+    ]
+    products = data_loader.parse_products_table().to_frame()
+    assert products["DrugBank ID"].tolist() == ["DB0002", "DB0004"]
+
+
+def test_drugs_by_id_follow_the_filter(xml_file):
+    """Test if drugs read through the offset index are checked against the filter."""
+    data_loader = DataLoader(xml_file, DrugFilter(states=["liquid"]))
+    drugs = data_loader.parse_drugs_by_id(["DB0002", "DB0001"])
+    assert [drug.drug_id for drug in drugs] == ["DB0002", "DB0001"]
+    with pytest.raises(ValueError, match="DB0000"):
+        data_loader.parse_drug("DB0000")
+
+
+def test_rejected_drugs_are_not_built(xml_file, monkeypatch):
+    """Test if Drug objects are only built for matching drugs."""
+    built = []
+    parse_drug = DataLoader._parse_drug
+
+    def counting_parse_drug(self, drug, ns, *args):
+        built.append(drug.find("db:drugbank-id", ns).text)
+        return parse_drug(self, drug, ns, *args)
+
+    monkeypatch.setattr(DataLoader, "_parse_drug", counting_parse_drug)
+    DataLoader(xml_file, DrugFilter(states=["solid"])).parse_drugs()
+    assert built == ["DB0000", "DB0003"]
+
+
+def test_universal_data_frame_with_filter(xml_file):
+    """Test if data frames and the summary only cover the filtered drugs."""
+    udf = UniversalDataFrame(xml_file, DrugFilter(groups=["approved"]))
+    assert udf.create_drugs_basic_informations_df()["DrugBank ID"].tolist() == [
+        "DB0000",
+        "DB0001",
+        "DB0002",
+    ]
+    assert udf.create_summary().nr_of_drugs == 3
+    assert udf.create_product_cube().base.sum() == 3
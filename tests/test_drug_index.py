@@ -0,0 +1,119 @@
+import os
+import stat
+import pytest
+from data_processing.data_loader import DataLoader
+from data_processing.drug_index import (
+    build_drug_index,
+    index_path,
+    load_drug_index,
+)
+
+MOCK_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<drugbank xmlns="http://www.drugbank.ca">
+<drug type="small molecule">
+    <drugbank-id primary="true">DB0001</drugbank-id>
+    <drugbank-id>BTD0001</drugbank-id>
+    <name>DrugOne</name>
+    <description>First drug</description>
+    <state>solid</state>
+    <indication>Used for testing</indication>
+    <mechanism-of-action>Test mechanism</mechanism-of-action>
+    <pathways>
+        <pathway>
+            <smpdb-id>SMP0001</smpdb-id>
+            <drugs>
+                <drug><drugbank-id>DB0002</drugbank-id></drug>
+            </drugs>
+        </pathway>
+    </pathways>
+</drug>
+<drug type="biotech">
+    <drugbank-id primary="true">DB0002</drugbank-id>
+    <name>DrugTwo</name>
+    <description>Second drug</description>
+    <state>liquid</state>
+    <indication>Also testing</indication>
+    <mechanism-of-action>Other mechanism</mechanism-of-action>
+    <drug-interactions>
+        <drug-interaction>
+            <drugbank-id>DB0001</drugbank-id>
+            <name>DrugOne</name>
+            <description>Increases effect.</description>
+        </drug-interaction>
+    </drug-interactions>
+</drug>
+</drugbank>"""
+
+
+@pytest.fixture
+def xml_file(tmp_path):
+    path = tmp_path / "drugbank.xml"
+    path.write_bytes(MOCK_XML.encode("utf-8"))
+    return str(path)
+
+
+def test_build_drug_index_skips_nested_drugs(xml_file):
+    """Test if only top-level drugs are indexed and byte ranges cover whole elements."""
+    index = build_drug_index(xml_file)
+    assert list(index) == ["DB0001", "DB0002"]
+
+    data = MOCK_XML.encode("utf-8")
+    for offset, length in index.values():
+        fragment = data[offset : offset + length]
+        assert fragment.startswith(b"<drug ")
+        assert fragment.endswith(b"</drug>")
+
+
+def test_load_drug_index_persists_and_rebuilds(xml_file):
+    """Test if the index is saved next to the file and rebuilt when the file changes."""
+    index = load_drug_index(xml_file)
+    assert os.path.exists(index_path(xml_file))
+    assert load_drug_index(xml_file) == index
+
+    with open(xml_file, "wb") as file:
+        file.write(MOCK_XML.replace("DB0002", "DB0003").encode("utf-8"))
+    os.utime(xml_file, (0, 0))
+    assert "DB0003" in load_drug_index(xml_file)
+
+
+def test_load_drug_index_in_read_only_directory(tmp_path, monkeypatch):
+    """Test if drugs are still parsed by ID when the index cannot be saved."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    xml_file = data_dir / "drugbank.xml"
+    xml_file.write_bytes(MOCK_XML.encode("utf-8"))
+    data_dir.chmod(stat.S_IRUSR | stat.S_IXUSR)
+    try:
+        if os.access(data_dir, os.W_OK):
+            # Root ignores directory permissions, so the write error is simulated.
+            builtin_open = open
+
+            def read_only_open(file, mode="r", *args, **kwargs):
+                if "w" in mode:
+                    raise PermissionError(f"Permission denied: {file}")
+                return builtin_open(file, mode, *args, **kwargs)
+
+            monkeypatch.setattr("builtins.open", read_only_open)
+
+        drug = DataLoader(str(xml_file)).parse_drug("DB0002")
+    finally:
+        monkeypatch.undo()
+        data_dir.chmod(stat.S_IRWXU)
+
+    assert drug.name == "DrugTwo"
+    assert not os.path.exists(index_path(str(xml_file)))
+
+
+def test_parse_drugs_by_id(xml_file):
+    """Test if a subset of drugs is parsed in the requested order."""
+    data_loader = DataLoader(xml_file)
+    drugs = data_loader.parse_drugs_by_id(["DB0002", "DB0001"])
+    assert [drug.drug_id for drug in drugs] == ["DB0002", "DB0001"]
+    assert drugs[0].drug_interactions == [{"DrugOne": "Increases effect."}]
+    assert data_loader.parse_drug("DB0001").name == "DrugOne"
+
+
+def test_parse_drug_unknown_id(xml_file):
+    """Test if asking for a missing DrugBank ID raises an error."""
+    with pytest.raises(ValueError):
+        DataLoader(xml_file).parse_drug("DB9999")
@@ -0,0 +1,178 @@
+import pytest
+import xml.etree.ElementTree as ET
+from data_processing.data_loader import DataLoader
+from data_processing.field_spec import (
+    FIELD_SPEC,
+    FieldExtractor,
+    field_path,
+    first_step,
+    spec_columns,
+)
+
+MOCK_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<drugbank xmlns="http://www.drugbank.ca">
+<drug type="small molecule">
+    <drugbank-id primary="true">DB0001</drugbank-id>
+    <drugbank-id>BTD0001</drugbank-id>
+    <name>DrugOne</name>
+    <state>solid</state>
+    <synonyms>
+        <synonym>One</synonym>
+        <synonym>Uno</synonym>
+    </synonyms>
+    <products>
+        <product>
+            <name>Prod1</name>
+            <labeller>Lab1</labeller>
+            <ndc-product-code>111</ndc-product-code>
+        </product>
+    </products>
+    <targets>
+        <target>
+            <id>BE0001</id>
+            <name>Target1</name>
+            <polypeptide id="P1" source="Swiss-Prot">
+                <name>Poly1</name>
+                <gene-name>GENE1</gene-name>
+                <external-identifiers>
+                    <external-identifier>
+                        <resource>HGNC</resource>
+                        <identifier>HGNC:1</identifier>
+                    </external-identifier>
+                    <external-identifier>
+                        <resource>GenAtlas</resource>
+                        <identifier>GA1</identifier>
+                    </external-identifier>
+                </external-identifiers>
+            </polypeptide>
+        </target>
+        <target>
+            <id>BE0002</id>
+            <name>No polypeptide</name>
+        </target>
+    </targets>
+</drug>
+<drug type="biotech">
+    <drugbank-id primary="true">DB0002</drugbank-id>
+    <name>DrugTwo</name>
+    <pathways>
+        <pathway>
+            <smpdb-id>SMP0001</smpdb-id>
+            <name>Path1</name>
+            <drugs>
+                <drug><drugbank-id>DB0001</drugbank-id></drug>
+                <drug><drugbank-id>DB0002</drugbank-id></drug>
+            </drugs>
+        </pathway>
+    </pathways>
+</drug>
+</drugbank>"""
+
+
+@pytest.fixture
+def xml_file(tmp_path):
+    path = tmp_path / "drugbank.xml"
+    path.write_bytes(MOCK_XML.encode("utf-8"))
+    return str(path)
+
+
+def test_extract_fields_reads_all_entities(xml_file):
+    """Test if one pass fills the columns of every entity in the spec."""
+    frames = DataLoader(xml_file).extract_fields()
+
+    assert set(frames) == set(FIELD_SPEC)
+    for entity, df in frames.items():
+        assert list(df.columns) == spec_columns(entity)
+
+    drugs = frames["drug"]
+    assert list(drugs["DrugBank ID"]) == ["DB0001", "DB0002"]
+    assert list(drugs["Type"]) == ["small molecule", "biotech"]
+    assert list(drugs["Synonyms"]) == [["One", "Uno"], ["None"]]
+    assert drugs["Description"].isna().all()
+
+    targets = frames["target"]
+    assert targets.to_dict(orient="records")[0] == {
+        "DrugBank ID": "DB0001",
+        "Target ID": "BE0001",
+        "Target name": "Target1",
+        "Source": "Swiss-Prot",
+        "External ID": "P1",
+        "Polypeptide name": "Poly1",
+        "Gene name": "GENE1",
+        "GenAtlas ID": "GA1",
+        "Chromosome number": None,
+        "Cellular location": None,
+        "Molecular weight": None,
+    }
+    assert len(targets) == 1
+
+    pathways = frames["pathway"]
+    assert list(pathways["DrugBank ID"]) == ["DB0002"]
+    assert list(pathways["Drugs"]) == [["DB0001", "DB0002"]]
+    assert frames["interaction"].empty
+
+
+def test_extract_selected_columns(xml_file):
+    """Test if only the requested columns are extracted, in the requested order."""
+    frames = DataLoader(xml_file).extract_fields(
+        {"product": ["National Drug Code", "DrugBank ID"], "drug": ["Name"]}
+    )
+
+    assert list(frames) == ["product", "drug"]
+    assert frames["product"].to_dict(orient="list") == {
+        "National Drug Code": ["111"],
+        "DrugBank ID": ["DB0001"],
+    }
+    assert list(frames["drug"]["Name"]) == ["DrugOne", "DrugTwo"]
+
+
+def test_custom_spec():
+    """Test if a new column is added by declaring it in a spec."""
+    spec = {"drug": (".", FIELD_SPEC["drug"][1] + [("Primary ID", "db:drugbank-id")])}
+    root = ET.fromstring(MOCK_XML.split("\n", 1)[1])
+    ns = {"db": "http://www.drugbank.ca"}
+
+    df = FieldExtractor({"drug": ["Primary ID"]}, ns, spec).extract(
+        root.findall("db:drug", ns)
+    )["drug"]
+    assert list(df["Primary ID"]) == ["DB0001", "DB0002"]
+
+
+def test_unknown_columns_raise():
+    """Test if unknown entities and columns are rejected."""
+    with pytest.raises(ValueError):
+        FieldExtractor({"enzyme": None})
+    with pytest.raises(ValueError):
+        FieldExtractor({"drug": ["Price"]})
+
+
+def test_parsed_entities_follow_the_spec(xml_file):
+    """Test if Target, Pathway and Drug objects hold the values the spec extracts."""
+    data_loader = DataLoader(xml_file)
+    frames = data_loader.extract_fields()
+
+    targets = data_loader.parse_targets()
+    assert [t.polypeptide.genatlas_id for t in targets] == frames["target"][
+        "GenAtlas ID"
+    ].tolist()
+    pathways = data_loader.parse_pathways()
+    assert [p.drugs for p in pathways] == frames["pathway"]["Drugs"].tolist()
+    drugs = data_loader.parse_drugs(fields=["synonyms"])
+    assert [d.synonyms for d in drugs] == frames["drug"]["Synonyms"].tolist()
+
+
+def test_field_path_and_first_step():
+    """Test if paths are looked up in the spec and their first step is split."""
+    assert field_path("drug", "Groups") == "db:groups/db:group"
+    assert first_step(field_path("drug", "Groups")) == (
+        "{http://www.drugbank.ca}groups",
+        {},
+    )
+    assert first_step(field_path("drug", "DrugBank ID")) == (
+        "{http://www.drugbank.ca}drugbank-id",
+        {"primary": "true"},
+    )
+    with pytest.raises(ValueError):
+        field_path("drug", "Unknown")
+    with pytest.raises(ValueError):
+        first_step("db:drug[1]")
@@ -0,0 +1,147 @@
+import os
+import pandas as pd
+import pytest
+from visualisations import figure_cache
+from visualisations.figure_cache import (
+    FigureCache,
+    InputFile,
+    figure_key,
+    project_dependencies,
+)
+from src.drugs import Drug
+from src.products import Product
+
+calls = []
+
+
+def fake_plot(df: pd.DataFrame, path_to_save: str = None, title: str = ""):
+    calls.append(title)
+    with open(path_to_save, "w") as file:
+        file.write(title + df.to_csv())
+
+
+@pytest.fixture
+def cache(tmp_path):
+    calls.clear()
+    return FigureCache(str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"DrugBank ID": ["DB0001", "DB0002"], "Count": [1, 2]})
+
+
+def test_render_hit_and_miss(cache, df, tmp_path):
+    """Test if identical inputs reuse the cached image, even under another name."""
+    first = tmp_path / "first.png"
+    second = tmp_path / "second.png"
+
+    assert not cache.render(fake_plot, df, path_to_save=str(first))
+    assert cache.render(fake_plot, df.copy(), path_to_save=str(second))
+
+    assert calls == [""]
+    assert second.read_text() == first.read_text()
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.report() == "Figure cache: 1 hits, 1 misses."
+
+
+def test_changed_inputs_miss(cache, df, tmp_path):
+    """Test if changed data or parameters render the plot again."""
+    path = str(tmp_path / "plot.png")
+    cache.render(fake_plot, df, path_to_save=path)
+
+    changed = df.copy()
+    changed.loc[0, "Count"] = 5
+    cache.render(fake_plot, changed, path_to_save=path)
+    cache.render(fake_plot, df, path_to_save=path, title="Other")
+
+    assert calls == ["", "", "Other"]
+    assert cache.misses == 3
+
+
+def test_render_without_path(cache, df):
+    """Test if plots which are only displayed bypass the cache."""
+    drawn = []
+    cache.render(lambda df, path_to_save: drawn.append(path_to_save), df)
+    assert drawn == [None]
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_key_ignores_set_order():
+    """Test if drugs with the same products in another order get the same key."""
+    products = [
+        Product(f"Prod{i}", "Lab", str(i), "Tablet", "Oral", "1mg", "US", "FDA")
+        for i in range(5)
+    ]
+    first = Drug(
+        "Drug", "DB0001", "small molecule", "", "", "", "", [], products=set(products)
+    )
+    second = Drug(
+        "Drug",
+        "DB0001",
+        "small molecule",
+        "",
+        "",
+        "",
+        "",
+        [],
+        products=set(products[::-1]),
+    )
+
+    assert figure_key(fake_plot, ([first],), {}) == figure_key(
+        fake_plot, ([second],), {}
+    )
+
+
+def test_key_tracks_input_files(tmp_path):
+    """Test if a modified input file changes the key, unlike a plain string."""
+    xml = tmp_path / "drugbank.xml"
+    xml.write_text("<drugbank/>")
+    key = figure_key(fake_plot, (InputFile(str(xml)),), {})
+    string_key = figure_key(fake_plot, (str(xml),), {})
+
+    xml.write_text("<drugbank></drugbank>")
+    os.utime(xml, (0, 0))
+    assert figure_key(fake_plot, (InputFile(str(xml)),), {}) != key
+    assert figure_key(fake_plot, (str(xml),), {}) == string_key
+
+
+def test_render_other_files_is_not_cached(cache, df, tmp_path):
+    """Test if plots saved under other names than path_to_save are drawn again."""
+
+    def paged_plot(df, path_to_save=None):
+        calls.append("paged")
+        root, extension = os.path.splitext(path_to_save)
+        with open(f"{root}_1{extension}", "w") as file:
+            file.write(df.to_csv())
+
+    path = str(tmp_path / "plot.png")
+    assert not cache.render(paged_plot, df, path_to_save=path)
+    # An image left at path_to_save by an earlier run is not cached either.
+    cache.render(fake_plot, df, path_to_save=path)
+    assert not cache.render(paged_plot, df, path_to_save=path)
+    assert not cache.render(paged_plot, df, path_to_save=path)
+    assert calls == ["paged", "", "paged", "paged"]
+    assert os.path.exists(tmp_path / "plot_1.png")
+
+
+def test_project_dependencies():
+    """Test if helpers imported from other project modules are found."""
+    paths = project_dependencies("visualisations.charts")
+    names = [os.path.relpath(path, figure_cache.PROJECT_ROOT) for path in paths]
+    assert os.path.join("analysis", "pathway_counts.py") in names
+    assert os.path.join("analysis", "molecular_analysis.py") in names
+    assert not any("matplotlib" in name for name in names)
+
+
+def test_key_tracks_dependencies(tmp_path, monkeypatch):
+    """Test if editing a helper module changes the key."""
+    helper = tmp_path / "helper.py"
+    helper.write_text("def count(df):\n    return len(df)\n")
+    monkeypatch.setattr(
+        figure_cache, "project_dependencies", lambda module_name: [str(helper)]
+    )
+    key = figure_key(fake_plot, (), {})
+
+    helper.write_text("def count(df):\n    return len(df) + 1\n")
+    assert figure_key(fake_plot, (), {}) != key
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+from data_processing.group_masks import KNOWN_GROUPS, GroupMasks
+
+GROUPS = [
+    ["approved"],
+    ["approved", "withdrawn"],
+    ["None"],
+    ["investigational", "experimental"],
+    ["experimental", "orphan"],
+    ["approved", "investigational", "vet_approved"],
+]
+
+
+@pytest.fixture
+def group_masks():
+    drug_ids = [f"DB{number:04d}" for number in range(len(GROUPS))]
+    return GroupMasks.from_groups(drug_ids, GROUPS)
+
+
+def test_masks(group_masks):
+    """Test if known groups get fixed bits, extra groups the next ones and no groups 0."""
+    assert group_masks.names == KNOWN_GROUPS + ["orphan"]
+    assert group_masks.masks.tolist() == [1, 3, 0, 12, 8 | 128, 1 | 4 | 16]
+
+
+def test_queries_match_membership_tests(group_masks):
+    """Test if vectorised queries equal per-drug 'in' checks."""
+    approved_not_withdrawn = group_masks.select(
+        all_of=["approved"], none_of=["withdrawn"]
+    )
+    assert approved_not_withdrawn.tolist() == [
+        "approved" in groups and "withdrawn" not in groups for groups in GROUPS
+    ]
+    either = group_masks.has("investigational") | group_masks.has("experimental")
+    assert either.tolist() == [
+        "investigational" in groups or "experimental" in groups for groups in GROUPS
+    ]
+    assert np.array_equal(
+        either, group_masks.select(any_of=["investigational", "experimental"])
+    )
+    assert group_masks.count(all_of=["approved"], none_of=["withdrawn"]) == 2
+
+
+def test_unknown_group(group_masks):
+    """Test if querying an unknown group raises ValueError."""
+    with pytest.raises(ValueError):
+        group_masks.has("unknown")
+
+
+def test_groups_frame_matches_explode(group_masks):
+    """Test if the counts from the masks equal counting the exploded groups."""
+    expected = pd.DataFrame({"Groups": GROUPS}).explode("Groups").groupby("Groups")
+    df = group_masks.groups_frame()
+    assert dict(zip(df["Groups"], df["Count"])) == expected.size().to_dict()
+    assert df["Groups"].tolist() == sorted(df["Groups"])
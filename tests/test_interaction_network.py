@@ -0,0 +1,69 @@
+import pytest
+from src.interactions import Interaction
+from analysis.interaction_network import InteractionNetwork
+
+# A - B - C - D and a separate pair E - F; A-B listed in both directions.
+PAIRS = [
+    ("A", "B"),
+    ("B", "A"),
+    ("B", "C"),
+    ("C", "D"),
+    ("E", "F"),
+    ("F", "F"),
+]
+
+
+@pytest.fixture
+def network():
+    interactions = [Interaction(a, b, f"Drug {b}", "desc") for a, b in PAIRS]
+    return InteractionNetwork.from_interactions(interactions)
+
+
+def test_adjacency_is_symmetric_and_unweighted(network):
+    """Test if duplicates and self-loops are removed and edges are undirected."""
+    adjacency = network.adjacency
+    assert (adjacency != adjacency.T).nnz == 0
+    assert set(adjacency.data) == {1}
+    assert adjacency.diagonal().sum() == 0
+    assert network.degrees().to_dict() == {
+        "A": 1,
+        "B": 2,
+        "C": 2,
+        "D": 1,
+        "E": 1,
+        "F": 1,
+    }
+
+
+def test_degree_distribution(network):
+    """Test if drugs are counted per degree."""
+    df = network.degree_distribution()
+    assert dict(zip(df["Degree"], df["Nr_of_drugs"])) == {1: 4, 2: 2}
+
+
+def test_top_interacting(network):
+    """Test if the most interacting drugs come first."""
+    df = network.top_interacting(2)
+    assert sorted(df["DrugBank ID"]) == ["B", "C"]
+    assert df["Degree"].tolist() == [2, 2]
+
+
+def test_connected_components(network):
+    """Test if components are labelled with their sizes."""
+    df = network.connected_components().set_index("DrugBank ID")
+    assert df.loc["A", "Component"] == df.loc["D", "Component"]
+    assert df.loc["A", "Component"] != df.loc["E", "Component"]
+    assert df.loc["A", "Component size"] == 4
+    assert df.loc["F", "Component size"] == 2
+
+
+def test_two_hop_neighbourhood(network):
+    """Test if neighbours within two hops are found with their distance."""
+    df = network.two_hop_neighbourhood(["A", "E"])
+    assert list(df.itertuples(index=False, name=None)) == [
+        ("A", "B", 1),
+        ("A", "C", 2),
+        ("E", "F", 1),
+    ]
+    with pytest.raises(ValueError):
+        network.two_hop_neighbourhood(["X"])
@@ -0,0 +1,32 @@
+from src.interactions import Interaction
+
+
+def test_interaction_initialization():
+    """Test initialization of Interaction class."""
+    interaction = Interaction(
+        drug_id="DB0001",
+        partner_id="DB0002",
+        partner_name="Drug B",
+        description="Interaction B",
+    )
+
+    assert interaction.drug_id == "DB0001"
+    assert interaction.partner_id == "DB0002"
+    assert interaction.partner_name == "Drug B"
+    assert interaction.description == "Interaction B"
+
+
+def test_interaction_to_dict():
+    """Test the conversion of Interaction object to a dictionary."""
+    interaction = Interaction(
+        drug_id="DB0001",
+        partner_id="DB0002",
+        partner_name="Drug B",
+        description="Interaction B",
+    )
+    interaction_dict = interaction.to_dict()
+
+    assert interaction_dict["DrugBank ID"] == "DB0001"
+    assert interaction_dict["Partner DrugBank ID"] == "DB0002"
+    assert interaction_dict["Partner Name"] == "Drug B"
+    assert interaction_dict["Interaction Description"] == "Interaction B"
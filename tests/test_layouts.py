@@ -0,0 +1,117 @@
+import networkx as nx
+import numpy as np
+import pytest
+from visualisations.layouts import (
+    LayoutCache,
+    compute_layout,
+    graph_key,
+    layered_tree_layout,
+    radial_star_layout,
+)
+
+
+@pytest.fixture
+def tree():
+    graph = nx.DiGraph()
+    graph.add_edges_from(
+        [
+            ("GENE", "DB0001"),
+            ("GENE", "DB0002"),
+            ("DB0001", "Prod1"),
+            ("DB0001", "Prod2"),
+            ("DB0002", "Prod3"),
+        ]
+    )
+    return graph
+
+
+def test_radial_star_layout():
+    """Test if leaves lie evenly on a circle around the center."""
+    graph = nx.Graph()
+    graph.add_edges_from(("DB0001", f"Synonym{i}") for i in range(6))
+
+    positions = radial_star_layout(graph, "DB0001", radius=2.0)
+
+    assert np.allclose(positions["DB0001"], [0, 0])
+    leaves = np.array([positions[f"Synonym{i}"] for i in range(6)])
+    assert np.allclose(np.linalg.norm(leaves, axis=1), 2.0)
+    assert np.allclose(leaves.sum(axis=0), 0)
+
+
+def test_layered_tree_layout(tree):
+    """Test if layers follow depth and parents are centred above their children."""
+    positions = layered_tree_layout(tree, "GENE")
+
+    assert positions["GENE"][1] == 1
+    assert positions["DB0001"][1] == positions["DB0002"][1] == 0
+    assert positions["Prod1"][1] == positions["Prod3"][1] == -1
+
+    xs = {node: position[0] for node, position in positions.items()}
+    assert xs["Prod1"] < xs["Prod2"] < xs["Prod3"]
+    assert xs["DB0001"] == pytest.approx((xs["Prod1"] + xs["Prod2"]) / 2)
+    assert xs["DB0002"] == pytest.approx(xs["Prod3"])
+    assert xs["GENE"] == pytest.approx(0)
+
+
+def test_layered_tree_layout_unreachable(tree):
+    """Test if nodes not reachable from the root get their own bottom layer."""
+    tree.add_node("Orphan")
+    positions = layered_tree_layout(tree, "GENE")
+    assert positions["Orphan"][1] == -1
+    assert positions["Prod1"][1] == pytest.approx(-1 / 3)
+
+
+def test_layout_cache(tmp_path, tree):
+    """Test if a layout is computed once per graph structure and reused."""
+    calls = []
+
+    def counting_layout(graph, root):
+        calls.append(root)
+        return layered_tree_layout(graph, root)
+
+    cache = LayoutCache(str(tmp_path))
+    first = compute_layout(tree, counting_layout, "GENE", cache=cache)
+    second = compute_layout(tree.copy(), counting_layout, "GENE", cache=cache)
+
+    assert calls == ["GENE"]
+    assert all(np.allclose(first[node], second[node]) for node in tree.nodes)
+
+    tree.add_edge("DB0002", "Prod4")
+    compute_layout(tree, counting_layout, "GENE", cache=cache)
+    assert calls == ["GENE", "GENE"]
+
+
+def test_layout_cache_tracks_source(tmp_path, tree, monkeypatch):
+    """Test if editing the layout function's module invalidates cached layouts."""
+    calls = []
+
+    def counting_layout(graph, root):
+        calls.append(root)
+        return layered_tree_layout(graph, root)
+
+    cache = LayoutCache(str(tmp_path))
+    compute_layout(tree, counting_layout, "GENE", cache=cache)
+    monkeypatch.setattr(
+        "visualisations.layouts._source_digest", lambda function: "edited"
+    )
+    compute_layout(tree, counting_layout, "GENE", cache=cache)
+    assert calls == ["GENE", "GENE"]
+
+
+def test_layout_cache_not_writable(tmp_path, tree):
+    """Test if layouts are still returned when the cache cannot be written."""
+    blocker = tmp_path / "cache"
+    blocker.write_text("not a directory")
+    positions = compute_layout(
+        tree, layered_tree_layout, "GENE", cache=LayoutCache(str(blocker))
+    )
+    assert set(positions) == set(tree.nodes)
+
+
+def test_graph_key_depends_on_structure(tree):
+    """Test if the key changes with edges and with the layout."""
+    key = graph_key(tree, "layered")
+    assert graph_key(tree.copy(), "layered") == key
+    assert graph_key(tree, "star") != key
+    tree.remove_edge("DB0001", "Prod2")
+    assert graph_key(tree, "layered") != key
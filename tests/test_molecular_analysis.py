@@ -0,0 +1,63 @@
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from analysis.molecular_analysis import weight_histograms
+from visualisations.charts import plot_distribution
+
+matplotlib.use("Agg")
+
+
+def make_weights(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    locations = np.array(["Membrane", "Cytoplasm", "Nucleus"])
+    return pd.DataFrame(
+        {
+            "Cellular Location": locations[rng.integers(0, 3, n)],
+            "Molecular Weight": rng.lognormal(10, 0.5, n),
+        }
+    )
+
+
+def test_weight_histograms_match_numpy():
+    """Test if the per-location counts equal numpy histograms with shared edges."""
+    df = make_weights(1000)
+    locations, edges, counts = weight_histograms(df, bins=20)
+
+    assert list(locations) == list(df["Cellular Location"].unique())
+    assert counts.shape == (3, 20)
+    assert counts.sum() == len(df)
+    for location, row in zip(locations, counts):
+        weights = df.loc[df["Cellular Location"] == location, "Molecular Weight"]
+        expected, _ = np.histogram(weights, bins=edges)
+        assert np.array_equal(row, expected)
+
+
+@pytest.mark.parametrize(
+    "max_points, style", [(5000, "violin"), (10, "violin"), (10, "heatmap")]
+)
+def test_plot_distribution_modes(tmp_path, max_points, style):
+    """Test if the strip plot and both aggregated modes are saved and closed."""
+    df = make_weights(200)
+    targets = [
+        MagicMock(
+            polypeptide=MagicMock(
+                cellular_location=location, molecular_weight=str(weight)
+            )
+        )
+        for location, weight in df.itertuples(index=False)
+    ]
+    path = tmp_path / "distribution.png"
+    open_figures = plt.get_fignums()
+
+    plot_distribution(targets, str(path), max_points=max_points, style=style)
+    assert path.exists()
+    assert plt.get_fignums() == open_figures
+
+
+def test_plot_distribution_unknown_style(tmp_path):
+    """Test if an unknown style is rejected."""
+    with pytest.raises(ValueError):
+        plot_distribution([], str(tmp_path / "plot.png"), style="scatter")
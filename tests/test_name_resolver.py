@@ -0,0 +1,65 @@
+import pytest
+from src.drugs import Drug
+from data_processing.name_resolver import NameResolver, normalise_name
+
+
+def make_drug(drug_id, name, synonyms):
+    return Drug(
+        name=name,
+        drug_id=drug_id,
+        drug_type="small molecule",
+        description="",
+        state="solid",
+        indication="",
+        mechanism_of_action="",
+        drug_interactions=[],
+        synonyms=synonyms,
+    )
+
+
+@pytest.fixture
+def resolver():
+    drugs = [
+        make_drug("DB00001", "Lepirudin", ["Hirudin variant-1", "Refludan"]),
+        make_drug("DB00002", "Cetuximab", ["Erbitux", "Lepirudin"]),
+        make_drug("DB00003", "Dornase alfa", None),
+    ]
+    return NameResolver.from_drugs(drugs)
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("  Hirudin   Variant-1 ", "hirudin variant 1"),
+        ("Dornase-alfa", "dornase alfa"),
+        ("Cafés", "cafes"),
+    ],
+)
+def test_normalise_name(name, expected):
+    """Test if case, accents and punctuation are normalised."""
+    assert normalise_name(name) == expected
+
+
+def test_resolve_exact(resolver):
+    """Test if names, synonyms and IDs resolve exactly, preferring drug names."""
+    assert resolver.resolve("REFLUDAN") == ("DB00001", "refludan", 1.0)
+    assert resolver.resolve("db00003")[0] == "DB00003"
+    assert resolver.resolve("lepirudin")[0] == "DB00001"
+
+
+def test_resolve_fuzzy(resolver):
+    """Test if misspelled names resolve through trigram similarity."""
+    drug_id, matched_name, score = resolver.resolve("Cetuximabb")
+    assert drug_id == "DB00002"
+    assert matched_name == "cetuximab"
+    assert 0.5 < score < 1.0
+    assert resolver.resolve("Cetuximabb", min_similarity=1.0)[0] is None
+    assert resolver.resolve("paracetamol") == (None, None, 0.0)
+
+
+def test_resolve_batch(resolver):
+    """Test if batch resolution keeps input order and repeated names."""
+    df = resolver.resolve_batch(["Erbitux", "unknown drug", "erbitux", "Dornase alfa"])
+    assert list(df.columns) == ["Name", "DrugBank ID", "Matched name", "Score"]
+    assert df["DrugBank ID"].tolist() == ["DB00002", None, "DB00002", "DB00003"]
+    assert df["Score"].tolist()[1] == 0.0
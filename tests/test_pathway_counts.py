@@ -0,0 +1,96 @@
+import matplotlib
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+from analysis.pathway_counts import (
+    paginate,
+    pathway_count_distribution,
+    top_pathway_counts,
+)
+from visualisations.charts import (
+    plot_pathways_horizontal_histogram,
+    plot_pathways_vertical_histogram,
+)
+
+matplotlib.use("Agg")
+
+
+@pytest.fixture
+def counts():
+    return pd.DataFrame(
+        {
+            "DrugBank_ID": [f"DB{i:04d}" for i in range(10)],
+            "Nr_of_pathways": [3, 0, 7, 3, 1, 7, 2, 0, 3, 1],
+        }
+    )
+
+
+def test_top_pathway_counts(counts):
+    """Test if the drugs with most pathways are kept, ties ordered by ID."""
+    df = top_pathway_counts(counts, 4)
+    assert list(df["DrugBank_ID"]) == ["DB0002", "DB0005", "DB0000", "DB0003"]
+    assert list(df["Nr_of_pathways"]) == [7, 7, 3, 3]
+
+
+def test_pathway_count_distribution(counts):
+    """Test if drugs are counted per number of pathways, with empty bins kept."""
+    df = pathway_count_distribution(counts)
+    assert list(df["Nr_of_pathways"]) == [str(i) for i in range(8)]
+    assert list(df["Nr_of_drugs"]) == [2, 2, 1, 3, 0, 0, 0, 2]
+
+
+def test_pathway_count_distribution_ranges(counts):
+    """Test if wide ranges of pathway numbers are grouped into max_bins bins."""
+    df = pathway_count_distribution(counts, max_bins=3)
+    assert list(df["Nr_of_pathways"]) == ["0-2", "3-5", "6-8"]
+    assert list(df["Nr_of_drugs"]) == [5, 3, 2]
+    assert df["Nr_of_drugs"].sum() == len(counts)
+
+
+def test_paginate(counts):
+    """Test if pages have page_size rows and cover the DataFrame in order."""
+    pages = paginate(counts, 4)
+    assert [len(page) for page in pages] == [4, 4, 2]
+    assert pd.concat(pages, ignore_index=True).equals(counts)
+    with pytest.raises(ValueError):
+        paginate(counts, 0)
+
+
+@pytest.mark.parametrize(
+    "plot", [plot_pathways_vertical_histogram, plot_pathways_horizontal_histogram]
+)
+@pytest.mark.parametrize("mode", ["auto", "all", "top", "binned"])
+def test_histogram_modes(tmp_path, counts, plot, mode):
+    """Test if every single-image mode saves a plot."""
+    path = tmp_path / "histogram.png"
+    plot(counts, str(path), mode=mode, top_n=3)
+    assert path.exists()
+
+
+def test_histogram_pages(tmp_path, counts):
+    """Test if pages mode saves one numbered image per page and closes them."""
+    open_figures = plt.get_fignums()
+    plot_pathways_vertical_histogram(
+        counts, str(tmp_path / "histogram.png"), mode="pages", page_size=4
+    )
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "histogram_1.png",
+        "histogram_2.png",
+        "histogram_3.png",
+    ]
+    assert plt.get_fignums() == open_figures
+    with pytest.raises(ValueError):
+        plot_pathways_vertical_histogram(counts, None, mode="stacked")
+
+
+def test_auto_mode_reports_top_n(tmp_path, capsys, monkeypatch):
+    """Test if auto mode says so when it only draws the top drugs."""
+    monkeypatch.setattr("visualisations.charts.MAX_BARS", 5)
+    counts = pd.DataFrame(
+        {
+            "DrugBank_ID": [f"DB{i:04d}" for i in range(10)],
+            "Nr_of_pathways": range(10),
+        }
+    )
+    plot_pathways_vertical_histogram(counts, str(tmp_path / "h.png"), top_n=3)
+    assert "drawing only the 3 drugs" in capsys.readouterr().out
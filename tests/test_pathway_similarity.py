@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+from analysis.pathway_similarity import PathwaySimilarity
+
+
+@pytest.fixture
+def similarity():
+    df = pd.DataFrame(
+        {
+            "Pathway_ID": ["P1", "P1", "P1", "P2", "P2", "P3", "P3", "P4"],
+            "Name": ["n"] * 8,
+            "Drugs": ["A", "B", "C", "A", "B", "A", "D", "None"],
+        }
+    )
+    return PathwaySimilarity(df)
+
+
+def test_incidence_matrix(similarity):
+    """Test if the incidence matrix has one row per drug and skips placeholders."""
+    assert list(similarity.drug_ids) == ["A", "B", "C", "D"]
+    assert similarity.incidence.shape == (4, 3)
+    assert similarity.nr_of_pathways.tolist() == [3, 2, 1, 1]
+
+
+def test_neighbours(similarity):
+    """Test if neighbours are ranked by Jaccard similarity with shared counts."""
+    df = similarity.neighbours("A")
+    assert df["Neighbour DrugBank ID"].tolist() == ["B", "C", "D"]
+    assert df["Shared pathways"].tolist() == [2, 1, 1]
+    assert df["Jaccard"].tolist() == pytest.approx([2 / 3, 1 / 3, 1 / 3])
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 100])
+def test_top_k_neighbours_blockwise(similarity, block_size):
+    """Test if the block size does not change the result."""
+    df = similarity.top_k_neighbours(k=1, block_size=block_size)
+    assert dict(zip(df["DrugBank ID"], df["Neighbour DrugBank ID"])) == {
+        "A": "B",
+        "B": "A",
+        "C": "B",
+        "D": "A",
+    }
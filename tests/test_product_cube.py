@@ -0,0 +1,103 @@
+import pandas as pd
+import pytest
+from data_processing.data_frames import UniversalDataFrame
+from data_processing.product_cube import ProductCube
+
+COLUMNS = [
+    "DrugBank ID",
+    "Product Name",
+    "Producer",
+    "Country",
+    "Agency",
+    "Method of application",
+    "Form",
+]
+ROWS = [
+    ("DB1", "A", "Lab1", "US", "FDA", "Oral", "Tablet"),
+    ("DB1", "B", "Lab1", "US", "FDA", "Oral", "Capsule"),
+    ("DB2", "C", "Lab2", "Canada", "DPD", "Oral", "Tablet"),
+    ("DB2", "D", "Lab1", None, "DPD", "Topical", "Cream"),
+    ("DB3", "E", "Lab2", "US", "FDA", "Oral", "Tablet"),
+]
+
+
+@pytest.fixture
+def products():
+    return pd.DataFrame(ROWS, columns=COLUMNS)
+
+
+def as_dict(df, by):
+    return {tuple(row[:-1]): row[-1] for row in df[by + ["Count"]].values.tolist()}
+
+
+def test_query_rollup(products):
+    """Test if grouped counts match a groupby over the products."""
+    cube = ProductCube.from_frame(products)
+    df = cube.query(["Country", "Form"])
+    assert as_dict(df, ["Country", "Form"]) == {
+        ("Canada", "Tablet"): 1,
+        ("None", "Cream"): 1,
+        ("US", "Capsule"): 1,
+        ("US", "Tablet"): 2,
+    }
+
+
+def test_query_with_filters(products):
+    """Test if filters on drug and labeller use the finest grain."""
+    cube = ProductCube.from_frame(products)
+    df = cube.query(["Agency"], where={"Producer": "Lab1"})
+    assert as_dict(df, ["Agency"]) == {("DPD",): 1, ("FDA",): 2}
+    total = cube.query([], where={"DrugBank ID": ["DB1", "DB3"]})
+    assert total["Count"].tolist() == [3]
+    with pytest.raises(ValueError):
+        cube.query(["Strength"])
+
+
+def test_update_adds_and_replaces_drugs(products):
+    """Test if incremental updates give the same cube as building from scratch."""
+    cube = ProductCube.from_frame(products[products["DrugBank ID"] != "DB3"])
+    cube.update(products[products["DrugBank ID"] == "DB3"])
+    expected = ProductCube.from_frame(products)
+    assert cube.base.sort_index().equals(expected.base.sort_index())
+
+    cube.update(products.iloc[[0]])
+    assert cube.query([], where={"DrugBank ID": "DB1"})["Count"].tolist() == [1]
+    assert cube.query(["Form"], where={"Form": "Capsule"}).empty
+
+
+def test_save_and_load(products, tmp_path):
+    """Test if a saved cube is reloaded, unless its source file changed."""
+    source = tmp_path / "drugbank.xml"
+    source.write_text("<drugbank/>")
+    path = str(tmp_path / "cube.json")
+
+    ProductCube.from_frame(products).save(path, str(source))
+    loaded = ProductCube.load(path, str(source))
+    assert as_dict(loaded.query(["Country"]), ["Country"]) == {
+        ("Canada",): 1,
+        ("None",): 1,
+        ("US",): 3,
+    }
+
+    source.write_text("<drugbank></drugbank>")
+    assert ProductCube.load(path, str(source)) is None
+
+
+def test_cube_not_cached_when_saving_fails(tmp_path, monkeypatch):
+    """Test if a cube is still built when its file cannot be written."""
+    xml_file = tmp_path / "drugbank.xml"
+    xml_file.write_text(
+        """<drugbank xmlns="http://www.drugbank.ca"><drug type="biotech">
+        <drugbank-id primary="true">DB0001</drugbank-id><name>One</name>
+        <products><product><name>P</name><labeller>L</labeller>
+        <ndc-product-code>1</ndc-product-code><dosage-form>Tablet</dosage-form>
+        <strength>1mg</strength><route>Oral</route><country>US</country>
+        <source>FDA</source></product></products></drug></drugbank>"""
+    )
+
+    def read_only(*args, **kwargs):
+        raise PermissionError("Read-only file system")
+
+    monkeypatch.setattr(ProductCube, "save", read_only)
+    cube = UniversalDataFrame(str(xml_file)).create_product_cube()
+    assert cube.base.sum() == 1
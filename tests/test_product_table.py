@@ -0,0 +1,41 @@
+import pytest
+from data_processing.product_table import PRODUCT_COLUMNS, ProductTable
+
+ROWS = [
+    ("DB1", "Prod A", "Lab1", "0001-01", "Tablet", "Oral", "10 mg", "US", "FDA"),
+    ("DB1", "Prod A", "Lab1", "0001-01", "Tablet", "Oral", "10 mg", "US", "FDA"),
+    ("DB2", "Prod A", "Lab1", "0001-01", "Tablet", "Oral", "10 mg", "US", "FDA"),
+    ("DB2", "Prod B", "Lab2", None, "Cream", "Topical", "1%", "Canada", "DPD"),
+    ("DB3", "Prod C", "Lab1", "0003-01", "Tablet", "Oral", "5 mg", "Canada", "DPD"),
+]
+
+
+@pytest.fixture
+def table():
+    columns = {
+        column: [row[i] for row in ROWS] for i, column in enumerate(PRODUCT_COLUMNS)
+    }
+    return ProductTable.from_columns(columns)
+
+
+def test_duplicates_removed_per_drug(table):
+    """Test if identical products are kept once per drug, in input order."""
+    df = table.to_frame()
+    assert list(df.columns) == PRODUCT_COLUMNS
+    assert len(table) == 4
+    assert df["DrugBank ID"].tolist() == ["DB1", "DB2", "DB2", "DB3"]
+
+
+@pytest.mark.parametrize(
+    "method,value,expected_ids",
+    [
+        ("by_labeller", "Lab1", ["DB1", "DB2", "DB3"]),
+        ("by_country", "Canada", ["DB2", "DB3"]),
+        ("by_ndc", "0001-01", ["DB1", "DB2"]),
+        ("by_ndc", "9999-99", []),
+    ],
+)
+def test_index_lookups(table, method, value, expected_ids):
+    """Test if index lookups return all matching products."""
+    df = getattr(table, method)(value)
+    assert df["DrugBank ID"].tolist() == expected_ids
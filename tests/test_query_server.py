@@ -0,0 +1,156 @@
+import threading
+import time
+from urllib.error import HTTPError
+import pytest
+from data_processing.data_loader import DataLoader
+from service.query_server import CorpusIndex, QueryServer
+from service.query_client import QueryClient
+
+MOCK_XML = """<drugbank xmlns="http://www.drugbank.ca">
+    <drug type="small molecule">
+        <drugbank-id primary="true">DB0001</drugbank-id>
+        <name>DrugOne</name>
+        <description>Test drug description</description>
+        <state>solid</state>
+        <indication>Used for testing</indication>
+        <mechanism-of-action>Test mechanism</mechanism-of-action>
+        <synonyms>
+            <synonym>First  Drug</synonym>
+        </synonyms>
+        <drug-interactions>
+            <drug-interaction>
+                <drugbank-id>DB0002</drugbank-id>
+                <name>DrugTwo</name>
+                <description>Increases effect.</description>
+            </drug-interaction>
+        </drug-interactions>
+        <targets>
+            <target>
+                <id>T0001</id>
+                <name>TargetOne</name>
+                <polypeptide id="P0001" source="Swiss-Prot">
+                    <name>ProteinOne</name>
+                    <gene-name>GeneOne</gene-name>
+                    <molecular-weight>50000.0</molecular-weight>
+                    <chromosome-location>10</chromosome-location>
+                    <cellular-location>cell membrane</cellular-location>
+                </polypeptide>
+            </target>
+        </targets>
+    </drug>
+</drugbank>"""
+
+
+@pytest.fixture
+def xml_file(tmp_path):
+    path = tmp_path / "drugbank.xml"
+    path.write_text(MOCK_XML)
+    return str(path)
+
+
+@pytest.fixture
+def client(xml_file):
+    server = QueryServer(xml_file, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield QueryClient(port=server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+def test_corpus_index_lookups(xml_file):
+    """Test if the index answers name, gene and interaction lookups."""
+    index = CorpusIndex(xml_file)
+    assert index.lookup_name("first drug") == ["DB0001"]
+    assert index.lookup_name("DRUGONE") == ["DB0001"]
+    assert index.drugs_for_gene("GeneOne") == ["DB0001"]
+    assert index.interaction("DB0002", "DB0001") == "Increases effect."
+    assert index.interaction("DB0001", "DB0003") is None
+
+
+def test_client_queries(client):
+    """Test if the client receives answers from a running server."""
+    assert client.lookup_name("DrugOne") == ["DB0001"]
+    assert client.synonyms("DB0001") == ["First  Drug"]
+    assert client.resolve("Drug Onee")["drugbank_id"] == "DB0001"
+    assert client.drugs_for_gene("GeneOne") == ["DB0001"]
+    assert client.interaction("DB0001", "DB0002") == "Increases effect."
+    assert client.health()["drugs"] == 1
+
+
+def test_hot_reload(client, xml_file, tmp_path):
+    """Test if a reload swaps in a new release while the server keeps running."""
+    new_file = tmp_path / "drugbank_new.xml"
+    new_file.write_text(MOCK_XML.replace("DrugOne", "DrugRenamed"))
+
+    assert client.reload(str(new_file))
+    for _ in range(100):
+        if not client.health()["reloading"]:
+            break
+        time.sleep(0.05)
+
+    assert client.health()["xml_file"] == str(new_file)
+    assert client.lookup_name("DrugRenamed") == ["DB0001"]
+    assert client.lookup_name("DrugOne") == []
+
+
+def test_failed_reload_is_reported(client, xml_file, tmp_path):
+    """Test if a reload from a missing file keeps the old index and reports the error."""
+    assert client.reload(str(tmp_path / "missing.xml"))
+    for _ in range(100):
+        if not client.health()["reloading"]:
+            break
+        time.sleep(0.05)
+
+    health = client.health()
+    assert health["xml_file"] == xml_file
+    assert health["reload_error"].startswith("FileNotFoundError")
+    assert health["reload_error_time"] is not None
+    assert client.lookup_name("DrugOne") == ["DB0001"]
+
+    assert client.reload()
+    for _ in range(100):
+        if not client.health()["reloading"]:
+            break
+        time.sleep(0.05)
+    assert client.health()["reload_error"] is None
+
+
+def test_corpus_index_is_built_in_one_pass(xml_file, monkeypatch):
+    """Test if the index streams the file once instead of parsing each entity."""
+    passes = []
+    iter_drug_elements = DataLoader.iter_drug_elements
+
+    def counting_iter_drug_elements(self):
+        passes.append(self.xml_data)
+        return iter_drug_elements(self)
+
+    def no_parse(self, *args, **kwargs):
+        raise AssertionError("The index should be built from a single pass.")
+
+    monkeypatch.setattr(DataLoader, "iter_drug_elements", counting_iter_drug_elements)
+    for method in ("parse_drugs", "parse_targets", "parse_interactions"):
+        monkeypatch.setattr(DataLoader, method, no_parse)
+
+    index = CorpusIndex(xml_file)
+    assert passes == [xml_file]
+    assert index.lookup_name("DrugOne") == ["DB0001"]
+    assert index.drugs_for_gene("GeneOne") == ["DB0001"]
+    assert index.interaction("DB0001", "DB0002") == "Increases effect."
+
+
+def test_reload_outside_data_directory_is_rejected(client, xml_file, tmp_path):
+    """Test if files outside the data directory cannot be loaded by the server."""
+    other_dir = tmp_path.parent / f"{tmp_path.name}_other"
+    other_dir.mkdir()
+    outside = other_dir / "drugbank.xml"
+    outside.write_text(MOCK_XML)
+
+    for path in (str(outside), str(tmp_path / ".." / other_dir.name / "drugbank.xml")):
+        with pytest.raises(HTTPError) as error:
+            client.reload(path)
+        assert error.value.code == 403
+
+    health = client.health()
+    assert health["xml_file"] == xml_file
+    assert not health["reloading"]
@@ -0,0 +1,161 @@
+import sys
+import pytest
+from data_processing.data_loader import DataLoader
+from data_processing.release_diff import diff_releases, fingerprint_release, main
+
+OLD_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<drugbank xmlns="http://www.drugbank.ca">
+<drug type="small molecule">
+    <drugbank-id primary="true">DB0001</drugbank-id>
+    <name>DrugOne</name>
+    <state>solid</state>
+    <products>
+        <product>
+            <name>Prod1</name>
+            <labeller>Lab1</labeller>
+            <ndc-product-code>111</ndc-product-code>
+        </product>
+        <product>
+            <name>Prod2</name>
+            <labeller>Lab2</labeller>
+            <ndc-product-code>222</ndc-product-code>
+        </product>
+    </products>
+    <targets>
+        <target>
+            <id>BE0001</id>
+            <name>Target1</name>
+        </target>
+    </targets>
+    <pathways>
+        <pathway>
+            <smpdb-id>SMP0001</smpdb-id>
+            <drugs>
+                <drug><drugbank-id>DB0002</drugbank-id></drug>
+            </drugs>
+        </pathway>
+    </pathways>
+    <drug-interactions>
+        <drug-interaction>
+            <drugbank-id>DB0002</drugbank-id>
+            <description>Increases effect.</description>
+        </drug-interaction>
+    </drug-interactions>
+</drug>
+<drug type="biotech">
+    <drugbank-id primary="true">DB0002</drugbank-id>
+    <name>DrugTwo</name>
+    <targets>
+        <target>
+            <id>BE0002</id>
+            <name>Target2</name>
+        </target>
+    </targets>
+</drug>
+</drugbank>"""
+
+# DB0001: description of Prod1 changed, Prod2 removed, one product without NDC added,
+# target and pathway unchanged, interaction text changed, reformatted whitespace.
+# DB0002 removed, DB0003 added.
+NEW_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<drugbank xmlns="http://www.drugbank.ca">
+<drug type="small molecule"><drugbank-id primary="true">DB0001</drugbank-id>
+    <name>  DrugOne  </name>
+    <state>solid</state>
+    <products>
+        <product>
+            <name>Prod1 Forte</name>
+            <labeller>Lab1</labeller>
+            <ndc-product-code>111</ndc-product-code>
+        </product>
+        <product>
+            <name>Prod3</name>
+            <labeller>Lab3</labeller>
+        </product>
+    </products>
+    <targets><target><id>BE0001</id><name>Target1</name></target></targets>
+    <pathways>
+        <pathway>
+            <smpdb-id>SMP0001</smpdb-id>
+            <drugs>
+                <drug><drugbank-id>DB0002</drugbank-id></drug>
+            </drugs>
+        </pathway>
+    </pathways>
+    <drug-interactions>
+        <drug-interaction>
+            <drugbank-id>DB0002</drugbank-id>
+            <description>Decreases effect.</description>
+        </drug-interaction>
+    </drug-interactions>
+</drug>
+<drug type="biotech">
+    <drugbank-id primary="true">DB0003</drugbank-id>
+    <name>DrugThree</name>
+</drug>
+</drugbank>"""
+
+
+@pytest.fixture
+def releases(tmp_path):
+    old_path = tmp_path / "old.xml"
+    new_path = tmp_path / "new.xml"
+    old_path.write_bytes(OLD_XML.encode("utf-8"))
+    new_path.write_bytes(NEW_XML.encode("utf-8"))
+    return str(old_path), str(new_path)
+
+
+def test_iter_drug_elements_skips_nested_drugs(releases):
+    """Test if streaming yields only top-level drugs, in document order."""
+    ids = [
+        drug.findtext("db:drugbank-id[@primary='true']", namespaces=ns)
+        for drug, ns in DataLoader(releases[0]).iter_drug_elements()
+    ]
+    assert ids == ["DB0001", "DB0002"]
+
+
+def test_fingerprint_release_keys_sub_entities(releases):
+    """Test if sub-entities are keyed by NDC code, target ID, SMPDB ID and partner ID."""
+    release = fingerprint_release(releases[0])
+    _, entities = release["DB0001"]
+
+    assert set(release) == {"DB0001", "DB0002"}
+    assert set(entities["product"]) == {"111", "222"}
+    assert set(entities["target"]) == {"BE0001"}
+    assert set(entities["pathway"]) == {"SMP0001"}
+    assert set(entities["interaction"]) == {"DB0002"}
+
+
+def test_diff_identical_releases_is_empty(releases):
+    """Test if comparing a release with itself reports no changes."""
+    assert diff_releases(releases[0], releases[0]).empty
+
+
+def test_diff_releases(releases):
+    """Test if added, removed and changed entities are reported per drug."""
+    df = diff_releases(*releases)
+    changes = set(df.itertuples(index=False, name=None))
+
+    assert changes == {
+        ("product", "DB0001", "111", "changed"),
+        ("product", "DB0001", "222", "removed"),
+        ("product", "DB0001", "Prod3|Lab3|||||", "added"),
+        ("interaction", "DB0001", "DB0002", "changed"),
+        ("drug", "DB0002", "DB0002", "removed"),
+        ("target", "DB0002", "BE0002", "removed"),
+        ("drug", "DB0003", "DB0003", "added"),
+    }
+    assert list(df.columns) == ["Entity", "DrugBank ID", "Key", "Change"]
+
+
+def test_main_creates_output_directory(releases, tmp_path, monkeypatch):
+    """Test if the command line writes its output into a missing directory."""
+    output = tmp_path / "results" / "release_diff.jsonl"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["release_diff", "--old", releases[0], "--new", releases[1]]
+        + ["--output", str(output)],
+    )
+    main()
+    assert len(output.read_text().splitlines()) == 7
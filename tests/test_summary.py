@@ -0,0 +1,119 @@
+import os
+import pytest
+import pandas as pd
+from analysis.counts import show_nr_of_approved_not_withdrawn_drugs
+from data_processing.data_frames import UniversalDataFrame
+from data_processing.data_loader import DataLoader
+from data_processing.drug_filter import DrugFilter
+from data_processing.summary import CorpusSummary, summary_path
+
+
+@pytest.fixture
+def drugs():
+    return [
+        dict(
+            type=type,
+            groups=groups,
+            products=products,
+            targets=targets,
+            interactions=interactions,
+            pathways=pathways,
+        )
+        # (type, groups, products, targets with a polypeptide, interactions, pathways)
+        for type, groups, products, targets, interactions, pathways in [
+            ("small molecule", ["approved"], 2, 1, 3, 1),
+            ("small molecule", ["approved", "withdrawn"], 0, 2, 0, 0),
+            ("biotech", [], 1, 0, 1, 2),
+            ("biotech", ["approved", "investigational"], 3, 1, 2, 0),
+        ]
+    ]
+
+
+def test_summary_counts(xml_file):
+    """Test if a single pass counts every headline number."""
+    summary = CorpusSummary.from_xml(xml_file)
+    assert summary.nr_of_drugs == 4
+    assert summary.drugs_per_type == {"small molecule": 2, "biotech": 2}
+    assert summary.groups == {
+        "approved": 3,
+        "withdrawn": 1,
+        "investigational": 1,
+        "None": 1,
+    }
+    assert summary.approved_not_withdrawn == 2
+    assert summary.nr_of_pathways == 3
+    assert summary.nr_of_products == 6
+    assert summary.nr_of_targets == 4
+    assert summary.nr_of_interactions == 6
+
+
+def test_summary_matches_entities(xml_file):
+    """Test if the streamed summary equals the one built from parsed objects."""
+    udf = UniversalDataFrame(xml_file)
+    from_entities = CorpusSummary.from_entities(udf.drugs, udf.pathways, udf.targets)
+    assert from_entities.to_dict() == CorpusSummary.from_xml(xml_file).to_dict()
+
+
+def test_groups_frame_matches_explode(xml_file):
+    """Test if the groups DataFrame equals counting the exploded Groups column."""
+    udf = UniversalDataFrame(xml_file)
+    drug_dicts = [drug.to_dict() for drug in udf.drugs]
+    expected = pd.DataFrame(drug_dicts).explode("Groups").groupby("Groups").size()
+    df = udf.create_groups_data_frame()
+    assert dict(zip(df["Groups"], df["Count"])) == expected.to_dict()
+    assert udf.create_summary().groups == udf.create_group_masks().counts()
+    assert os.path.exists(summary_path(xml_file))
+
+
+def test_summary_is_streamed_once(xml_file, monkeypatch):
+    """Test if the data frame summary streams the file once without parsing objects."""
+    passes = []
+    iter_drug_elements = DataLoader.iter_drug_elements
+
+    def counting_iter_drug_elements(self):
+        passes.append(self.drug_filter)
+        return iter_drug_elements(self)
+
+    def no_parse(self, *args, **kwargs):
+        raise AssertionError("Entities should not be parsed for the summary.")
+
+    monkeypatch.setattr(DataLoader, "iter_drug_elements", counting_iter_drug_elements)
+    for method in ("parse_drugs", "parse_targets", "parse_pathways"):
+        monkeypatch.setattr(DataLoader, method, no_parse)
+
+    assert UniversalDataFrame(xml_file).create_summary().nr_of_drugs == 4
+    drug_filter = DrugFilter(types=["biotech"])
+    summary = UniversalDataFrame(xml_file, drug_filter).create_summary()
+    assert summary.drugs_per_type == {"biotech": 2}
+    assert passes == [None, drug_filter]
+
+
+def test_summary_cache(xml_file):
+    """Test if the saved summary is reused and rebuilt after the file changes."""
+    summary = CorpusSummary.load_or_build(xml_file)
+    path = summary_path(xml_file)
+    assert os.path.exists(path)
+    assert CorpusSummary.load(path, xml_file).to_dict() == summary.to_dict()
+
+    with open(xml_file, "a") as file:
+        file.write("\n")
+    assert CorpusSummary.load(path, xml_file) is None
+
+
+def test_summary_not_cached_when_saving_fails(xml_file, monkeypatch):
+    """Test if the summary is still built when its file cannot be written."""
+
+    def read_only_save(self, path, source_file=None):
+        raise PermissionError(f"Permission denied: {path}")
+
+    monkeypatch.setattr(CorpusSummary, "save", read_only_save)
+    expected = CorpusSummary.from_xml(xml_file).to_dict()
+    assert CorpusSummary.load_or_build(xml_file).to_dict() == expected
+    assert UniversalDataFrame(xml_file).create_summary().to_dict() == expected
+    assert not os.path.exists(summary_path(xml_file))
+
+
+def test_counts_read_summary(xml_file, capsys):
+    """Test if the counts module prints the summary's numbers."""
+    show_nr_of_approved_not_withdrawn_drugs(CorpusSummary.from_xml(xml_file))
+    assert "2" in capsys.readouterr().out
@@ -0,0 +1,64 @@
+import pytest
+from src.targets import Polypeptide, Target
+from analysis.target_similarity import TargetSimilarity
+
+
+def make_target(drug_id, polypeptide_id, gene_name):
+    polypeptide = Polypeptide(
+        id=polypeptide_id,
+        source="Swiss-Prot",
+        name=f"Protein {polypeptide_id}",
+        gene_name=gene_name,
+        genatlas_id=None,
+        chromosome_location="1",
+        cellular_location="Membrane",
+        mollecular_weight="1000",
+    )
+    return Target(f"T-{drug_id}-{polypeptide_id}", "Target", polypeptide, drug_id)
+
+
+@pytest.fixture
+def similarity():
+    targets = [
+        make_target("DB1", "P1", "GENE1"),
+        make_target("DB1", "P2", "GENE2"),
+        make_target("DB2", "P1", "GENE1"),
+        make_target("DB2", "P2", "GENE2"),
+        make_target("DB3", "P2", "GENE2"),
+        make_target("DB3", "P3", "GENE2"),
+        make_target("DB4", "P4", "GENE4"),
+    ]
+    return TargetSimilarity(targets)
+
+
+def test_shared_target_drugs(similarity):
+    """Test if drugs sharing targets are ranked by Jaccard similarity."""
+    df = similarity.shared_target_drugs("DB1")
+    assert df["DrugBank ID"].tolist() == ["DB2", "DB3"]
+    assert df["Shared targets"].tolist() == [2, 1]
+    assert df["Jaccard"].tolist() == pytest.approx([1.0, 1 / 3])
+    assert similarity.shared_target_drugs("DB1", k=1)["DrugBank ID"].tolist() == ["DB2"]
+    assert similarity.shared_target_drugs("DB4").empty
+    assert similarity.shared_target_drugs("DB1", k=0).empty
+
+
+def test_target_cooccurrence(similarity):
+    """Test if each pair of co-targeted polypeptides is counted once."""
+    df = similarity.target_cooccurrence()
+    pairs = {
+        (a, b): n
+        for a, b, n in zip(
+            df["Polypeptide ID A"], df["Polypeptide ID B"], df["Nr_of_drugs"]
+        )
+    }
+    assert pairs == {("P1", "P2"): 2, ("P2", "P3"): 1}
+
+
+def test_drugs_per_gene(similarity):
+    """Test if a drug targeting two polypeptides of one gene is counted once."""
+    df = similarity.drugs_per_gene()
+    assert dict(zip(df["Gene name"], df["Nr_of_drugs"])) == {
+        "GENE2": 3,
+        "GENE1": 2,
+        "GENE4": 1,
+    }
@@ -0,0 +1,60 @@
+import pytest
+from src.drugs import Drug
+from data_processing.text_index import TextSearchIndex, tokenize
+
+
+def make_drug(drug_id, description, indication="", mechanism="", food=None):
+    return Drug(
+        name=f"Name {drug_id}",
+        drug_id=drug_id,
+        drug_type="small molecule",
+        description=description,
+        state="solid",
+        indication=indication,
+        mechanism_of_action=mechanism,
+        drug_interactions=[],
+        food_interactions=food,
+    )
+
+
+@pytest.fixture
+def index():
+    drugs = [
+        make_drug("DB0001", "Inhibits thrombin.", "Lowers blood pressure."),
+        make_drug("DB0002", "Blood thinner.", "Pressure ulcers.", "Binds thrombin"),
+        make_drug("DB0003", "Kinase inhibitor.", food=["Avoid grapefruit juice."]),
+    ]
+    return TextSearchIndex.build(drugs)
+
+
+def test_tokenize():
+    """Test if text is split into lower-case alphanumeric tokens."""
+    assert tokenize("Anti-TNF, 5 mg.") == ["anti", "tnf", "5", "mg"]
+    assert tokenize(None) == []
+
+
+def test_search_ranks_keywords(index):
+    """Test if keyword search returns only matching drugs, best first."""
+    result = index.search("thrombin inhibits")
+    assert result["DrugBank ID"].tolist() == ["DB0001", "DB0002"]
+    assert list(result.columns) == ["DrugBank ID", "Name", "Score"]
+
+
+def test_search_phrase(index):
+    """Test if quoted phrases must appear as consecutive words within one field."""
+    assert index.search('"blood pressure"')["DrugBank ID"].tolist() == ["DB0001"]
+    # "thinner" and "pressure" are in different fields of DB0002
+    assert index.search('"thinner pressure"').empty
+
+
+def test_search_food_interactions(index):
+    """Test if food interactions are searchable."""
+    assert index.search("grapefruit")["DrugBank ID"].tolist() == ["DB0003"]
+
+
+def test_save_and_load(index, tmp_path):
+    """Test if a saved index gives the same results after loading."""
+    path = str(tmp_path / "text_index.json.gz")
+    index.save(path)
+    loaded = TextSearchIndex.load(path)
+    assert loaded.search("thrombin").equals(index.search("thrombin"))
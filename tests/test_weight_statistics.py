@@ -0,0 +1,164 @@
+import warnings
+import numpy as np
+import pytest
+from scipy.stats import f_oneway
+from analysis.molecular_analysis import compute_average_weights, get_weights
+from analysis.weight_statistics import WeightStatistics
+from data_processing.data_loader import DataLoader
+from src.targets import Polypeptide, Target
+
+MOCK_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<drugbank xmlns="http://www.drugbank.ca">
+<drug type="small molecule">
+    <drugbank-id primary="true">DB0001</drugbank-id>
+    <targets>
+        <target>
+            <id>BE0001</id>
+            <name>Target1</name>
+            <polypeptide id="P1" source="Swiss-Prot">
+                <name>Poly1</name>
+                <gene-name>GENE1</gene-name>
+                <chromosome-location>1</chromosome-location>
+                <cellular-location>Membrane</cellular-location>
+                <molecular-weight>1000.5</molecular-weight>
+            </polypeptide>
+        </target>
+        <target>
+            <id>BE0002</id>
+            <name>Target2</name>
+            <polypeptide id="P2" source="Swiss-Prot">
+                <name>Poly2</name>
+                <gene-name>GENE2</gene-name>
+                <chromosome-location>2</chromosome-location>
+                <cellular-location>Membrane</cellular-location>
+                <molecular-weight>2000.5</molecular-weight>
+            </polypeptide>
+        </target>
+    </targets>
+</drug>
+</drugbank>"""
+
+
+def make_target(location: str, weight) -> Target:
+    polypeptide = Polypeptide(
+        "P", "Swiss-Prot", "Poly", "GENE", None, "1", location, weight
+    )
+    return Target("BE", "Target", polypeptide, drug_id="DB0001")
+
+
+@pytest.fixture
+def weights():
+    rng = np.random.default_rng(0)
+    return {
+        "Membrane": rng.normal(50000, 8000, 500),
+        "Cytoplasm": rng.normal(52000, 9000, 300),
+        "Nucleus": rng.normal(47000, 5000, 200),
+    }
+
+
+@pytest.fixture
+def statistics(weights):
+    statistics = WeightStatistics(reservoir_size=100)
+    for location, values in weights.items():
+        for value in values:
+            statistics.add(location, value)
+    return statistics
+
+
+def test_running_moments(statistics, weights):
+    """Test if Welford means and standard deviations equal the numpy ones."""
+    df = statistics.to_frame().set_index("Cellular Location")
+    for location, values in weights.items():
+        assert df.loc[location, "Average Molecular Weight"] == pytest.approx(
+            values.mean()
+        )
+        assert df.loc[location, "Standard Deviation"] == pytest.approx(values.std())
+
+
+def test_reservoir_sample(statistics, weights):
+    """Test if each location keeps at most reservoir_size of its own weights."""
+    sample = statistics.sample_frame()
+    for location, values in weights.items():
+        sampled = sample.loc[
+            sample["Cellular Location"] == location, "Molecular Weight"
+        ]
+        assert len(sampled) == 100
+        assert set(sampled) <= set(values)
+
+
+def test_anova_matches_scipy(statistics, weights):
+    """Test if the ANOVA from running moments equals scipy's on all weights."""
+    statistic, p_value = statistics.anova()
+    expected = f_oneway(*weights.values())
+    assert statistic == pytest.approx(expected.statistic)
+    assert p_value == pytest.approx(expected.pvalue)
+
+
+@pytest.mark.parametrize(
+    "weights",
+    [
+        # No variance within locations.
+        {"Membrane": [100.0, 100.0], "Nucleus": [200.0, 200.0]},
+        # No variance at all.
+        {"Membrane": [100.0, 100.0], "Nucleus": [100.0, 100.0]},
+        # One weight per location.
+        {"Membrane": [100.0], "Nucleus": [200.0]},
+        {"Membrane": [100.0, 300.0], "Nucleus": [200.0]},
+    ],
+)
+def test_anova_edge_cases_match_scipy(weights):
+    """Test if degenerate groups give the same nan and inf results as scipy."""
+    statistics = WeightStatistics()
+    for location, values in weights.items():
+        for value in values:
+            statistics.add(location, value)
+
+    with warnings.catch_warnings():
+        # scipy warns about the degenerate input it is given on purpose.
+        warnings.simplefilter("ignore")
+        expected = f_oneway(*weights.values())
+    np.testing.assert_allclose(statistics.anova(), expected)
+
+
+def test_anova_single_location():
+    """Test if a single location gives nan instead of dividing by zero."""
+    statistics = WeightStatistics()
+    for value in [100.0, 200.0, 300.0]:
+        statistics.add("Membrane", value)
+    assert np.isnan(statistics.anova()).all()
+    assert np.isnan(WeightStatistics().anova()).all()
+
+
+def test_invalid_weights_are_skipped():
+    """Test if targets without a location or a numeric weight are ignored."""
+    targets = [
+        make_target("Membrane", "100"),
+        make_target(None, "200"),
+        make_target("Membrane", None),
+        make_target("Membrane", "heavy"),
+        make_target("Membrane", "300"),
+    ]
+    df = compute_average_weights(targets)
+    assert df.to_dict(orient="records") == [
+        {
+            "Cellular Location": "Membrane",
+            "Average Molecular Weight": 200.0,
+            "Standard Deviation": 100.0,
+        }
+    ]
+
+
+def test_parsed_and_streamed_targets(tmp_path):
+    """Test if parsed and streamed targets feed the same statistics."""
+    path = tmp_path / "drugbank.xml"
+    path.write_bytes(MOCK_XML.encode("utf-8"))
+    loader = DataLoader(str(path))
+
+    targets = loader.parse_targets()
+    parsed = WeightStatistics.from_targets(targets)
+    streamed = WeightStatistics.from_targets(loader.iter_targets())
+
+    assert len(targets) == 2
+    assert [t.drug_id for t in loader.iter_targets()] == ["DB0001", "DB0001"]
+    assert parsed.moments == streamed.moments == {"Membrane": [2, 1500.5, 500000.0]}
+    assert list(get_weights(streamed)["Molecular Weight"]) == [1000.5, 2000.5]
@@ -1,24 +1,120 @@
-import matplotlib.pyplot as plt
+import os
 import pandas as pd
-from analysis.molecular_analysis import compute_average_weights, get_weights
-from typing import List
-import seaborn as sns
+from analysis.molecular_analysis import (
+    compute_average_weights,
+    get_weights,
+    weight_histograms,
+)
+from analysis.pathway_counts import (
+    paginate,
+    pathway_count_distribution,
+    top_pathway_counts,
+)
+from analysis.weight_statistics import WeightStatistics
+from typing import List, Union
 from src.targets import Target
 
+# matplotlib and seaborn are imported inside the plotting functions, so that
+# importing this module does not slow down runs which only build tables.
 
-def plot_pathways_vertical_histogram(df: pd.DataFrame, path_to_save: str = None):
+# Above this many targets plot_distribution draws per-location histograms instead
+# of one point per target.
+MAX_STRIP_POINTS = 5000
+
+# Above this many drugs the pathway histograms only draw the DEFAULT_TOP_N drugs
+# with the most pathways, unless another mode is chosen.
+MAX_BARS = 200
+DEFAULT_TOP_N = 50
+DEFAULT_PAGE_SIZE = 100
+
+
+def plot_pathways_vertical_histogram(
+    df: pd.DataFrame,
+    path_to_save: str = None,
+    mode: str = "auto",
+    top_n: int = DEFAULT_TOP_N,
+    page_size: int = DEFAULT_PAGE_SIZE,
+):
     """
     Creates a vertical histogram for data from a given DataFrame.
 
     Args:
         df (pd.DataFrame): DataFrame with drug_id and its number of pathways.
         path_to_save (str, optional): Path to save the generated plot. If None, the plot is displayed.
+        mode (str, optional): "all" draws one bar per drug, "top" the top_n drugs with
+            the most pathways, "binned" the number of drugs per number of pathways and
+            "pages" one image of page_size drugs per page, saved with a _<page> suffix.
+            "auto" is "all" for up to MAX_BARS drugs and "top" above that, which is
+            reported with a message.
+        top_n (int, optional): Number of drugs drawn in "top" mode.
+        page_size (int, optional): Number of drugs on each page in "pages" mode.
+    """
+    _plot_pathways_histogram(df, path_to_save, mode, top_n, page_size, horizontal=False)
+
+
+def plot_pathways_horizontal_histogram(
+    df: pd.DataFrame,
+    path_to_save: str = None,
+    mode: str = "auto",
+    top_n: int = DEFAULT_TOP_N,
+    page_size: int = DEFAULT_PAGE_SIZE,
+):
     """
+    Creates a horizontal histogram for data from a given DataFrame.
+
+    Args:
+        df (pd.DataFrame): DataFrame with drug_id and its number of pathways.
+        path_to_save (str, optional): Path to save the generated plot. If None, the plot is displayed.
+        mode (str, optional): "all", "top", "binned", "pages" or "auto", as in
+                              plot_pathways_vertical_histogram.
+        top_n (int, optional): Number of drugs drawn in "top" mode.
+        page_size (int, optional): Number of drugs on each page in "pages" mode.
+    """
+    _plot_pathways_histogram(df, path_to_save, mode, top_n, page_size, horizontal=True)
+
 
+def _plot_pathways_histogram(
+    df: pd.DataFrame,
+    path_to_save: str,
+    mode: str,
+    top_n: int,
+    page_size: int,
+    horizontal: bool,
+):
+    """Aggregates the DataFrame for the given mode and draws it."""
+    draw = _draw_pathways_horizontal if horizontal else _draw_pathways_vertical
     if df.empty:
         raise ValueError("Given DataFrame is empty. No data to plot.")
+    if mode == "auto":
+        mode = "all" if len(df) <= MAX_BARS else "top"
+        if mode == "top":
+            print(
+                f"{len(df)} drugs exceed {MAX_BARS} bars, drawing only the {top_n} "
+                'drugs with the most pathways; use mode="all" to draw every drug.'
+            )
+
+    if mode == "all":
+        draw(df, path_to_save)
+    elif mode == "top":
+        draw(top_pathway_counts(df, top_n), path_to_save)
+    elif mode == "binned":
+        _draw_pathway_distribution(
+            pathway_count_distribution(df),
+            path_to_save,
+            horizontal=horizontal,
+        )
+    elif mode == "pages":
+        root, extension = os.path.splitext(path_to_save or "")
+        for number, page in enumerate(paginate(df, page_size), start=1):
+            draw(page, f"{root}_{number}{extension}" if path_to_save else None)
+    else:
+        raise ValueError(f"Unknown mode: {mode}.")
+
 
-    plt.figure(figsize=(18, 8))
+def _draw_pathways_vertical(df: pd.DataFrame, path_to_save: str = None):
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(18, 8))
     plt.bar(df["DrugBank_ID"], df["Nr_of_pathways"], color="pink")
     plt.xlabel("DrugBank ID", fontsize=12, fontweight="bold")
     plt.ylabel("Number of Pathways", fontsize=12, fontweight="bold")
@@ -28,23 +124,16 @@ def plot_pathways_vertical_histogram(df: pd.DataFrame, path_to_save: str = None)
     plt.tight_layout()
     if path_to_save:
         plt.savefig(path_to_save)
+        # Closed right away, so pages mode does not keep every page open.
+        plt.close(fig)
     else:
         plt.show()
 
 
-def plot_pathways_horizontal_histogram(df: pd.DataFrame, path_to_save: str = None):
-    """
-    Creates a horizontal histogram for data from a given DataFrame.
-
-    Args:
-        df (pd.DataFrame): DataFrame with drug_id and its number of pathways.
-        path_to_save (str, optional): Path to save the generated plot. If None, the plot is displayed.
-    """
-
-    if df.empty:
-        raise ValueError("Given DataFrame is empty. No data to plot.")
+def _draw_pathways_horizontal(df: pd.DataFrame, path_to_save: str = None):
+    import matplotlib.pyplot as plt
 
-    plt.figure(figsize=(8, 8))
+    fig = plt.figure(figsize=(8, 8))
     plt.barh(df["DrugBank_ID"], df["Nr_of_pathways"], color="pink")
     plt.ylabel("DrugBank ID", fontsize=12, fontweight="bold")
     plt.xlabel("Number of Pathways", fontsize=12, fontweight="bold")
@@ -54,6 +143,31 @@ def plot_pathways_horizontal_histogram(df: pd.DataFrame, path_to_save: str = Non
     plt.tight_layout()
     if path_to_save:
         plt.savefig(path_to_save)
+        # Closed right away, so pages mode does not keep every page open.
+        plt.close(fig)
+    else:
+        plt.show()
+
+
+def _draw_pathway_distribution(
+    df: pd.DataFrame, path_to_save: str = None, horizontal: bool = False
+):
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(8, 8) if horizontal else (18, 8))
+    if horizontal:
+        plt.barh(df["Nr_of_pathways"], df["Nr_of_drugs"], color="pink")
+        plt.ylabel("Number of Pathways", fontsize=12, fontweight="bold")
+        plt.xlabel("Number of Drugs", fontsize=12, fontweight="bold")
+    else:
+        plt.bar(df["Nr_of_pathways"], df["Nr_of_drugs"], color="pink")
+        plt.xlabel("Number of Pathways", fontsize=12, fontweight="bold")
+        plt.ylabel("Number of Drugs", fontsize=12, fontweight="bold")
+    plt.title("Number of Drugs by Number of Pathways", fontsize=14, fontweight="bold")
+    plt.tight_layout()
+    if path_to_save:
+        plt.savefig(path_to_save)
+        plt.close(fig)
     else:
         plt.show()
 
@@ -66,6 +180,8 @@ def create_pie_plot_targets(df: pd.DataFrame, path_to_save: str = None):
         df (pd.DataFrame): DataFrame containing target cellular locations and DrugBank IDs.
         path_to_save (str, optional): Path to save the generated plot. If None, the plot is displayed.
     """
+    import matplotlib.pyplot as plt
+
     agregated_data = (
         df.groupby("Cellular location")
         .agg(nr_of_targets=("DrugBank ID", "count"))
@@ -81,7 +197,7 @@ def create_pie_plot_targets(df: pd.DataFrame, path_to_save: str = None):
     filtered_data = agregated_data[agregated_data["Percentage"] > 3]
     filtered_labels = filtered_data["Cellular location"]
 
-    plt.figure(figsize=(14, 8))
+    fig = plt.figure(figsize=(14, 8))
     plt.pie(
         data,
         labels=[
@@ -102,6 +218,7 @@ def create_pie_plot_targets(df: pd.DataFrame, path_to_save: str = None):
     plt.tight_layout()
     if path_to_save:
         plt.savefig(path_to_save)
+        plt.close(fig)
     else:
         plt.show()
 
@@ -117,6 +234,7 @@ def create_groups_pie_plot(
         df_drugs (pd.DataFrame): DataFrame containing unique drugs.
         path_to_save (str, optional): Path to save the generated plot. If None, the plot is displayed.
     """
+    import matplotlib.pyplot as plt
 
     total_unique_drugs = len(df_drugs)
 
@@ -147,23 +265,30 @@ def create_groups_pie_plot(
     plt.tight_layout()
     if path_to_save:
         plt.savefig(path_to_save)
+        plt.close(fig)
     else:
         plt.show()
 
 
-def plot_average_weights(targets: List[Target], path_to_save: str = None):
+def plot_average_weights(
+    targets: Union[List[Target], WeightStatistics], path_to_save: str = None
+):
     """
     Creates a bar chart showing the average molecular weight for each cellular location.
 
     Args:
-        targets (List[Target]): List of target objects.
+        targets (Union[List[Target], WeightStatistics]): List of target objects, or
+                                                         statistics collected while parsing them.
         path_to_save (str, optional): Path to save the generated plot. If None, the plot is displayed.
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     df = compute_average_weights(targets).sort_values(
         by="Average Molecular Weight", ascending=False
     )
 
-    plt.figure(figsize=(12, 6))
+    fig = plt.figure(figsize=(12, 6))
     sns.barplot(
         x="Cellular Location", y="Average Molecular Weight", data=df, color="pink"
     )
@@ -177,27 +302,91 @@ def plot_average_weights(targets: List[Target], path_to_save: str = None):
     plt.tight_layout()
     if path_to_save:
         plt.savefig(path_to_save)
+        plt.close(fig)
     else:
         plt.show()
 
 
-def plot_distribution(targets: List[Target], path_to_save: str):
+def plot_distribution(
+    targets: Union[List[Target], WeightStatistics],
+    path_to_save: str,
+    max_points: int = MAX_STRIP_POINTS,
+    style: str = "violin",
+):
+    """
+    Plots the molecular weight distribution for each cellular location. Up to
+    max_points targets are drawn as a strip plot; above that the weights are
+    binned per location and drawn as violins or a heatmap, so the drawing time
+    does not depend on the number of targets.
+
+    Args:
+        targets (Union[List[Target], WeightStatistics]): List of target objects, or
+            statistics collected while parsing them, whose weight samples are drawn.
+        path_to_save (str): Path to save the generated plot. If None, the plot is displayed.
+        max_points (int, optional): Largest number of targets drawn as points.
+        style (str, optional): "violin" or "heatmap", used above max_points.
+    """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    if style not in ("violin", "heatmap"):
+        raise ValueError(f"Unknown style: {style}.")
+
     df = get_weights(targets)
 
-    plt.figure(figsize=(12, 6))
-    sns.stripplot(
-        x="Cellular Location",
-        y="Molecular Weight",
-        data=df,
-        jitter=True,
-        alpha=0.7,
-        color="darkblue",
-    )
+    fig = plt.figure(figsize=(12, 6))
+    if len(df) <= max_points:
+        sns.stripplot(
+            x="Cellular Location",
+            y="Molecular Weight",
+            data=df,
+            jitter=True,
+            alpha=0.7,
+            color="darkblue",
+        )
+    else:
+        _draw_weight_histograms(plt.gca(), df, style)
     plt.xticks(rotation=45, ha="right", fontsize=8)
     plt.yticks(fontsize=8)
     plt.title("Molecular Weight Distribution")
     plt.tight_layout()
     if path_to_save:
         plt.savefig(path_to_save)
+        plt.close(fig)
     else:
         plt.show()
+
+
+def _draw_weight_histograms(ax, df: pd.DataFrame, style: str):
+    """Draws precomputed per-location weight histograms as violins or a heatmap."""
+    import numpy as np
+
+    locations, edges, counts = weight_histograms(df)
+    positions = np.arange(len(locations))
+    centres = (edges[:-1] + edges[1:]) / 2
+    # Each location is scaled to its own maximum, like seaborn's violins.
+    density = counts / np.maximum(counts.max(axis=1, keepdims=True), 1)
+
+    if style == "violin":
+        for position, widths in zip(positions, density * 0.4):
+            ax.fill_betweenx(
+                centres,
+                position - widths,
+                position + widths,
+                color="darkblue",
+                alpha=0.7,
+                linewidth=0,
+            )
+    else:
+        mesh = ax.pcolormesh(
+            np.append(positions, len(locations)) - 0.5,
+            edges,
+            density.T,
+            cmap="Blues",
+        )
+        ax.figure.colorbar(mesh, ax=ax, label="Share of location maximum")
+
+    ax.set_xticks(positions, locations)
+    ax.set_xlim(-0.5, len(locations) - 0.5)
+    ax.set_xlabel("Cellular Location")
+    ax.set_ylabel("Molecular Weight")
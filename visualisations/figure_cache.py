@@ -0,0 +1,204 @@
+import ast
+import hashlib
+import inspect
+import json
+import os
+import shutil
+from typing import Callable, List
+import pandas as pd
+
+# Modules under this directory count as dependencies of the plotting functions.
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class InputFile(os.PathLike):
+    """
+    Path of a file read by a plotting function, e.g. the XML read by
+    gene_graph.create_plot. Its size and modification time are part of the cache
+    key, while plain strings are hashed as they are.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Path to the file.
+        """
+        self.path = path
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f"InputFile({self.path!r})"
+
+
+class FigureCache:
+    """
+    Cache of saved plots keyed by a hash of the plotting function's module source,
+    its arguments and its input data. A plot whose inputs did not change is copied
+    from the cache instead of being drawn again.
+    """
+
+    def __init__(self, cache_dir: str = os.path.join("results", ".figure_cache")):
+        """
+        Args:
+            cache_dir (str, optional): Directory where cached images are kept.
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, function: Callable, *args, path_to_save: str = None, **kwargs):
+        """
+        Saves the plot drawn by function(*args, path_to_save, **kwargs) to
+        path_to_save, copying it from the cache if it was drawn before from the same
+        inputs. Plots without a path are drawn and displayed as usual, and so are
+        plots which do not write path_to_save, e.g. in pages mode.
+
+        Args:
+            function (Callable): Plotting function taking path_to_save as a keyword.
+            *args: Positional arguments of the function, e.g. a DataFrame.
+            path_to_save (str, optional): Path of the image to save.
+            **kwargs: Other keyword arguments of the function.
+
+        Returns:
+            bool: True if the image came from the cache.
+        """
+        if not path_to_save:
+            function(*args, path_to_save=path_to_save, **kwargs)
+            return False
+
+        extension = os.path.splitext(path_to_save)[1]
+        cached = os.path.join(
+            self.cache_dir, figure_key(function, args, kwargs) + extension
+        )
+        if os.path.exists(cached):
+            shutil.copyfile(cached, path_to_save)
+            self.hits += 1
+            return True
+
+        written_before = _modified_time(path_to_save)
+        function(*args, path_to_save=path_to_save, **kwargs)
+        self.misses += 1
+        if _modified_time(path_to_save) in (None, written_before):
+            # Not written by this call, e.g. a leftover of an earlier run in pages mode.
+            return False
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Copied under a temporary name first, so an interrupted run never leaves
+        # a partial image under a valid key.
+        shutil.copyfile(path_to_save, cached + ".tmp")
+        os.replace(cached + ".tmp", cached)
+        return False
+
+    def report(self) -> str:
+        """Returns the number of cache hits and misses as a message."""
+        return f"Figure cache: {self.hits} hits, {self.misses} misses."
+
+
+def figure_key(function: Callable, args: tuple, kwargs: dict) -> str:
+    """
+    Hashes a plotting function and its inputs.
+
+    Args:
+        function (Callable): Plotting function. The source of its whole module and
+                             of every project module it imports, directly or not,
+                             is hashed, so changes to helper functions also count.
+        args (tuple): Positional arguments.
+        kwargs (dict): Keyword arguments, without path_to_save.
+
+    Returns:
+        str: Hexadecimal key.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{function.__module__}.{function.__qualname__}".encode())
+    for path in project_dependencies(function.__module__):
+        with open(path, "rb") as file:
+            digest.update(file.read())
+    canonical = [_canonical(value) for value in args], _canonical(kwargs)
+    digest.update(json.dumps(canonical, sort_keys=True, default=repr).encode())
+    return digest.hexdigest()
+
+
+def project_dependencies(module_name: str) -> List[str]:
+    """
+    Finds the source files of a module and of the project modules it imports,
+    including imports inside functions, e.g. the helpers of a plotting function.
+
+    Args:
+        module_name (str): Name of the module, e.g. "visualisations.charts".
+
+    Returns:
+        List[str]: Sorted paths of the source files under PROJECT_ROOT.
+    """
+    found = set()
+    pending = [module_name]
+    while pending:
+        path = _project_source(pending.pop())
+        if path is None or path in found:
+            continue
+        found.add(path)
+        with open(path, "rb") as file:
+            tree = ast.parse(file.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                pending.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                pending.append(node.module)
+                # Names imported from a package may be modules themselves.
+                pending.extend(f"{node.module}.{alias.name}" for alias in node.names)
+    return sorted(found)
+
+
+def _project_source(module_name: str) -> str:
+    """
+    Returns the source file of a project module, or None for other modules. The
+    path is derived from the name, so other packages are not imported.
+    """
+    base = os.path.join(PROJECT_ROOT, *module_name.split("."))
+    for path in (base + ".py", os.path.join(base, "__init__.py")):
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _modified_time(path: str) -> int:
+    """Returns the modification time of a file in nanoseconds, or None if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _canonical(value):
+    """Converts plotting inputs into JSON-serialisable values with a stable order."""
+    if isinstance(value, pd.DataFrame):
+        return ["DataFrame", _frame_digest(value)]
+    if isinstance(value, pd.Series):
+        return ["Series", _frame_digest(value.to_frame())]
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        # Sets, e.g. Drug.products, have no stable order between runs.
+        items = [_canonical(item) for item in value]
+        return sorted(items, key=lambda item: json.dumps(item, sort_keys=True))
+    if isinstance(value, InputFile):
+        stat = os.stat(value)
+        return ["File", os.path.abspath(value), stat.st_size, stat.st_mtime]
+    if hasattr(value, "__dict__"):
+        return [type(value).__name__, _canonical(vars(value))]
+    return value
+
+
+def _frame_digest(df: pd.DataFrame) -> str:
+    """Hashes the values, index, column names and types of a DataFrame."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(df.columns)).encode())
+    digest.update(repr(list(df.dtypes.astype(str))).encode())
+    try:
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    except TypeError:
+        # Cells holding lists cannot be hashed by pandas.
+        digest.update(df.to_json(orient="split").encode())
+    return digest.hexdigest()
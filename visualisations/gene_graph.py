@@ -1,7 +1,9 @@
 import xml.etree.ElementTree as ET
-import networkx as nx
-import matplotlib.pyplot as plt
 import textwrap
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from visualisations.layouts import LayoutCache
 
 
 def wrap_text(text: str, width: int) -> str:
@@ -18,7 +20,11 @@ def wrap_text(text: str, width: int) -> str:
     return "\n".join(textwrap.wrap(text, width))
 
 
-def create_plot(xml, path_to_save, gene_id):
+def create_plot(xml, path_to_save, gene_id, layout_cache: "LayoutCache" = None):
+    import matplotlib.pyplot as plt
+    import networkx as nx
+    from visualisations.layouts import compute_layout, layered_tree_layout
+
     tree = ET.parse(xml)
     root = tree.getroot()
 
@@ -58,8 +64,9 @@ def create_plot(xml, path_to_save, gene_id):
     edge_colors = nx.get_edge_attributes(graph, "color").values()
     labels = nx.get_node_attributes(graph, "label")
 
-    plt.figure(figsize=(10, 8))
-    pos = nx.spring_layout(graph)
+    fig = plt.figure(figsize=(10, 8))
+    # The graph is a tree (gene -> drugs -> products), so it is laid out in layers.
+    pos = compute_layout(graph, layered_tree_layout, gene_id, cache=layout_cache)
     nx.draw(
         graph,
         pos,
@@ -72,5 +79,6 @@ def create_plot(xml, path_to_save, gene_id):
     )
     if path_to_save:
         plt.savefig(path_to_save)
+        plt.close(fig)
     else:
         plt.show()
@@ -1,10 +1,9 @@
-import networkx as nx
-import matplotlib.pyplot as plt
 import pandas as pd
 import textwrap
 from src.drugs import Drug
 from typing import List
 from src.targets import Target, Polypeptide
+from visualisations.layouts import LayoutCache, compute_layout, radial_star_layout
 
 
 def wrap_text(text: str, width: int) -> str:
@@ -22,7 +21,10 @@ def wrap_text(text: str, width: int) -> str:
 
 
 def generate_draw_synonyms_graph(
-    drug_id: str, drugs: List[Drug], path_to_save: str = None
+    drug_id: str,
+    drugs: List[Drug],
+    path_to_save: str = None,
+    layout_cache: LayoutCache = None,
 ):
     """
     Generate and draw a star graph of synonyms for a given DrugBank ID.
@@ -31,7 +33,10 @@ def generate_draw_synonyms_graph(
         drug_id (str): The DrugBank ID of a given drug.
         drugs (List[Drug]): List of Drug objects with drug data.
         path_to_save (str, optional): Path to save the generated plot. If None, the plot is displayed.
+        layout_cache (LayoutCache, optional): Cache of node positions.
     """
+    import matplotlib.pyplot as plt
+    import networkx as nx
 
     drug = None
     for d in drugs:
@@ -52,9 +57,9 @@ def generate_draw_synonyms_graph(
         G.add_node(synonym, label=wrap_text(synonym, 11))
         G.add_edge(drug_id, synonym)
 
-    plt.figure(figsize=(10, 8))
+    fig = plt.figure(figsize=(10, 8))
 
-    position = nx.spring_layout(G, seed=0)
+    position = compute_layout(G, radial_star_layout, drug_id, cache=layout_cache)
     nx.draw_networkx_nodes(G, position, node_size=5000, node_color="lightblue")
     nx.draw_networkx_edges(G, position)
 
@@ -71,6 +76,7 @@ def generate_draw_synonyms_graph(
 
     if path_to_save:
         plt.savefig(path_to_save)
+        plt.close(fig)
     else:
         plt.show()
 
@@ -83,6 +89,8 @@ def create_pathways_bipartite_graph(df: pd.DataFrame, path_to_save: str = None):
         df (pd.DataFrame): DataFrame containing pathway IDs and associated drugs.
         path_to_save (str, optional): Path to save the generated plot. If None, the plot is displayed.
     """
+    import matplotlib.pyplot as plt
+    import networkx as nx
 
     B = nx.Graph()
 
@@ -101,7 +109,7 @@ def create_pathways_bipartite_graph(df: pd.DataFrame, path_to_save: str = None):
     for node in B.nodes:
         labels[node] = wrap_text(node, 13)
 
-    plt.figure(figsize=(14, 8))
+    fig = plt.figure(figsize=(14, 8))
     node_colors = [B.nodes[node]["color"] for node in B.nodes]
 
     nx.draw_networkx(
@@ -141,5 +149,6 @@ def create_pathways_bipartite_graph(df: pd.DataFrame, path_to_save: str = None):
     plt.tight_layout()
     if path_to_save:
         plt.savefig(path_to_save)
+        plt.close(fig)
     else:
         plt.show()
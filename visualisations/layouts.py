@@ -0,0 +1,185 @@
+import hashlib
+import inspect
+import json
+import os
+from collections import deque
+from typing import Callable
+import numpy as np
+
+
+def radial_star_layout(graph, center, radius: float = 1.0) -> dict:
+    """
+    Places the center node at the origin and all other nodes evenly on a circle
+    around it, in insertion order.
+
+    Args:
+        graph (nx.Graph): Star graph.
+        center: The center node.
+        radius (float, optional): Radius of the circle.
+
+    Returns:
+        dict: Node mapped to its (x, y) position.
+    """
+    leaves = [node for node in graph.nodes if node != center]
+    angles = 2 * np.pi * np.arange(len(leaves)) / max(len(leaves), 1) + np.pi / 2
+    points = radius * np.column_stack([np.cos(angles), np.sin(angles)])
+
+    positions = {center: np.zeros(2)}
+    positions.update(zip(leaves, points))
+    return positions
+
+
+def layered_tree_layout(graph, root) -> dict:
+    """
+    Places the nodes of a tree in horizontal layers by their distance from the
+    root, with every parent centred above its children. Nodes reachable in more
+    than one way are placed under the first parent found by breadth-first search
+    and unreachable nodes get an extra bottom layer.
+
+    Args:
+        graph (nx.Graph): Tree, e.g. gene -> drugs -> products.
+        root: The root node.
+
+    Returns:
+        dict: Node mapped to its (x, y) position, with x and y in [-1, 1].
+    """
+    children = {root: []}
+    depth = {root: 0}
+    order = [root]
+    queue = deque([root])
+    while queue:
+        parent = queue.popleft()
+        for child in graph.neighbors(parent):
+            if child not in depth:
+                depth[child] = depth[parent] + 1
+                children[parent].append(child)
+                children[child] = []
+                order.append(child)
+                queue.append(child)
+
+    # Subtree widths in leaves, from the deepest nodes up.
+    width = {}
+    for node in reversed(order):
+        width[node] = max(1, sum(width[child] for child in children[node]))
+
+    left = {root: 0.0}
+    x = {}
+    for node in order:
+        start = left[node]
+        x[node] = start + width[node] / 2
+        for child in children[node]:
+            left[child] = start
+            start += width[child]
+
+    unreachable = [node for node in graph.nodes if node not in depth]
+    bottom = max(depth.values()) + 1
+    for position, node in enumerate(unreachable):
+        x[node] = (position + 0.5) * width[root] / len(unreachable)
+        depth[node] = bottom
+
+    max_depth = max(max(depth.values()), 1)
+    return {
+        node: np.array([2 * x[node] / width[root] - 1, 1 - 2 * depth[node] / max_depth])
+        for node in graph.nodes
+    }
+
+
+def graph_key(graph, layout_name: str) -> str:
+    """
+    Hashes the nodes and edges of a graph, in insertion order, together with the
+    layout name.
+
+    Args:
+        graph (nx.Graph): The graph.
+        layout_name (str): Name of the layout function.
+
+    Returns:
+        str: Hexadecimal key.
+    """
+    structure = [
+        layout_name,
+        graph.is_directed(),
+        [str(node) for node in graph.nodes],
+        [[str(u), str(v)] for u, v in graph.edges],
+    ]
+    return hashlib.blake2b(json.dumps(structure).encode(), digest_size=16).hexdigest()
+
+
+class LayoutCache:
+    """
+    Node positions saved to disk, keyed by graph structure and layout function,
+    so a graph is only laid out once.
+    """
+
+    def __init__(self, cache_dir: str = os.path.join("results", ".layout_cache")):
+        """
+        Args:
+            cache_dir (str, optional): Directory where layouts are kept.
+        """
+        self.cache_dir = cache_dir
+
+    def layout(self, graph, layout_function: Callable, *args, **kwargs) -> dict:
+        """
+        Returns the cached layout of the graph, or computes and saves it.
+
+        Args:
+            graph (nx.Graph): Graph to lay out.
+            layout_function (Callable): Function called as
+                                        layout_function(graph, *args, **kwargs).
+
+        Returns:
+            dict: Node mapped to its (x, y) position.
+        """
+        name = (
+            f"{layout_function.__module__}.{layout_function.__qualname__}"
+            f"{args}{sorted(kwargs.items())}{_source_digest(layout_function)}"
+        )
+        path = os.path.join(self.cache_dir, graph_key(graph, name) + ".json")
+        nodes = {str(node): node for node in graph.nodes}
+
+        try:
+            with open(path) as file:
+                saved = json.load(file)
+            return {nodes[node]: np.array(point) for node, point in saved}
+        except (OSError, ValueError, KeyError):
+            pass
+
+        positions = layout_function(graph, *args, **kwargs)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(path + ".tmp", "w") as file:
+                json.dump(
+                    [
+                        [str(node), [float(c) for c in point]]
+                        for node, point in positions.items()
+                    ],
+                    file,
+                )
+            os.replace(path + ".tmp", path)
+        except OSError:
+            # E.g. a read-only results directory; the layout is then not cached.
+            pass
+        return positions
+
+
+def _source_digest(function: Callable) -> str:
+    """
+    Hashes the source of the module defining the function, so cached layouts are
+    recomputed after it or one of its helpers changes, as in figure_cache.
+    """
+    module = inspect.getmodule(function)
+    try:
+        source = inspect.getsource(module)
+    except (OSError, TypeError):
+        # E.g. functions defined interactively; only their name is then hashed.
+        return ""
+    return hashlib.blake2b(source.encode(), digest_size=16).hexdigest()
+
+
+def compute_layout(
+    graph, layout_function: Callable, *args, cache: LayoutCache = None, **kwargs
+) -> dict:
+    """Lays out the graph, through the cache if one is given."""
+    if cache is None:
+        return layout_function(graph, *args, **kwargs)
+    return cache.layout(graph, layout_function, *args, **kwargs)